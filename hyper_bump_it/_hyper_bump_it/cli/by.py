@@ -7,7 +7,7 @@ from typing import Annotated, Optional
 
 import typer
 
-from .. import core
+from .. import core, ui
 from ..config import BumpByArgs, BumpPart, GitAction, config_for_bump_by
 from ..version import Version
 from . import common
@@ -24,6 +24,14 @@ def by_command(
     project_root: Annotated[Path, common.PROJECT_ROOT] = common.PROJECT_ROOT_DEFAULT,
     dry_run: Annotated[bool, common.DRY_RUN] = common.DRY_RUN_DEFAULT,
     patch: Annotated[bool, common.PATCH] = common.PATCH_DEFAULT,
+    highlight_diff: Annotated[
+        bool, common.HIGHLIGHT_DIFF
+    ] = common.HIGHLIGHT_DIFF_DEFAULT,
+    plain_output: Annotated[
+        Optional[bool], common.PLAIN_OUTPUT
+    ] = common.PLAIN_OUTPUT_DEFAULT,
+    use_cache: Annotated[bool, common.USE_CACHE] = common.USE_CACHE_DEFAULT,
+    jobs: Annotated[Optional[int], common.JOBS] = common.JOBS_DEFAULT,
     skip_confirm_prompt: Annotated[
         Optional[bool], common.SKIP_CONFIRM_PROMPT
     ] = common.SKIP_CONFIRM_PROMPT_DEFAULT,
@@ -64,6 +72,9 @@ def by_command(
                 project_root=common.resolve(project_root),
                 dry_run=dry_run,
                 patch=patch,
+                highlight_diff=highlight_diff,
+                use_cache=use_cache,
+                jobs=jobs,
                 skip_confirm_prompt=skip_confirm_prompt,
                 current_version=current_version,
                 commit=commit,
@@ -80,4 +91,5 @@ def by_command(
             )
         )
 
-        core.do_bump(app_config)
+        with ui.plain_output(plain_output):
+            core.do_bump(app_config)
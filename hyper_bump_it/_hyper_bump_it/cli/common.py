@@ -64,6 +64,32 @@ PATCH = typer.Option(
     show_default=False,
 )
 PATCH_DEFAULT = False
+HIGHLIGHT_DIFF = typer.Option(
+    "--highlight-diff/--no-highlight-diff",
+    help="Use syntax highlighting to display diffs, which is slower for large changes",
+    show_default=False,
+)
+HIGHLIGHT_DIFF_DEFAULT = False
+PLAIN_OUTPUT = typer.Option(
+    "--plain-output/--rich-output",
+    help="Display output as plain text without styling, which is faster for large changes",
+    show_default="Plain text when the output is not a terminal",
+)
+PLAIN_OUTPUT_DEFAULT: Optional[bool] = None
+USE_CACHE = typer.Option(
+    "--cache/--no-cache",
+    help="Use the results of previous file discovery when the project has not changed",
+    show_default=False,
+)
+USE_CACHE_DEFAULT = True
+JOBS = typer.Option(
+    "--jobs",
+    "-j",
+    help="Number of files to plan changes for at the same time",
+    show_default="Use configuration file value",
+    min=1,
+)
+JOBS_DEFAULT: Optional[int] = None
 SKIP_CONFIRM_PROMPT = typer.Option(
     "--yes/--interactive",
     "-y",
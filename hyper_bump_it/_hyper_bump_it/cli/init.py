@@ -214,15 +214,17 @@ def _config_to_dict(config: ConfigFile) -> Mapping[str, object]:
     config_dict = config.model_dump(exclude_defaults=True)
     if config.current_version is not None:
         config_dict["current_version"] = str(config.current_version)
-    _git_branch_set_to_list(config_dict, "allowed_initial_branches")
-    _git_branch_set_to_list(config_dict, "extend_allowed_initial_branches")
+    _set_to_list(config_dict, "git", "allowed_initial_branches")
+    _set_to_list(config_dict, "git", "extend_allowed_initial_branches")
+    _set_to_list(config_dict, "discovery", "exclude_patterns")
+    _set_to_list(config_dict, "discovery", "extend_exclude_patterns")
     return {ROOT_TABLE_KEY: config_dict}
 
 
-def _git_branch_set_to_list(config_dict: dict, git_key: str) -> None:  # type: ignore[type-arg]
-    git_config = config_dict.get("git")
-    if git_config is None:
+def _set_to_list(config_dict: dict, table_key: str, key: str) -> None:  # type: ignore[type-arg]
+    table_config = config_dict.get(table_key)
+    if table_config is None:
         return
-    value = git_config.get(git_key)
+    value = table_config.get(key)
     if value is not None:
-        git_config[git_key] = list(value)
+        table_config[key] = list(value)
@@ -10,12 +10,28 @@ from typing import Optional
 from rich.text import Text
 
 from ... import files, ui
-from ...config import FileDefinition
+from ...config import (
+    DEFAULT_DISCOVERY_MODE,
+    DEFAULT_DISCOVERY_WORKERS,
+    DEFAULT_EXCLUDE_PATTERNS,
+    DEFAULT_RESPECT_GITIGNORE,
+    Discovery,
+    FileDefinition,
+)
 from ...error import FormatError
 from ...format_pattern import FormatContext, TextFormatter
+from ...run_cache import RunCache
 from ...version import Version
 
 _FAKE_NEXT_VERSION = Version(1, 2, 3)
+_DEFAULT_DISCOVERY = Discovery(
+    exclude_patterns=DEFAULT_EXCLUDE_PATTERNS,
+    respect_gitignore=DEFAULT_RESPECT_GITIGNORE,
+    mode=DEFAULT_DISCOVERY_MODE,
+    workers=DEFAULT_DISCOVERY_WORKERS,
+    use_cache=False,
+    update_cache=False,
+)
 
 
 class FailureType(Enum):
@@ -39,9 +55,12 @@ class DefinitionValidator:
         self._text_formatter = TextFormatter(
             current_version=current_version, new_version=_FAKE_NEXT_VERSION
         )
+        self._run_cache = RunCache()
 
     def __call__(self, definition: FileDefinition) -> Optional[ValidationFailure]:
-        matched_files = list(self._project_root.glob(definition.file_glob))
+        matched_files = self._run_cache.find_files(
+            self._project_root, [definition.file_glob], _DEFAULT_DISCOVERY
+        )[definition.file_glob]
         if (
             result := self._validate_matched_files(
                 definition, matched_files, self._project_root
@@ -92,7 +111,7 @@ class DefinitionValidator:
             )
             return ValidationFailure(FailureType.KeystoneMultipleFiles, message)
         for file in matched_files:
-            if not files.is_contained_within(file, project_root):
+            if not files.is_contained_within(file, project_root, self._run_cache):
                 message = Text("Matched files must be within the project root. '")
                 message.append(definition.file_glob, style="file.glob")
                 message.append("' matched: '")
@@ -101,12 +120,12 @@ class DefinitionValidator:
                 return ValidationFailure(FailureType.ProjectRootTraversal, message)
         return None
 
-    @staticmethod
     def _check_file_contents(
-        search_text: str, matched_files: list[Path]
+        self, search_text: str, matched_files: list[Path]
     ) -> Optional[ValidationFailure]:
         for file in matched_files:
-            if search_text not in file.read_text():
+            file_text = self._run_cache.read_text(file, universal_newlines=True)
+            if search_text not in file_text:
                 return ValidationFailure(
                     FailureType.SearchPatternNotFound,
                     Text("The search text '")
@@ -1,8 +1,10 @@
 from .application import (
     Config,
+    Discovery,
     File,
     Git,
     GitActions,
+    Region,
     config_for_bump_by,
     config_for_bump_to,
 )
@@ -13,14 +15,23 @@ from .core import (
     DEFAULT_BRANCH_FORMAT_PATTERN,
     DEFAULT_COMMIT_ACTION,
     DEFAULT_COMMIT_FORMAT_PATTERN,
+    DEFAULT_DISCOVERY_MODE,
+    DEFAULT_DISCOVERY_WORKERS,
+    DEFAULT_EXCLUDE_PATTERNS,
+    DEFAULT_JOB_BACKEND,
+    DEFAULT_JOBS,
     DEFAULT_REMOTE,
+    DEFAULT_RESPECT_GITIGNORE,
     DEFAULT_SEARCH_PATTERN,
+    DEFAULT_STREAMING_THRESHOLD,
     DEFAULT_TAG_ACTION,
     DEFAULT_TAG_MESSAGE_FORMAT_PATTERN,
     DEFAULT_TAG_NAME_FORMAT_PATTERN,
     HYPER_CONFIG_FILE_NAME,
     PYPROJECT_FILE_NAME,
+    DiscoveryMode,
     GitAction,
+    JobBackend,
 )
 from .file import (
     PYPROJECT_SUB_TABLE_KEYS,
@@ -28,9 +39,11 @@ from .file import (
     ConfigFile,
     ConfigVersionUpdater,
 )
+from .file import Discovery as DiscoveryConfigFile
 from .file import File as FileDefinition
 from .file import Git as GitConfigFile
 from .file import GitActions as GitActionsConfigFile
+from .file import Region as RegionConfigFile
 
 __all__ = [
     "BumpByArgs",
@@ -49,6 +62,16 @@ __all__ = [
     "DEFAULT_COMMIT_FORMAT_PATTERN",
     "DEFAULT_BRANCH_FORMAT_PATTERN",
     "DEFAULT_BRANCH_ACTION",
+    "DEFAULT_DISCOVERY_MODE",
+    "DEFAULT_DISCOVERY_WORKERS",
+    "DEFAULT_STREAMING_THRESHOLD",
+    "DEFAULT_JOBS",
+    "DEFAULT_JOB_BACKEND",
+    "DEFAULT_EXCLUDE_PATTERNS",
+    "DEFAULT_RESPECT_GITIGNORE",
+    "Discovery",
+    "DiscoveryConfigFile",
+    "DiscoveryMode",
     "File",
     "FileDefinition",
     "Git",
@@ -57,9 +80,12 @@ __all__ = [
     "GitActionsConfigFile",
     "GitConfigFile",
     "HYPER_CONFIG_FILE_NAME",
+    "JobBackend",
     "PYPROJECT_FILE_NAME",
     "PYPROJECT_SUB_TABLE_KEYS",
     "ROOT_TABLE_KEY",
+    "Region",
+    "RegionConfigFile",
     "config_for_bump_by",
     "config_for_bump_to",
 ]
@@ -2,15 +2,21 @@
 Program configuration
 """
 
-from dataclasses import astuple, dataclass
+from dataclasses import astuple, dataclass, field
 from pathlib import Path
 from typing import Callable, Optional, Union, cast
 
 from ..error import KeystoneFileGlobError
+from ..run_cache import RunCache
 from ..version import Version
 from . import file, keystone_parser
 from .cli import BumpByArgs, BumpPart, BumpToArgs
-from .core import GitAction, validate_git_action_combination
+from .core import (
+    DiscoveryMode,
+    GitAction,
+    JobBackend,
+    validate_git_action_combination,
+)
 
 
 @dataclass
@@ -44,11 +50,48 @@ class Git:
     actions: GitActions
 
 
+@dataclass(frozen=True)
+class Discovery:
+    exclude_patterns: frozenset[str]
+    respect_gitignore: bool
+    mode: DiscoveryMode
+    workers: int
+    use_cache: bool
+    # store new results in the cache, `False` for runs that must not write anything
+    update_cache: bool
+
+
+@dataclass(frozen=True)
+class Region:
+    start_line: Optional[int] = None  # one based and inclusive
+    end_line: Optional[int] = None  # one based and inclusive
+    start_anchor: Optional[str] = None
+    end_anchor: Optional[str] = None
+    section: Optional[str] = None  # name of a TOML table or INI section
+
+    @property
+    def description(self) -> str:
+        if self.section is not None:
+            return f"section [{self.section}]"
+        if self.start_anchor is not None or self.end_anchor is not None:
+            start = (
+                "the start" if self.start_anchor is None else f"'{self.start_anchor}'"
+            )
+            end = "the end" if self.end_anchor is None else f"'{self.end_anchor}'"
+            return f"text between {start} and {end}"
+        end_line = "the end" if self.end_line is None else str(self.end_line)
+        return f"lines {self.start_line or 1} to {end_line}"
+
+
 @dataclass
 class File:
     file_glob: str
     search_format_pattern: str
     replace_format_pattern: str
+    text_only: bool = False  # skip matched files that appear to be binary
+    max_replacements: Optional[int] = None  # `None` replaces every occurrence
+    min_replacements: int = 1
+    region: Optional[Region] = None  # `None` searches the entire file
 
 
 @dataclass
@@ -58,10 +101,16 @@ class Config:
     project_root: Path  # absolute resolved path
     files: list[File]
     git: Git
+    discovery: Discovery
+    streaming_threshold: int
+    jobs: int  # number of files that changes are planned for at the same time
+    job_backend: JobBackend
     dry_run: bool
     patch: bool
+    highlight_diff: bool
     show_confirm_prompt: bool
     config_version_updater: Optional[file.ConfigVersionUpdater]
+    run_cache: RunCache = field(default_factory=RunCache, compare=False)
 
     @property
     def no_execute_plan(self) -> bool:
@@ -85,22 +134,42 @@ def config_for_bump_to(args: BumpToArgs) -> Config:
     :raises FormatError: Search pattern for keystone file could not be converted.
     :raises KeystoneError: Keystone configuration could not produce the current version.
     """
-    file_config, version_updater = file.read_config(args.config_file, args.project_root)
+    run_cache = RunCache()
+    file_config, version_updater = file.read_config(
+        args.config_file, args.project_root, run_cache
+    )
+
+    discovery_settings = _convert_discovery(
+        file_config.discovery,
+        args.use_cache,
+        # Previewing the changes leaves the project and its git directory untouched
+        update_cache=not (args.dry_run or args.patch),
+    )
 
     return Config(
         current_version=_current_version(
-            args.current_version, file_config, args.project_root
+            args.current_version,
+            file_config,
+            args.project_root,
+            discovery_settings,
+            run_cache,
         ),
         new_version=args.new_version,
         project_root=args.project_root,
         files=_convert_files(file_config.files),
         git=_convert_git(args, file_config.git),
+        discovery=discovery_settings,
+        streaming_threshold=file_config.streaming_threshold,
+        jobs=file_config.jobs if args.jobs is None else args.jobs,
+        job_backend=file_config.job_backend,
         dry_run=args.dry_run,
         patch=args.patch,
+        highlight_diff=args.highlight_diff,
         show_confirm_prompt=_show_confirm_prompt(
             file_config.show_confirm_prompt, args.skip_confirm_prompt
         ),
         config_version_updater=version_updater,
+        run_cache=run_cache,
     )
 
 
@@ -114,9 +183,22 @@ def config_for_bump_by(args: BumpByArgs) -> Config:
     :raises FormatError: Search pattern for keystone file could not be converted.
     :raises KeystoneError: Keystone configuration could not produce the current version.
     """
-    file_config, version_updater = file.read_config(args.config_file, args.project_root)
+    run_cache = RunCache()
+    file_config, version_updater = file.read_config(
+        args.config_file, args.project_root, run_cache
+    )
+    discovery_settings = _convert_discovery(
+        file_config.discovery,
+        args.use_cache,
+        # Previewing the changes leaves the project and its git directory untouched
+        update_cache=not (args.dry_run or args.patch),
+    )
     current_version = _current_version(
-        args.current_version, file_config, args.project_root
+        args.current_version,
+        file_config,
+        args.project_root,
+        discovery_settings,
+        run_cache,
     )
 
     return Config(
@@ -125,17 +207,27 @@ def config_for_bump_by(args: BumpByArgs) -> Config:
         project_root=args.project_root,
         files=_convert_files(file_config.files),
         git=_convert_git(args, file_config.git),
+        discovery=discovery_settings,
+        streaming_threshold=file_config.streaming_threshold,
+        jobs=file_config.jobs if args.jobs is None else args.jobs,
+        job_backend=file_config.job_backend,
         dry_run=args.dry_run,
         patch=args.patch,
+        highlight_diff=args.highlight_diff,
         show_confirm_prompt=_show_confirm_prompt(
             file_config.show_confirm_prompt, args.skip_confirm_prompt
         ),
         config_version_updater=version_updater,
+        run_cache=run_cache,
     )
 
 
 def _current_version(
-    args_version: Optional[Version], file_config: file.ConfigFile, project_root: Path
+    args_version: Optional[Version],
+    file_config: file.ConfigFile,
+    project_root: Path,
+    discovery_settings: Discovery,
+    run_cache: RunCache,
 ) -> Version:
     if args_version is not None:
         return args_version
@@ -148,11 +240,15 @@ def _current_version(
         tuple[str, str], file_config.keystone_config
     )
 
-    matched_files = list(project_root.glob(file_glob))
+    matched_files = run_cache.find_files(project_root, [file_glob], discovery_settings)[
+        file_glob
+    ]
     if len(matched_files) != 1:
         raise KeystoneFileGlobError(file_glob, matched_files)
 
-    return keystone_parser.find_current_version(matched_files[0], search_format_pattern)
+    return keystone_parser.find_current_version(
+        matched_files[0], search_format_pattern, run_cache
+    )
 
 
 def _convert_files(config_files: list[file.File]) -> list[File]:
@@ -161,11 +257,29 @@ def _convert_files(config_files: list[file.File]) -> list[File]:
             file_glob=f.file_glob,
             search_format_pattern=f.search_format_pattern,
             replace_format_pattern=f.replace_format_pattern or f.search_format_pattern,
+            text_only=f.text_only,
+            max_replacements=f.replacement_limit,
+            min_replacements=f.min_replacements,
+            region=None if f.region is None else Region(**f.region.model_dump()),
         )
         for f in config_files
     ]
 
 
+def _convert_discovery(
+    config_discovery: file.Discovery, use_cache: bool, update_cache: bool
+) -> Discovery:
+    return Discovery(
+        exclude_patterns=config_discovery.exclude_patterns
+        | config_discovery.extend_exclude_patterns,
+        respect_gitignore=config_discovery.respect_gitignore,
+        mode=config_discovery.mode,
+        workers=config_discovery.workers,
+        use_cache=use_cache,
+        update_cache=update_cache,
+    )
+
+
 def _convert_git(args: Union[BumpToArgs, BumpByArgs], git: file.Git) -> Git:
     return Git(
         remote=args.remote or git.remote,
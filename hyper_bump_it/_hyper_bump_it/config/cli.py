@@ -20,6 +20,9 @@ class BumpToArgs:
     project_root: Path  # absolute resolved path
     dry_run: bool
     patch: bool
+    highlight_diff: bool
+    use_cache: bool
+    jobs: Optional[int]
     skip_confirm_prompt: Optional[bool]
     current_version: Optional[Version]
     commit: Optional[GitAction]
@@ -40,6 +43,9 @@ class BumpByArgs:
     project_root: Path  # absolute resolved path
     dry_run: bool
     patch: bool
+    highlight_diff: bool
+    use_cache: bool
+    jobs: Optional[int]
     skip_confirm_prompt: Optional[bool]
     current_version: Optional[Version]
     commit: Optional[GitAction]
@@ -13,6 +13,16 @@ class GitAction(str, Enum):
         return self != GitAction.Skip
 
 
+class DiscoveryMode(str, Enum):
+    Walk = "walk"
+    GitIndex = "git-index"
+
+
+class JobBackend(str, Enum):
+    Thread = "thread"
+    Process = "process"
+
+
 DEFAULT_COMMIT_ACTION = GitAction.Create
 DEFAULT_BRANCH_ACTION = GitAction.Skip
 DEFAULT_TAG_ACTION = GitAction.Skip
@@ -27,6 +37,15 @@ DEFAULT_TAG_MESSAGE_FORMAT_PATTERN: str = DEFAULT_COMMIT_FORMAT_PATTERN
 DEFAULT_SEARCH_PATTERN = f"{{{keys.VERSION}}}"
 DEFAULT_ALLOWED_INITIAL_BRANCHES = frozenset({"main", "master"})
 
+# Nothing is skipped by default, so a file is matched no matter where it is in the project
+DEFAULT_EXCLUDE_PATTERNS: frozenset[str] = frozenset()
+DEFAULT_RESPECT_GITIGNORE = False
+DEFAULT_DISCOVERY_MODE = DiscoveryMode.Walk
+DEFAULT_DISCOVERY_WORKERS = 1
+DEFAULT_STREAMING_THRESHOLD = 64 * 1024 * 1024
+DEFAULT_JOBS = 1
+DEFAULT_JOB_BACKEND = JobBackend.Thread
+
 HYPER_CONFIG_FILE_NAME = "hyper-bump-it.toml"
 PYPROJECT_FILE_NAME = "pyproject.toml"
 
@@ -1,6 +1,6 @@
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Annotated, Optional, TypeAlias, Union, cast
+from typing import TYPE_CHECKING, Annotated, Optional, TypeAlias, Union, cast
 
 import tomlkit
 from pydantic import (
@@ -21,7 +21,7 @@ from ..error import (
     InvalidConfigurationError,
     SubTableNotExistError,
 )
-from ..planned_changes import PlannedChange
+from ..planned_changes import ContentProfile, PlannedChange
 from ..version import Version
 from .core import (
     DEFAULT_ALLOWED_INITIAL_BRANCHES,
@@ -29,20 +29,34 @@ from .core import (
     DEFAULT_BRANCH_FORMAT_PATTERN,
     DEFAULT_COMMIT_ACTION,
     DEFAULT_COMMIT_FORMAT_PATTERN,
+    DEFAULT_DISCOVERY_MODE,
+    DEFAULT_DISCOVERY_WORKERS,
+    DEFAULT_EXCLUDE_PATTERNS,
+    DEFAULT_JOB_BACKEND,
+    DEFAULT_JOBS,
     DEFAULT_REMOTE,
+    DEFAULT_RESPECT_GITIGNORE,
     DEFAULT_SEARCH_PATTERN,
+    DEFAULT_STREAMING_THRESHOLD,
     DEFAULT_TAG_ACTION,
     DEFAULT_TAG_MESSAGE_FORMAT_PATTERN,
     DEFAULT_TAG_NAME_FORMAT_PATTERN,
     HYPER_CONFIG_FILE_NAME,
     PYPROJECT_FILE_NAME,
+    DiscoveryMode,
     GitAction,
+    JobBackend,
     validate_git_action_combination,
 )
 
 ROOT_TABLE_KEY = "hyper-bump-it"
 PYPROJECT_SUB_TABLE_KEYS = ("tool", ROOT_TABLE_KEY)
 
+_UTF8_BOM = "\ufeff"
+
+if TYPE_CHECKING:
+    from ..run_cache import RunCache
+
 
 class HyperBaseMode(BaseModel):
     model_config = ConfigDict(
@@ -64,6 +78,36 @@ def _check_action(
 PossiblyStrGitAction = Annotated[GitAction, WrapValidator(_check_action)]
 
 
+def _check_discovery_mode(
+    value: Optional[object], handler: ValidatorFunctionWrapHandler
+) -> DiscoveryMode:
+    if isinstance(value, str):
+        for mode in DiscoveryMode:
+            if value == mode.value:
+                return mode
+        raise ValueError(f"value must be one of: {', '.join(DiscoveryMode)}")
+    return cast(DiscoveryMode, handler(value))
+
+
+PossiblyStrDiscoveryMode = Annotated[
+    DiscoveryMode, WrapValidator(_check_discovery_mode)
+]
+
+
+def _check_job_backend(
+    value: Optional[object], handler: ValidatorFunctionWrapHandler
+) -> JobBackend:
+    if isinstance(value, str):
+        for backend in JobBackend:
+            if value == backend.value:
+                return backend
+        raise ValueError(f"value must be one of: {', '.join(JobBackend)}")
+    return cast(JobBackend, handler(value))
+
+
+PossiblyStrJobBackend = Annotated[JobBackend, WrapValidator(_check_job_backend)]
+
+
 class GitActions(HyperBaseMode):
     commit: PossiblyStrGitAction = DEFAULT_COMMIT_ACTION
     branch: PossiblyStrGitAction = DEFAULT_BRANCH_ACTION
@@ -79,7 +123,7 @@ class GitActions(HyperBaseMode):
         return self
 
 
-def _check_branches(
+def _check_str_set(
     value: Optional[object], handler: ValidatorFunctionWrapHandler
 ) -> frozenset[str]:
     if isinstance(value, list):
@@ -87,7 +131,8 @@ def _check_branches(
     return cast(frozenset[str], handler(value))
 
 
-PossiblyListBranches = Annotated[frozenset[str], WrapValidator(_check_branches)]
+PossiblyListBranches = Annotated[frozenset[str], WrapValidator(_check_str_set)]
+PossiblyListPatterns = Annotated[frozenset[str], WrapValidator(_check_str_set)]
 
 
 class Git(HyperBaseMode):
@@ -101,14 +146,73 @@ class Git(HyperBaseMode):
     actions: GitActions = GitActions()
 
 
+class Discovery(HyperBaseMode):
+    exclude_patterns: PossiblyListPatterns = DEFAULT_EXCLUDE_PATTERNS
+    extend_exclude_patterns: PossiblyListPatterns = frozenset()
+    respect_gitignore: bool = DEFAULT_RESPECT_GITIGNORE
+    mode: PossiblyStrDiscoveryMode = DEFAULT_DISCOVERY_MODE
+    workers: int = Field(DEFAULT_DISCOVERY_WORKERS, ge=1)
+
+
+class Region(HyperBaseMode):
+    start_line: Optional[int] = Field(None, ge=1)
+    end_line: Optional[int] = Field(None, ge=1)
+    start_anchor: Optional[str] = Field(None, min_length=1)
+    end_anchor: Optional[str] = Field(None, min_length=1)
+    section: Optional[str] = Field(None, min_length=1)
+
+    @model_validator(mode="after")
+    def _check_single_kind(self) -> "Region":
+        kinds = [
+            self.start_line is not None or self.end_line is not None,
+            self.start_anchor is not None or self.end_anchor is not None,
+            self.section is not None,
+        ]
+        if sum(kinds) != 1:
+            raise ValueError(
+                "region must use exactly one of: line numbers, anchors, or a section"
+            )
+        if (
+            self.start_line is not None
+            and self.end_line is not None
+            and self.start_line > self.end_line
+        ):
+            raise ValueError("start_line can't be greater than end_line")
+        return self
+
+
 class File(HyperBaseMode):
     file_glob: str  # relative to project root directory
     keystone: bool = False
     search_format_pattern: str = DEFAULT_SEARCH_PATTERN
     replace_format_pattern: Optional[str] = None
+    text_only: bool = False
+    max_replacements: Optional[int] = Field(None, ge=1)
+    first_only: bool = False
+    min_replacements: int = Field(1, ge=1)
+    region: Optional[Region] = None
+
+    @model_validator(mode="after")
+    def _check_replacement_limits(self) -> "File":
+        if self.first_only and self.max_replacements not in (None, 1):
+            raise ValueError(
+                "first_only can't be used with a max_replacements other than 1"
+            )
+        maximum = self.replacement_limit
+        if maximum is not None and self.min_replacements > maximum:
+            raise ValueError(
+                "min_replacements can't be greater than the maximum number of replacements"
+            )
+        return self
+
+    @property
+    def replacement_limit(self) -> Optional[int]:
+        return 1 if self.first_only else self.max_replacements
 
 
-HyperConfigFileValues: TypeAlias = dict[str, Union[list[File], Optional[str], Git]]
+HyperConfigFileValues: TypeAlias = dict[
+    str, Union[list[File], Optional[str], Git, Discovery]
+]
 
 
 def _check_version(
@@ -126,7 +230,11 @@ class ConfigFile(HyperBaseMode):
     files: list[File] = Field(..., min_length=1)
     current_version: OptionalVersion = None
     show_confirm_prompt: bool = True
+    streaming_threshold: int = Field(DEFAULT_STREAMING_THRESHOLD, ge=1)
+    jobs: int = Field(DEFAULT_JOBS, ge=1)
+    job_backend: PossiblyStrJobBackend = DEFAULT_JOB_BACKEND
     git: Git = Git()
+    discovery: Discovery = Discovery()
 
     @model_validator(mode="after")
     def _check_keystone_files(self) -> "ConfigFile":
@@ -159,7 +267,7 @@ class ConfigVersionUpdater:
         project_root: Path,
         full_document: TOMLDocument,
         config_table: TOMLDocument,
-        newline: Optional[str],
+        bom: bool = False,
     ) -> None:
         """
         Initialize instance.
@@ -169,14 +277,17 @@ class ConfigVersionUpdater:
         :param full_document: Config document to be written to file. Possibly including other
             values beyond what is used for this program.
         :param config_table: Config document with only the values used for this program.
-        :param newline: New line character sequence for the file. `None` if no new line characters
-            are found.
+        :param bom: The file starts with a UTF-8 byte order mark that needs to be kept.
         """
         self._config_file = config_file
         self._project_root = project_root
         self._full_document = full_document
         self._config_table = config_table
-        self._newline = newline
+        self._bom = bom
+
+    @property
+    def config_file(self) -> Path:
+        return self._config_file
 
     def __call__(self, new_version: Version) -> PlannedChange:
         """
@@ -188,23 +299,27 @@ class ConfigVersionUpdater:
         old_content = self._full_document_text
         self._config_table["current_version"] = str(new_version)
         new_content = self._full_document_text
-        return PlannedChange(
+        return PlannedChange.from_text(
             self._config_file,
             self._project_root,
             old_content=old_content,
             new_content=new_content,
-            newline=self._newline,
         )
 
     @property
     def _full_document_text(self) -> str:
-        return tomlkit.dumps(self._full_document)
+        text = tomlkit.dumps(self._full_document)
+        return f"{_UTF8_BOM}{text}" if self._bom else text
 
 
 ConfigReadResult: TypeAlias = tuple[ConfigFile, Optional[ConfigVersionUpdater]]
 
 
-def read_config(config_file: Optional[Path], project_root: Path) -> ConfigReadResult:
+def read_config(
+    config_file: Optional[Path],
+    project_root: Path,
+    run_cache: Optional["RunCache"] = None,
+) -> ConfigReadResult:
     """
     Read the appropriate configuration file.
 
@@ -214,21 +329,22 @@ def read_config(config_file: Optional[Path], project_root: Path) -> ConfigReadRe
 
     :param config_file: Hyper config file to read from.
     :param project_root: Directory to look for a configuration file.
+    :param run_cache: Contents of files that have already been read.
     :return: Parsed configuration content and an object that can be used to update the version
         stored in the configuration file. If the configuration uses a keystone file, this second
         values will be `None`.
     :raises ConfigurationError: No file was found or there was some error in the file.
     """
     if config_file is not None:
-        return read_hyper_config(config_file, project_root)
+        return read_hyper_config(config_file, project_root, run_cache)
 
     hyper_config_file = project_root / HYPER_CONFIG_FILE_NAME
     if hyper_config_file.exists():
-        return read_hyper_config(hyper_config_file, project_root)
+        return read_hyper_config(hyper_config_file, project_root, run_cache)
 
     pyproject_config_file = project_root / PYPROJECT_FILE_NAME
     if pyproject_config_file.exists():
-        return read_pyproject_config(pyproject_config_file, project_root)
+        return read_pyproject_config(pyproject_config_file, project_root, run_cache)
 
     raise ConfigurationFileNotFoundError(project_root)
 
@@ -236,44 +352,54 @@ def read_config(config_file: Optional[Path], project_root: Path) -> ConfigReadRe
 def read_pyproject_config(
     pyproject_file: Path,
     project_root: Path,
+    run_cache: Optional["RunCache"] = None,
 ) -> ConfigReadResult:
     """
     Read configuration from pyproject file.
 
     :param pyproject_file: Path to the file to read.
     :param project_root: Directory to look for a configuration file.
+    :param run_cache: Contents of files that have already been read.
     :return: Parsed configuration content and an object that can be used to update the version
         stored in the configuration file. If the configuration uses a keystone file, this second
         values will be `None`.
     :raises ConfigurationError: Some error exists in the configuration file.
     """
-    return _read_config(pyproject_file, PYPROJECT_SUB_TABLE_KEYS, project_root)
+    return _read_config(
+        pyproject_file, PYPROJECT_SUB_TABLE_KEYS, project_root, run_cache
+    )
 
 
 def read_hyper_config(
     hyper_config_file: Path,
     project_root: Path,
+    run_cache: Optional["RunCache"] = None,
 ) -> ConfigReadResult:
     """
     Read configuration from pyproject file.
 
     :param hyper_config_file: Path to the decided configuration file to read.
     :param project_root: Directory to look for a configuration file.
+    :param run_cache: Contents of files that have already been read.
     :return: Parsed configuration content and an object that can be used to update the version
         stored in the configuration file. If the configuration uses a keystone file, this second
         values will be `None`.
     :raises ConfigurationError: Some error exists in the configuration file.
     """
-    return _read_config(hyper_config_file, [ROOT_TABLE_KEY], project_root)
+    return _read_config(hyper_config_file, [ROOT_TABLE_KEY], project_root, run_cache)
 
 
 def _read_config(
-    config_file: Path, sub_tables: Sequence[str], project_root: Path
+    config_file: Path,
+    sub_tables: Sequence[str],
+    project_root: Path,
+    run_cache: Optional["RunCache"],
 ) -> ConfigReadResult:
     try:
-        file_data = config_file.read_bytes()
-        full_document = tomlkit.parse(file_data.decode())
-    except (OSError, TOMLKitError) as ex:
+        profile, file_text = _read_file(config_file, run_cache)
+        # The byte order mark is not part of the TOML document
+        full_document = tomlkit.parse(file_text.removeprefix(_UTF8_BOM))
+    except (OSError, UnicodeDecodeError, TOMLKitError) as ex:
         raise ConfigurationFileReadError(config_file, ex) from ex
     config_table = full_document
     for key in sub_tables:
@@ -295,5 +421,14 @@ def _read_config(
         project_root=project_root,
         full_document=full_document,
         config_table=config_table,
-        newline=PlannedChange.detect_line_ending(file_data),
+        bom=profile.bom,
     )
+
+
+def _read_file(
+    config_file: Path, run_cache: Optional["RunCache"]
+) -> tuple[ContentProfile, str]:
+    if run_cache is None:
+        file_data = config_file.read_bytes()
+        return ContentProfile.detect(file_data), file_data.decode()
+    return run_cache.profile(config_file), run_cache.read_text(config_file)
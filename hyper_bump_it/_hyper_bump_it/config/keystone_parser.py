@@ -5,29 +5,35 @@ version from a keystone file.
 
 from pathlib import Path
 from re import Match
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ..error import IncompleteKeystoneVersionError, VersionNotFound
 from ..format_pattern import create_matching_pattern, keys
 from ..version import Version
 
+if TYPE_CHECKING:
+    from ..run_cache import RunCache
+
 
 def find_current_version(
     file: Path,
     search_pattern: str,
+    run_cache: "RunCache",
 ) -> Version:
     """
     Search a file for the version based on a given search pattern.
 
     :param file: File to read contents from.
     :param search_pattern: Format pattern to use for identifying the version.
+    :param run_cache: Contents of files that have already been read.
     :return: Parsed version found in the file.
     :raises FormatError: There was an issue processing the keystone version using the search
         pattern.
     :raises VersionNotFound: None of the lines in the file matched the search pattern.
     """
     matching_pattern = create_matching_pattern(search_pattern)
-    if (match := matching_pattern.search(file.read_text())) is not None:
+    text = run_cache.read_text(file, universal_newlines=True)
+    if (match := matching_pattern.search(text)) is not None:
         version_string = _version_string_from_match(match)
         if version_string is None:
             raise IncompleteKeystoneVersionError(file, search_pattern)
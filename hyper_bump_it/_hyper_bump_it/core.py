@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Optional
 
 from git import Repo
@@ -5,18 +6,31 @@ from git import Repo
 from . import execution_plan, files, ui, vcs
 from .config import Config, ConfigVersionUpdater
 from .format_pattern import TextFormatter
-from .planned_changes import PlannedChange
+from .planned_changes import FileChange
 from .vcs import GitOperationsInfo
 from .version import Version
 
 
 def do_bump(config: Config) -> None:
     text_formatter = TextFormatter(config.current_version, config.new_version)
-    planned_changes: list[PlannedChange] = []
-    for file in config.files:
-        planned_changes.extend(
-            files.collect_planned_changes(config.project_root, file, text_formatter)
-        )
+    skipped_files: list[Path] = []
+    planned_changes = files.collect_all_planned_changes(
+        config.project_root,
+        config.files,
+        text_formatter,
+        config.discovery,
+        config.run_cache,
+        config.streaming_threshold,
+        skipped_files,
+        config.jobs,
+        config.job_backend,
+    )
+    config_version_updater = _combine_config_change(
+        config, planned_changes, config.config_version_updater
+    )
+    # The planned changes only hold the replacements to make, so the contents of the files are
+    # not needed anymore.
+    config.run_cache.release_contents()
     git_operations_info = GitOperationsInfo.from_config(config.git, text_formatter)
     if git_operations_info.actions.all_skip:
         git_repo = None
@@ -27,15 +41,18 @@ def do_bump(config: Config) -> None:
         plan = _construct_patch_plan(
             config.new_version,
             planned_changes,
-            config.config_version_updater,
+            config_version_updater,
+            config.highlight_diff,
         )
     else:
         plan = _construct_plan(
             config.new_version,
             planned_changes,
+            skipped_files,
             git_operations_info,
             git_repo,
-            config.config_version_updater,
+            config_version_updater,
+            config.highlight_diff,
         )
     plan.display_plan(show_header=not config.patch)
     if config.no_execute_plan:
@@ -51,12 +68,34 @@ def do_bump(config: Config) -> None:
     plan.execute_plan()
 
 
+def _combine_config_change(
+    config: Config,
+    planned_changes: list[FileChange],
+    config_version_updater: Optional[ConfigVersionUpdater],
+) -> Optional[ConfigVersionUpdater]:
+    # A file definition can match the configuration file. The update to the version in the
+    # configuration file is then combined with the change to that file, so the file is only
+    # written once. Returns the updater that is still needed.
+    if config_version_updater is None:
+        return None
+    config_file = config.run_cache.resolve(config_version_updater.config_file)
+    for index, change in enumerate(planned_changes):
+        if change.file == config_file:
+            planned_changes[index] = files.combine_changes(
+                change, config_version_updater(config.new_version), config.project_root
+            )
+            return None
+    return config_version_updater
+
+
 def _construct_plan(
     new_version: Version,
-    planned_changes: list[PlannedChange],
+    planned_changes: list[FileChange],
+    skipped_files: list[Path],
     git_operations_info: GitOperationsInfo,
     repo: Optional[Repo],
     config_version_updater: Optional[ConfigVersionUpdater],
+    highlight_diff: bool,
 ) -> execution_plan.ExecutionPlan:
     plan = execution_plan.ExecutionPlan()
     git_actions: list[execution_plan.Action] = []
@@ -69,18 +108,23 @@ def _construct_plan(
         plan.add_action(
             execution_plan.update_config_action(config_version_updater, new_version)
         )
-    plan.add_action(execution_plan.update_file_actions(planned_changes))
+    plan.add_action(execution_plan.update_file_actions(planned_changes, highlight_diff))
+    if skipped_files:
+        plan.add_action(execution_plan.skip_files_action(skipped_files))
     plan.add_actions(git_actions)
     return plan
 
 
 def _construct_patch_plan(
     new_version: Version,
-    planned_changes: list[PlannedChange],
+    planned_changes: list[FileChange],
     config_version_updater: Optional[ConfigVersionUpdater],
+    highlight_diff: bool,
 ) -> execution_plan.ExecutionPlan:
     plan = execution_plan.ExecutionPlan()
     if config_version_updater is not None:
         planned_changes.append(config_version_updater(new_version))
-    plan.add_action(execution_plan.DisplayFilePatchesAction(planned_changes))
+    plan.add_action(
+        execution_plan.DisplayFilePatchesAction(planned_changes, highlight_diff)
+    )
     return plan
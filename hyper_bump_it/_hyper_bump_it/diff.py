@@ -0,0 +1,476 @@
+"""
+Produce the unified diff for replacements in a file, without comparing the full contents.
+
+The hunks are built directly around the lines that contain a replacement, and produce the same
+text as `difflib.unified_diff()` for the lines of the file before and after the replacements.
+When `difflib` could pair the lines up differently than the lines that were replaced, the full
+contents are compared instead.
+"""
+
+import difflib
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Number of unchanged lines displayed around changed lines, the same as `difflib.unified_diff()`
+DIFF_CONTEXT_LINES = 3
+# `difflib.SequenceMatcher` ignores lines that are too common in sequences at least this long
+_AUTOJUNK_MIN_LINES = 200
+# Building the hunks directly requires inspecting the file for each distinct changed line, so the
+# full contents are compared when there are more than this.
+_MAX_DISTINCT_LINES = 64
+# Lines of a diff longer than this are shortened when the diff is displayed
+MAX_DISPLAY_LINE_LENGTH = 500
+# Number of unchanged characters displayed on each side of a change within a shortened line
+DISPLAY_LINE_CONTEXT = 40
+# Length of the text used to line up the unchanged parts between changes within a long line
+_ANCHOR_LENGTH = 32
+# Line boundaries that `str.splitlines()` uses, as encoded in UTF-8
+_LINE_BOUNDARY = re.compile(rb"[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+_OTHER_LINE_BOUNDARY = re.compile(
+    rb"[\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]"
+)
+
+# offset, length of the replaced data, replacement data
+Replacement = tuple[int, int, bytes]
+
+
+@dataclass
+class Hunk:
+    old_start: int
+    new_start: int
+    lines: list[tuple[str, bytes]] = field(default_factory=list)
+
+    def add(self, prefix: str, lines: list[bytes]) -> None:
+        self.lines.extend((prefix, line) for line in lines)
+
+    def text(self) -> str:
+        old_length = sum(prefix != "+" for prefix, _ in self.lines)
+        new_length = sum(prefix != "-" for prefix, _ in self.lines)
+        header = (
+            f"@@ -{_format_range(self.old_start, old_length)}"
+            f" +{_format_range(self.new_start, new_length)} @@\n"
+        )
+        return header + "".join(prefix + line.decode() for prefix, line in self.lines)
+
+
+def apply_replacements(data: bytes, replacements: list[Replacement]) -> bytes:
+    """
+    Produce the contents of a file after making some replacements.
+
+    The replacements operate on the encoded contents, so the rest of the file is kept exactly as
+    it was.
+
+    :param data: Current contents of the file.
+    :param replacements: Sorted, non-overlapping replacements to make.
+    :return: Contents after the replacements.
+    """
+    parts = []
+    position = 0
+    for offset, length, replace_data in replacements:
+        parts.append(data[position:offset])
+        parts.append(replace_data)
+        position = offset + length
+    parts.append(data[position:])
+    return b"".join(parts)
+
+
+def format_diff(file_name: str, hunks: list[Hunk]) -> str:
+    """
+    Produce the unified diff text for some hunks.
+
+    :param file_name: Name of the file to use in the diff.
+    :param hunks: Changed lines of the file, in order.
+    :return: Unified diff text. Empty if there are no hunks.
+    """
+    if not hunks:
+        return ""
+    return "".join(
+        [f"--- {file_name}\n+++ {file_name}\n", *(hunk.text() for hunk in hunks)]
+    )
+
+
+def unified_diff(file_name: str, old_data: bytes, new_data: bytes) -> str:
+    """
+    Produce the unified diff text for a change to the contents of a file, by comparing the full
+    contents.
+
+    :param file_name: Name of the file to use in the diff.
+    :param old_data: Current contents of the file.
+    :param new_data: Contents of the file after the change.
+    :return: Unified diff text for the change.
+    """
+    return "".join(
+        difflib.unified_diff(
+            old_data.decode().splitlines(keepends=True),
+            new_data.decode().splitlines(keepends=True),
+            fromfile=file_name,
+            tofile=file_name,
+        )
+    )
+
+
+def replacement_diff(
+    file_name: str, data: bytes, replacements: list[Replacement]
+) -> str:
+    """
+    Produce the unified diff text for making some replacements in a file.
+
+    :param file_name: Name of the file to use in the diff.
+    :param data: Current contents of the file.
+    :param replacements: Sorted, non-overlapping replacements to make.
+    :return: Unified diff text for the change, the same as `unified_diff()` for the contents
+        before and after the replacements.
+    """
+    hunks = _replacement_hunks(data, replacements)
+    if hunks is None:
+        return unified_diff(file_name, data, apply_replacements(data, replacements))
+    return format_diff(file_name, hunks)
+
+
+def shorten_long_lines(diff_text: str) -> str:
+    """
+    Shorten the lines of a unified diff that are too long to display, such as the single line of a
+    minified file.
+
+    A removed line that is too long is paired with the added line that replaced it, and both only
+    show the characters around the parts that are different. Other lines that are too long only
+    show their start. The characters that are left out are replaced by a marker, so the result is
+    only meant to be displayed and can't be applied as a patch.
+
+    :param diff_text: Unified diff text.
+    :return: Diff text where each line is short enough to display.
+    """
+    lines = diff_text.split("\n")
+    if all(len(line) <= MAX_DISPLAY_LINE_LENGTH for line in lines):
+        return diff_text
+    shortened: list[str] = []
+    in_hunk = False
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        in_hunk = in_hunk or line.startswith("@@")
+        if in_hunk and line.startswith("-"):
+            removed = _prefixed_run(lines, index, "-")
+            added = _prefixed_run(lines, index + len(removed), "+")
+            shortened.extend(_shorten_changed(removed, added))
+            index += len(removed) + len(added)
+        else:
+            shortened.append(_shorten(line, []))
+            index += 1
+    return "\n".join(shortened)
+
+
+def _prefixed_run(lines: list[str], start: int, prefix: str) -> list[str]:
+    end = start
+    while end < len(lines) and lines[end].startswith(prefix):
+        end += 1
+    return lines[start:end]
+
+
+def _shorten_changed(removed: list[str], added: list[str]) -> list[str]:
+    if len(removed) != len(added):
+        return [_shorten(line, []) for line in [*removed, *added]]
+    old_lines = []
+    new_lines = []
+    for old_line, new_line in zip(removed, added):
+        changes = (
+            _changed_ranges(old_line[1:], new_line[1:])
+            if max(len(old_line), len(new_line)) > MAX_DISPLAY_LINE_LENGTH
+            else []
+        )
+        old_lines.append(
+            _shorten(old_line, [(start + 1, end + 1) for start, end, _, _ in changes])
+        )
+        new_lines.append(
+            _shorten(new_line, [(start + 1, end + 1) for _, _, start, end in changes])
+        )
+    return [*old_lines, *new_lines]
+
+
+def _shorten(line: str, changes: list[tuple[int, int]]) -> str:
+    # Keep the prefix of the line and the characters around each change
+    if len(line) <= MAX_DISPLAY_LINE_LENGTH:
+        return line
+    windows = [(0, 1)]
+    for start, end in changes or [(1, 1)]:
+        if end - start <= 2 * DISPLAY_LINE_CONTEXT:
+            windows.append((start - DISPLAY_LINE_CONTEXT, end + DISPLAY_LINE_CONTEXT))
+        else:
+            windows.append((start - DISPLAY_LINE_CONTEXT, start + DISPLAY_LINE_CONTEXT))
+            windows.append((end - DISPLAY_LINE_CONTEXT, end + DISPLAY_LINE_CONTEXT))
+    parts = []
+    position = 0
+    for start, end in windows:
+        start = max(start, position)
+        end = min(end, len(line))
+        if start > position:
+            parts.append(_elided(start - position))
+            position = start
+        if end > position:
+            parts.append(line[position:end])
+            position = end
+    if position < len(line):
+        parts.append(_elided(len(line) - position))
+    return "".join(parts)
+
+
+def _elided(count: int) -> str:
+    return f"[...{count} characters...]"
+
+
+def _changed_ranges(old: str, new: str) -> list[tuple[int, int, int, int]]:
+    # Start and end in the old text and the new text of each part that is different. Splitting
+    # at some text that only appears once keeps changes that are far apart from being shown as a
+    # single change.
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+    if prefix == old_end and prefix == new_end:
+        return []
+    split = -1
+    middle = (prefix + old_end) // 2
+    if old_end - prefix > 2 * DISPLAY_LINE_CONTEXT + _ANCHOR_LENGTH:
+        anchor_end = middle + _ANCHOR_LENGTH
+        anchor = old[middle:anchor_end]
+        split = new.find(anchor, prefix, new_end)
+        if new.find(anchor, split + 1, new_end) != -1:
+            # repeated text can't be used to line up the parts
+            split = -1
+    if split == -1:
+        return [(prefix, old_end, prefix, new_end)]
+    return [
+        *_shifted(
+            _changed_ranges(old[prefix:middle], new[prefix:split]), prefix, prefix
+        ),
+        *_shifted(
+            _changed_ranges(old[middle:old_end], new[split:new_end]), middle, split
+        ),
+    ]
+
+
+def _shifted(
+    changes: list[tuple[int, int, int, int]], old_offset: int, new_offset: int
+) -> list[tuple[int, int, int, int]]:
+    return [
+        (
+            old_start + old_offset,
+            old_end + old_offset,
+            new_start + new_offset,
+            new_end + new_offset,
+        )
+        for old_start, old_end, new_start, new_end in changes
+    ]
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    # Compares increasingly large blocks, so long common parts are compared without a loop over
+    # each character
+    limit = min(len(first), len(second))
+    length = 0
+    step = 1
+    while length < limit and step:
+        end = min(length + step, limit)
+        if first[length:end] == second[length:end]:
+            length = end
+            step *= 2
+        else:
+            step //= 2
+    return length
+
+
+def _common_suffix_length(first: str, second: str, limit: int) -> int:
+    length = 0
+    step = 1
+    while length < limit and step:
+        end = min(length + step, limit)
+        first_start, first_end = len(first) - end, len(first) - length
+        second_start, second_end = len(second) - end, len(second) - length
+        if first[first_start:first_end] == second[second_start:second_end]:
+            length = end
+            step *= 2
+        else:
+            step //= 2
+    return length
+
+
+@dataclass
+class _Group:
+    # consecutive lines that contain at least one replacement
+    line_number: int
+    start: int
+    end: int
+    old_lines: list[bytes] = field(default_factory=list)
+    new_lines: list[bytes] = field(default_factory=list)
+
+
+def _replacement_hunks(
+    data: bytes, replacements: list[Replacement]
+) -> Optional[list[Hunk]]:
+    # `None` if the hunks might not be the same as the ones `difflib` would produce
+    if not _only_line_feeds(data) or any(
+        _crosses_lines(data, replacement) for replacement in replacements
+    ):
+        return None
+    groups = _changed_groups(data, replacements)
+    if groups is None or not _paired_in_place(data, groups):
+        return None
+    return _build_hunks(data, groups)
+
+
+def _only_line_feeds(data: bytes) -> bool:
+    # Every line ends with "\n" or "\r\n", so lines can be found by looking for "\n"
+    return (
+        data.count(b"\r") == data.count(b"\r\n")
+        and _OTHER_LINE_BOUNDARY.search(data) is None
+    )
+
+
+def _crosses_lines(data: bytes, replacement: Replacement) -> bool:
+    # The replaced lines would not correspond one-to-one with the new lines
+    offset, length, replace_data = replacement
+    return (
+        _LINE_BOUNDARY.search(data, offset, offset + length) is not None
+        or _LINE_BOUNDARY.search(replace_data) is not None
+        or data.endswith(b"\r", 0, offset)
+    )
+
+
+def _changed_groups(
+    data: bytes, replacements: list[Replacement]
+) -> Optional[list[_Group]]:
+    groups: list[_Group] = []
+    line_number = 0
+    counted_to = 0  # `line_number` is the number of the line that starts here
+    index = 0
+    while index < len(replacements):
+        offset, length, _ = replacements[index]
+        start = data.rfind(b"\n", 0, offset) + 1
+        end = data.find(b"\n", offset + length) + 1 or len(data)
+        if start == end:
+            # text added after the last line would be a new line
+            return None
+        line_replacements = []
+        while index < len(replacements) and _within_line(
+            data, replacements[index][0], end
+        ):
+            offset, length, replace_data = replacements[index]
+            line_replacements.append((offset - start, length, replace_data))
+            index += 1
+        old_line = data[start:end]
+        new_line = apply_replacements(old_line, line_replacements)
+        if old_line == new_line:
+            continue
+        line_number += data.count(b"\n", counted_to, start)
+        counted_to = start
+        if not groups or groups[-1].end != start:
+            groups.append(_Group(line_number, start, end))
+        group = groups[-1]
+        group.end = end
+        group.old_lines.append(old_line)
+        group.new_lines.append(new_line)
+    return groups
+
+
+def _within_line(data: bytes, offset: int, line_end: int) -> bool:
+    # The end of the last line is also part of it, unless it is the start of a new line
+    return offset < line_end or (
+        offset == line_end == len(data) and not data.endswith(b"\n")
+    )
+
+
+def _paired_in_place(data: bytes, groups: list[_Group]) -> bool:
+    # `difflib` pairs each replaced line with its new line, and every other line with itself,
+    # when none of the replaced or new lines can be paired with a different line.
+    old_lines = Counter(line for group in groups for line in group.old_lines)
+    new_lines = {line for group in groups for line in group.new_lines}
+    if len(old_lines) + len(new_lines) + len(groups) > _MAX_DISTINCT_LINES:
+        return False
+    # A line is found at least once for each line in the file that is the same
+    if any(
+        line in new_lines or data.count(line) != count
+        for line, count in old_lines.items()
+    ) or any(line in data for line in new_lines):
+        return False
+    return _no_junk_runs(data, groups)
+
+
+def _no_junk_runs(data: bytes, groups: list[_Group]) -> bool:
+    # For long enough files, `difflib` can only pair up unchanged lines using lines that are not
+    # too common, so each run of unchanged lines needs to contain one of them.
+    line_count = data.count(b"\n") + (not data.endswith(b"\n"))
+    if line_count < _AUTOJUNK_MIN_LINES:
+        return True
+    max_count = line_count // 100 + 1
+    run_starts = [0, *(group.end for group in groups)]
+    run_ends = [*(group.start for group in groups), len(data)]
+    return all(
+        any(
+            data.count(line) <= max_count
+            for line in _lines_after(data, run_start, run_end)
+        )
+        for run_start, run_end in zip(run_starts, run_ends)
+        if run_start < run_end
+    )
+
+
+def _build_hunks(data: bytes, groups: list[_Group]) -> list[Hunk]:
+    hunks: list[Hunk] = []
+    hunk: Optional[Hunk] = None
+    previous_end = 0
+    previous_line_end = 0  # number of the line after the previous group
+    for group in groups:
+        start = group.start
+        if (
+            hunk is not None
+            and group.line_number - previous_line_end <= 2 * DIFF_CONTEXT_LINES
+        ):
+            hunk.add(" ", data[previous_end:start].splitlines(keepends=True))
+        else:
+            if hunk is not None:
+                hunk.add(" ", _lines_after(data, previous_end))
+                hunks.append(hunk)
+            before = _lines_before(data, start)
+            # each replaced line has exactly one new line, so the line numbers are the same
+            old_start = group.line_number - len(before)
+            hunk = Hunk(old_start, old_start)
+            hunk.add(" ", before)
+        hunk.add("-", group.old_lines)
+        hunk.add("+", group.new_lines)
+        previous_end = group.end
+        previous_line_end = group.line_number + len(group.old_lines)
+    if hunk is not None:
+        hunk.add(" ", _lines_after(data, previous_end))
+        hunks.append(hunk)
+    return hunks
+
+
+def _lines_before(data: bytes, position: int) -> list[bytes]:
+    start = position
+    for _ in range(DIFF_CONTEXT_LINES):
+        if start == 0:
+            break
+        start = data.rfind(b"\n", 0, start - 1) + 1
+    return data[start:position].splitlines(keepends=True)
+
+
+def _lines_after(data: bytes, position: int, stop: Optional[int] = None) -> list[bytes]:
+    stop = len(data) if stop is None else stop
+    end = position
+    for _ in range(DIFF_CONTEXT_LINES):
+        if end == stop:
+            break
+        end = data.find(b"\n", end, stop) + 1 or stop
+    return data[position:end].splitlines(keepends=True)
+
+
+def _format_range(start: int, length: int) -> str:
+    # Same format as `difflib.unified_diff()`
+    beginning = start + 1
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
@@ -0,0 +1,3 @@
+from .finder import find_files
+
+__all__ = ["find_files"]
@@ -0,0 +1,235 @@
+"""
+Persistent cache of file discovery results.
+
+Results are revalidated using the modification time of each directory that was scanned to produce
+them. Adding, removing, or renaming an entry of a directory updates its modification time, so if
+none of the times changed, walking the project root again would produce the same results.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from .ignore import GITIGNORE_FILE_NAME
+
+CACHE_DIR_NAME = "hyper-bump-it"
+CACHE_FILE_NAME = "discovery-cache.json"
+MAX_CACHE_ENTRIES = 32
+MAX_CACHE_BYTES = 4 * 1024 * 1024
+# File systems with coarse timestamps can give a change made right after a directory was scanned
+# the same modification time that was recorded. Results are not stored if any time is this recent.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class _Entry(BaseModel):
+    used: int  # time the entry was last stored or retrieved, in nanoseconds
+    mtimes: dict[str, Optional[int]]  # `None` for paths that did not exist
+    results: dict[str, list[str]]
+
+
+class _CacheFile(BaseModel):
+    version: Literal[1] = 1
+    entries: dict[str, _Entry] = {}
+
+
+class Snapshot:
+    def __init__(self, project_root: Path) -> None:
+        """
+        Initialize an instance.
+
+        :param project_root: Root directory the recorded paths are relative to.
+        """
+        self._project_root = project_root
+        self.mtimes: dict[str, Optional[int]] = {}
+
+    def record(self, relative: str) -> None:
+        """
+        Record the modification time of a path that affects the discovery results.
+
+        :param relative: Path relative to the project root, using "/" as the separator.
+        """
+        self.mtimes[relative] = _mtime(self._project_root, relative)
+
+    def record_directory(
+        self, relative: str, entries: Iterable[os.DirEntry[str]]
+    ) -> None:
+        """
+        Record the modification time of a scanned directory, and the ignore file it contains.
+
+        :param relative: Path relative to the project root, using "/" as the separator. Empty
+            for the project root.
+        :param entries: Entries of the directory.
+        """
+        self.record(relative)
+        if any(entry.name == GITIGNORE_FILE_NAME for entry in entries):
+            self.record(
+                f"{relative}/{GITIGNORE_FILE_NAME}" if relative else GITIGNORE_FILE_NAME
+            )
+
+
+class DiscoveryCache:
+    def __init__(self, cache_file: Path, read_only: bool = False) -> None:
+        """
+        Initialize an instance.
+
+        :param cache_file: File used to persist the cache.
+        :param read_only: Only retrieve results, without ever writing the file.
+        """
+        self._cache_file = cache_file
+        self._read_only = read_only
+
+    @classmethod
+    def for_project(
+        cls, project_root: Path, read_only: bool = False
+    ) -> "DiscoveryCache":
+        """
+        Create a cache stored in the git directory of the project. The user cache directory is
+        used for projects that are not git repositories.
+
+        :param project_root: Root directory of the project.
+        :param read_only: Only retrieve results, without ever writing the file.
+        :return: Cache for the project.
+        """
+        git_dir = project_root / ".git"
+        cache_dir = git_dir if git_dir.is_dir() else user_cache_dir()
+        return cls(cache_dir / CACHE_DIR_NAME / CACHE_FILE_NAME, read_only)
+
+    def lookup(self, project_root: Path, key: str) -> Optional[dict[str, list[Path]]]:
+        """
+        Retrieve results that are still valid.
+
+        :param project_root: Root directory the results are relative to.
+        :param key: Identifier of the results.
+        :return: Matched files for each of the glob patterns. `None` if there are no valid
+            results.
+        """
+        cache = self._load()
+        entry = cache.entries.get(key)
+        if entry is None or not _is_current(project_root, entry.mtimes):
+            return None
+        entry.used = time.time_ns()
+        self._save(cache)
+        return {
+            file_glob: [project_root / path for path in paths]
+            for file_glob, paths in entry.results.items()
+        }
+
+    def store(
+        self,
+        project_root: Path,
+        key: str,
+        snapshot: Snapshot,
+        results: Mapping[str, list[Path]],
+    ) -> None:
+        """
+        Store results, evicting the least recently used results when the cache is too large.
+
+        :param project_root: Root directory the results are relative to.
+        :param key: Identifier of the results.
+        :param snapshot: Modification times of the paths that affect the results.
+        :param results: Matched files for each of the glob patterns.
+        """
+        now = time.time_ns()
+        if any(
+            mtime is not None and mtime > now - _RACY_WINDOW_NS
+            for mtime in snapshot.mtimes.values()
+        ):
+            return
+        cache = self._load()
+        cache.entries[key] = _Entry(
+            used=now,
+            mtimes=snapshot.mtimes,
+            results={
+                file_glob: [path.relative_to(project_root).as_posix() for path in paths]
+                for file_glob, paths in results.items()
+            },
+        )
+        cache.entries = _bounded(cache.entries)
+        self._save(cache)
+
+    def _load(self) -> _CacheFile:
+        try:
+            return _CacheFile.model_validate_json(self._cache_file.read_bytes())
+        except (OSError, ValidationError):
+            # A missing, unreadable, or outdated cache is treated as being empty
+            return _CacheFile()
+
+    def _save(self, cache: _CacheFile) -> None:
+        if self._read_only:
+            return
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._cache_file.parent, suffix=".tmp", delete=False
+            ) as temp_file:
+                temp_file.write(cache.model_dump_json())
+            os.replace(temp_file.name, self._cache_file)
+        except OSError:
+            # The cache only improves performance, so failing to write it is not an error
+            pass
+
+
+def cache_key(*parts: object) -> str:
+    """
+    Produce an identifier for discovery results.
+
+    :param parts: JSON serializable values that affect the results.
+    :return: Identifier that is unique to the given values.
+    """
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def user_cache_dir() -> Path:
+    """
+    Locate the directory used to cache data for the current user.
+
+    :return: Platform specific cache directory.
+    """
+    if sys.platform == "win32":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        if local_app_data:
+            return Path(local_app_data)
+        return Path.home() / "AppData" / "Local"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches"
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home)
+    return Path.home() / ".cache"
+
+
+def _mtime(project_root: Path, relative: str) -> Optional[int]:
+    try:
+        return (project_root / relative).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_current(project_root: Path, mtimes: Mapping[str, Optional[int]]) -> bool:
+    return all(
+        _mtime(project_root, relative) == mtime for relative, mtime in mtimes.items()
+    )
+
+
+def _bounded(entries: dict[str, _Entry]) -> dict[str, _Entry]:
+    kept: dict[str, _Entry] = {}
+    total_bytes = 0
+    for key, entry in sorted(
+        entries.items(), key=lambda item: item[1].used, reverse=True
+    ):
+        if len(kept) >= MAX_CACHE_ENTRIES:
+            break
+        entry_bytes = len(entry.model_dump_json())
+        if total_bytes + entry_bytes > MAX_CACHE_BYTES:
+            continue
+        kept[key] = entry
+        total_bytes += entry_bytes
+    return kept
@@ -0,0 +1,311 @@
+"""
+Locate the files matched by file globs.
+
+The project root is walked a single time, no matter how many file globs are given. Directories
+that can't contain a match for any of the globs, or are excluded, are never entered.
+
+Directories can be scanned by multiple threads, which helps when each access to the file system
+has a high latency (such as network file systems).
+
+The results of a walk can be stored in a persistent cache. Repeat runs on a project that has not
+changed use the stored results instead of walking the project root again.
+
+Alternatively, the globs can be matched against the files tracked in the git index, which avoids
+touching the file system for anything other than the matched files.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Optional, TypeAlias
+
+from ..config.core import DiscoveryMode
+from .cache import DiscoveryCache, Snapshot, cache_key
+from .git_index import tracked_files
+from .glob_set import GlobSet, State
+from .ignore import GIT_INFO_EXCLUDE_FILE, GITIGNORE_FILE_NAME, IgnoreRules
+
+if TYPE_CHECKING:
+    from ..config import Discovery
+
+
+def find_files(
+    project_root: Path,
+    file_globs: Iterable[str],
+    settings: Optional["Discovery"] = None,
+) -> dict[str, list[Path]]:
+    """
+    Find the files that match each of the given glob patterns.
+
+    :param project_root: Root directory to start looking for files.
+    :param file_globs: Glob patterns relative to the project root.
+    :param settings: Configuration of how files should be discovered. If `None`, the project
+        root is walked and no paths are excluded.
+    :return: Sorted list of matched files for each of the glob patterns. A glob pattern that did
+        not match any files will map to an empty list.
+    :raises NoRepositoryError: Discovery uses the git index, but the project root is not a git
+        repository.
+    """
+    results: dict[str, list[Path]] = {file_glob: [] for file_glob in file_globs}
+    walkable_globs: list[str] = []
+    for file_glob in results:
+        if _is_walkable(file_glob):
+            walkable_globs.append(file_glob)
+        else:
+            # Patterns that reach outside the project root can't be discovered by walking it.
+            results[file_glob] = list(project_root.glob(file_glob))
+
+    if walkable_globs:
+        _discover(project_root, walkable_globs, results, settings)
+    return {file_glob: sorted(matches) for file_glob, matches in results.items()}
+
+
+def _discover(
+    project_root: Path,
+    file_globs: list[str],
+    results: dict[str, list[Path]],
+    settings: Optional["Discovery"],
+) -> None:
+    if settings is not None and settings.mode == DiscoveryMode.GitIndex:
+        _match_tracked(project_root, file_globs, results, _configured_rules(settings))
+    elif settings is not None and settings.use_cache:
+        _cached_walk(project_root, file_globs, results, settings)
+    else:
+        _walk(
+            project_root,
+            file_globs,
+            results,
+            _Exclusions.from_settings(project_root, settings),
+            1 if settings is None else settings.workers,
+        )
+
+
+def _is_walkable(file_glob: str) -> bool:
+    glob_path = PurePath(file_glob)
+    return (
+        not glob_path.anchor
+        and len(glob_path.parts) > 0
+        and ".." not in glob_path.parts
+    )
+
+
+@dataclass(frozen=True)
+class _Exclusions:
+    configured: IgnoreRules
+    gitignore: Optional[IgnoreRules]  # `None` if .gitignore files should not be used
+
+    @classmethod
+    def from_settings(
+        cls, project_root: Path, settings: Optional["Discovery"]
+    ) -> "_Exclusions":
+        if settings is None:
+            return cls(IgnoreRules(), None)
+        configured = _configured_rules(settings)
+        if not settings.respect_gitignore:
+            return cls(configured, None)
+        return cls(
+            configured,
+            IgnoreRules().with_file("", project_root / GIT_INFO_EXCLUDE_FILE),
+        )
+
+    def entering(
+        self, directory: Path, relative: str, entries: list[os.DirEntry[str]]
+    ) -> "_Exclusions":
+        if self.gitignore is None or all(
+            entry.name != GITIGNORE_FILE_NAME for entry in entries
+        ):
+            return self
+        return _Exclusions(
+            self.configured,
+            self.gitignore.with_file(relative, directory / GITIGNORE_FILE_NAME),
+        )
+
+    def is_excluded(self, relative: str, is_dir: bool) -> bool:
+        return self.configured.is_ignored(relative, is_dir) or (
+            self.gitignore is not None and self.gitignore.is_ignored(relative, is_dir)
+        )
+
+
+# A directory to scan: (path, path relative to the project root, glob positions, exclusions)
+_Visit: TypeAlias = tuple[Path, str, frozenset[State], _Exclusions]
+# A glob pattern and a file it matched
+_Match: TypeAlias = tuple[str, Path]
+_Visitor: TypeAlias = Callable[[_Visit], tuple[list[_Match], list[_Visit]]]
+
+
+def _configured_rules(settings: "Discovery") -> IgnoreRules:
+    return IgnoreRules().with_patterns("", sorted(settings.exclude_patterns))
+
+
+def _cached_walk(
+    project_root: Path,
+    file_globs: list[str],
+    results: dict[str, list[Path]],
+    settings: "Discovery",
+) -> None:
+    discovery_cache = DiscoveryCache.for_project(
+        project_root, read_only=not settings.update_cache
+    )
+    key = cache_key(
+        str(project_root),
+        sorted(file_globs),
+        sorted(settings.exclude_patterns),
+        settings.respect_gitignore,
+    )
+    cached_results = discovery_cache.lookup(project_root, key)
+    if cached_results is not None:
+        results.update(cached_results)
+        return
+
+    snapshot = Snapshot(project_root)
+    if settings.respect_gitignore:
+        snapshot.record(GIT_INFO_EXCLUDE_FILE.as_posix())
+    _walk(
+        project_root,
+        file_globs,
+        results,
+        _Exclusions.from_settings(project_root, settings),
+        settings.workers,
+        snapshot,
+    )
+    discovery_cache.store(
+        project_root,
+        key,
+        snapshot,
+        {file_glob: results[file_glob] for file_glob in file_globs},
+    )
+
+
+def _walk(
+    project_root: Path,
+    file_globs: list[str],
+    results: dict[str, list[Path]],
+    exclusions: _Exclusions,
+    workers: int = 1,
+    snapshot: Optional[Snapshot] = None,
+) -> None:
+    glob_set = GlobSet(file_globs)
+    visitor = partial(_visit, glob_set, snapshot)
+    initial = (project_root, "", glob_set.initial_states, exclusions)
+    if workers > 1:
+        matches = _visit_concurrently(visitor, initial, workers)
+    else:
+        matches = _visit_sequentially(visitor, initial)
+    for file_glob, path in matches:
+        results[file_glob].append(path)
+
+
+def _visit_sequentially(visitor: _Visitor, initial: _Visit) -> Iterator[_Match]:
+    pending = [initial]
+    while pending:
+        matches, children = visitor(pending.pop())
+        yield from matches
+        pending.extend(children)
+
+
+def _visit_concurrently(
+    visitor: _Visitor, initial: _Visit, workers: int
+) -> Iterator[_Match]:
+    # Scanning a directory mostly waits on I/O, so high latency file systems benefit from
+    # scanning several directories at the same time. Results are sorted by the caller, so the
+    # order directories complete in doesn't matter.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {executor.submit(visitor, initial)}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                matches, children = future.result()
+                yield from matches
+                running.update(executor.submit(visitor, child) for child in children)
+
+
+def _visit(
+    glob_set: GlobSet, snapshot: Optional[Snapshot], visit: _Visit
+) -> tuple[list[_Match], list[_Visit]]:
+    directory, relative, states, exclusions = visit
+    entries = _scan(directory)
+    if snapshot is not None:
+        snapshot.record_directory(relative, entries)
+    exclusions = exclusions.entering(directory, relative, entries)
+    matches: list[_Match] = []
+    children: list[_Visit] = []
+    for entry in entries:
+        is_dir = _is_dir(entry)
+        matched_globs, child_states = glob_set.step(
+            states, entry.name, is_dir, entry.is_symlink()
+        )
+        if not matched_globs and not child_states:
+            continue
+        entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+        if exclusions.is_excluded(entry_relative, is_dir):
+            continue
+        matches.extend(
+            (file_glob, directory / entry.name) for file_glob in matched_globs
+        )
+        if child_states:
+            children.append(
+                (directory / entry.name, entry_relative, child_states, exclusions)
+            )
+    return matches, children
+
+
+def _scan(directory: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        # Match the behavior of pathlib, which ignores directories that can't be read.
+        return []
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _match_tracked(
+    project_root: Path,
+    file_globs: list[str],
+    results: dict[str, list[Path]],
+    exclusions: IgnoreRules,
+) -> None:
+    # Files that are tracked are never ignored by git, so only the configured exclusions apply.
+    glob_set = GlobSet(file_globs)
+    directory_states = {"": glob_set.initial_states}
+    for relative in tracked_files(project_root):
+        parent, _, name = relative.rpartition("/")
+        states = _directory_states(glob_set, exclusions, directory_states, parent)
+        if not states:
+            continue
+        matched_globs, _ = glob_set.step(states, name, is_dir=False, is_symlink=False)
+        if not matched_globs or exclusions.is_ignored(relative, is_dir=False):
+            continue
+        path = project_root / relative
+        # Skip entries that were deleted from the working tree, submodules, and symbolic links
+        # to directories.
+        if not path.is_file():
+            continue
+        for file_glob in matched_globs:
+            results[file_glob].append(path)
+
+
+def _directory_states(
+    glob_set: GlobSet,
+    exclusions: IgnoreRules,
+    directory_states: dict[str, frozenset[State]],
+    directory: str,
+) -> frozenset[State]:
+    if (states := directory_states.get(directory)) is not None:
+        return states
+    parent, _, name = directory.rpartition("/")
+    parent_states = _directory_states(glob_set, exclusions, directory_states, parent)
+    states = frozenset()
+    if parent_states and not exclusions.is_ignored(directory, is_dir=True):
+        _, states = glob_set.step(parent_states, name, is_dir=True, is_symlink=False)
+    directory_states[directory] = states
+    return states
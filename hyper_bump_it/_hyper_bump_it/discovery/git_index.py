@@ -0,0 +1,26 @@
+"""
+List the files tracked by a git repository.
+"""
+
+from pathlib import Path
+
+from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+
+from ..error import NoRepositoryError
+
+
+def tracked_files(project_root: Path) -> list[str]:
+    """
+    Retrieve the paths of the files that are tracked in the index of the repository.
+
+    :param project_root: Root of the project repository.
+    :return: Paths relative to the project root, using "/" as the separator.
+    :raises NoRepositoryError: The project root is not a git repository.
+    """
+    try:
+        repo = Repo(project_root)
+    except (InvalidGitRepositoryError, NoSuchPathError):
+        raise NoRepositoryError(project_root)
+    # Using a NUL separator prevents git from quoting paths with unusual characters
+    output: str = repo.git.ls_files("-z")
+    return [path for path in output.split("\0") if path]
@@ -0,0 +1,219 @@
+"""
+Match many file globs at the same time, one path segment at a time.
+
+Each glob is split into path segments. A position within a glob is tracked for each directory that
+is visited, indicating which segments could still produce a match for entries in that directory.
+A directory without any positions can't contain a match for any of the globs.
+
+The segments for a set of positions are compiled together, so that the cost of matching a name
+against all of them barely grows with the number of globs. Literal segments are found using a
+single dictionary lookup and the remaining segments are combined into a single regular expression.
+"""
+
+import fnmatch
+import os
+import re
+from collections.abc import Iterable
+from pathlib import PurePath
+from re import Pattern
+from typing import Optional, TypeAlias
+
+_RECURSIVE_WILDCARD = "**"
+_WILDCARD_CHARACTERS = frozenset("*?[")
+# Match the case sensitivity used by pathlib for the current platform.
+_IGNORE_CASE = os.name == "nt"
+_CASE_FLAGS = re.IGNORECASE if _IGNORE_CASE else 0
+# Older versions of fnmatch produce named groups, which must be unique in a combined pattern.
+_GROUP_NAME = re.compile(r"(\(\?P[<=])(\w+)")
+
+# A position within a glob: (index of the glob, index of the segment within that glob)
+State: TypeAlias = tuple[int, int]
+# A segment is either a name pattern or `None` for the recursive wildcard.
+_Segment: TypeAlias = Optional[str]
+
+
+class GlobSet:
+    def __init__(self, file_globs: list[str]) -> None:
+        """
+        Initialize an instance.
+
+        :param file_globs: Glob patterns that are relative to the directory being walked.
+        """
+        self._file_globs = file_globs
+        self._segments = [_split_glob(file_glob) for file_glob in file_globs]
+        self._transitions: dict[frozenset[State], _Transitions] = {}
+        self.initial_states = self._expand(
+            (index, 0) for index in range(len(file_globs))
+        )
+
+    def step(
+        self, states: frozenset[State], name: str, is_dir: bool, is_symlink: bool
+    ) -> tuple[list[str], frozenset[State]]:
+        """
+        Advance the given states using a directory entry.
+
+        :param states: Glob positions that are possible for the directory containing the entry.
+        :param name: Name of the directory entry.
+        :param is_dir: If the entry is a directory (following symlinks).
+        :param is_symlink: If the entry is a symlink.
+        :return: Glob patterns that matched the entry as a file and the glob positions that are
+            possible within the entry as a directory.
+        """
+        transitions = self._transitions.get(states)
+        if transitions is None:
+            transitions = _Transitions(self, states)
+            self._transitions[states] = transitions
+        return transitions.step(name, is_dir, is_symlink)
+
+    def advance(
+        self, states: frozenset[State], is_dir: bool, is_symlink: bool
+    ) -> tuple[list[str], frozenset[State]]:
+        """
+        Advance states whose segment is known to match a directory entry.
+
+        :param states: Glob positions whose segment matched the name of the entry.
+        :param is_dir: If the entry is a directory (following symlinks).
+        :param is_symlink: If the entry is a symlink.
+        :return: Glob patterns that matched the entry as a file and the glob positions that are
+            possible within the entry as a directory.
+        """
+        matched_globs: list[str] = []
+        child_states: list[State] = []
+        for glob_index, position in states:
+            segments = self._segments[glob_index]
+            is_last = position == len(segments) - 1
+            if not is_dir:
+                if is_last:
+                    matched_globs.append(self._file_globs[glob_index])
+            elif segments[position] is None:
+                # The recursive wildcard doesn't follow symlinks, to avoid cycles.
+                if not is_symlink:
+                    child_states.append((glob_index, position))
+            elif not is_last:
+                child_states.append((glob_index, position + 1))
+        return matched_globs, self._expand(child_states)
+
+    def segment(self, state: State) -> _Segment:
+        """
+        Retrieve the segment of a glob at a position.
+
+        :param state: Glob position.
+        :return: Segment of the glob, or `None` for the recursive wildcard.
+        """
+        glob_index, position = state
+        return self._segments[glob_index][position]
+
+    def _expand(self, states: Iterable[State]) -> frozenset[State]:
+        # The recursive wildcard can also match zero directories, so the following segment is
+        # also a possible position.
+        expanded: set[State] = set()
+        for glob_index, position in states:
+            expanded.add((glob_index, position))
+            segments = self._segments[glob_index]
+            while segments[position] is None and position < len(segments) - 1:
+                position += 1
+                expanded.add((glob_index, position))
+        return frozenset(expanded)
+
+
+class _Transitions:
+    def __init__(self, glob_set: GlobSet, states: frozenset[State]) -> None:
+        """
+        Initialize an instance.
+
+        :param glob_set: Globs the positions refer to.
+        :param states: Glob positions that are possible for a directory.
+        """
+        self._glob_set = glob_set
+        self._always: list[State] = []
+        self._literals: dict[str, list[State]] = {}
+        wildcards: dict[Optional[str], dict[str, list[State]]] = {}
+        for state in states:
+            segment = glob_set.segment(state)
+            if segment is None:
+                self._always.append(state)
+            elif _WILDCARD_CHARACTERS.isdisjoint(segment):
+                self._literals.setdefault(_normalize_case(segment), []).append(state)
+            else:
+                wildcards.setdefault(_required_extension(segment), {}).setdefault(
+                    segment, []
+                ).append(state)
+        self._wildcards = {
+            extension: _combine_wildcards(segments)
+            for extension, segments in wildcards.items()
+        }
+        self._advanced: dict[
+            tuple[frozenset[State], bool, bool], tuple[list[str], frozenset[State]]
+        ] = {}
+
+    def step(
+        self, name: str, is_dir: bool, is_symlink: bool
+    ) -> tuple[list[str], frozenset[State]]:
+        name = _normalize_case(name)
+        matched = list(self._always)
+        matched.extend(self._literals.get(name, ()))
+        self._match_wildcards(None, name, matched)
+        if "." in name:
+            self._match_wildcards(name.rpartition(".")[2], name, matched)
+        if not matched:
+            return [], frozenset()
+        key = (frozenset(matched), is_dir, is_symlink)
+        result = self._advanced.get(key)
+        if result is None:
+            result = self._glob_set.advance(*key)
+            self._advanced[key] = result
+        return result
+
+    def _match_wildcards(
+        self, extension: Optional[str], name: str, matched: list[State]
+    ) -> None:
+        if (combined := self._wildcards.get(extension)) is None:
+            return
+        group_states, regex = combined
+        if (match := regex.match(name)) is None:
+            return
+        groups = match.groups()
+        for group_index, states in group_states:
+            if groups[group_index] is not None:
+                matched.extend(states)
+
+
+def _required_extension(segment: str) -> Optional[str]:
+    # Any name matched by a segment that ends with literal text containing a "." has the same
+    # extension, so only segments with that extension (or none) need to be checked for a name.
+    tail = re.split(r"[*?\]]", segment)[-1]
+    if "." not in tail:
+        return None
+    return _normalize_case(tail.rpartition(".")[2])
+
+
+def _combine_wildcards(
+    wildcards: dict[str, list[State]],
+) -> tuple[list[tuple[int, list[State]]], Pattern[str]]:
+    # Each segment is an optional lookahead, so they are all attempted at the start of the name
+    # and the capturing group of each one that matches is set.
+    combined = "".join(
+        _optional_lookahead(f"m{index}", segment)
+        for index, segment in enumerate(wildcards)
+    )
+    regex = re.compile(combined, _CASE_FLAGS)
+    return [
+        (regex.groupindex[f"m{index}"] - 1, states)
+        for index, states in enumerate(wildcards.values())
+    ], regex
+
+
+def _optional_lookahead(group_name: str, segment: str) -> str:
+    pattern = _GROUP_NAME.sub(rf"\g<1>{group_name}_\g<2>", fnmatch.translate(segment))
+    return f"(?:(?=(?P<{group_name}>{pattern})))?"
+
+
+def _normalize_case(name: str) -> str:
+    return name.lower() if _IGNORE_CASE else name
+
+
+def _split_glob(file_glob: str) -> tuple[Optional[str], ...]:
+    return tuple(
+        None if part == _RECURSIVE_WILDCARD else part
+        for part in PurePath(file_glob).parts
+    )
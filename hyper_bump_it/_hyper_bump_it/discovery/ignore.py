@@ -0,0 +1,173 @@
+"""
+Rules for excluding paths from file discovery.
+
+Patterns use the same syntax as `.gitignore` files.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from re import Pattern
+from typing import Optional
+
+GITIGNORE_FILE_NAME = ".gitignore"
+# Repository specific patterns that are not committed
+GIT_INFO_EXCLUDE_FILE = Path(".git", "info", "exclude")
+
+
+@dataclass(frozen=True)
+class _Rule:
+    regex: Pattern[str]
+    negated: bool
+    directory_only: bool
+
+    def matches(self, relative_path: str, is_dir: bool) -> bool:
+        if (match := self.regex.match(relative_path)) is None:
+            return False
+        # A pattern that matches a parent directory also matches everything inside it.
+        return is_dir or not self.directory_only or match.group("inside") is not None
+
+
+@dataclass(frozen=True)
+class _RuleGroup:
+    base: str  # directory the patterns are relative to. Empty for the root directory
+    rules: tuple[_Rule, ...]
+
+    def relative_to_base(self, relative_path: str) -> Optional[str]:
+        if not self.base:
+            return relative_path
+        prefix = f"{self.base}/"
+        if relative_path.startswith(prefix):
+            return relative_path.removeprefix(prefix)
+        return None
+
+
+class IgnoreRules:
+    def __init__(self, groups: tuple[_RuleGroup, ...] = ()) -> None:
+        """
+        Initialize an instance.
+
+        :param groups: Collections of rules, ordered from lowest to highest precedence.
+        """
+        self._groups = groups
+
+    def __bool__(self) -> bool:
+        return len(self._groups) > 0
+
+    def with_patterns(self, base: str, patterns: Iterable[str]) -> "IgnoreRules":
+        """
+        Produce rules that include additional patterns. The new patterns take precedence over
+        the existing patterns.
+
+        :param base: Directory (relative to the project root, using "/" as the separator) that
+            the patterns are relative to. Empty for the project root.
+        :param patterns: Lines that use the `.gitignore` pattern syntax.
+        :return: Combined rules.
+        """
+        rules = tuple(
+            rule for rule in (_parse_pattern(pattern) for pattern in patterns) if rule
+        )
+        if not rules:
+            return self
+        return IgnoreRules((*self._groups, _RuleGroup(base, rules)))
+
+    def with_file(self, base: str, file: Path) -> "IgnoreRules":
+        """
+        Produce rules that include the patterns from a file. The new patterns take precedence
+        over the existing patterns.
+
+        :param base: Directory (relative to the project root, using "/" as the separator) that
+            the patterns are relative to. Empty for the project root.
+        :param file: File containing patterns. Files that can't be read are treated as empty.
+        :return: Combined rules.
+        """
+        try:
+            patterns = file.read_text(errors="replace").splitlines()
+        except OSError:
+            return self
+        return self.with_patterns(base, patterns)
+
+    def is_ignored(self, relative_path: str, is_dir: bool) -> bool:
+        """
+        Check if a path should be excluded.
+
+        :param relative_path: Path relative to the project root, using "/" as the separator.
+        :param is_dir: If the path is a directory.
+        :return: `True` if the path is excluded by the rules.
+        """
+        for group in reversed(self._groups):
+            if (group_path := group.relative_to_base(relative_path)) is None:
+                continue
+            for rule in reversed(group.rules):
+                if rule.matches(group_path, is_dir):
+                    return not rule.negated
+        return False
+
+
+def _parse_pattern(line: str) -> Optional[_Rule]:
+    pattern = _strip_trailing_spaces(line)
+    if not pattern or pattern.startswith("#"):
+        return None
+    negated = pattern.startswith("!")
+    if negated or pattern.startswith(("\\!", "\\#")):
+        pattern = pattern[1:]
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    # A separator at the beginning or middle of the pattern makes it relative to the base.
+    # Otherwise, the pattern can match at any level below the base.
+    prefix = "" if "/" in pattern else "(?:.*/)?"
+    regex = f"{prefix}{_translate(pattern.lstrip('/'))}(?P<inside>/.*)?\\Z"
+    return _Rule(re.compile(regex, re.DOTALL), negated, directory_only)
+
+
+def _strip_trailing_spaces(line: str) -> str:
+    stripped = line.rstrip()
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        # escaped trailing space is preserved
+        return f"{stripped} "
+    return stripped
+
+
+def _translate(pattern: str) -> str:
+    parts = pattern.split("/")
+    regex = ""
+    for index, part in enumerate(parts):
+        is_last = index == len(parts) - 1
+        if part == "**":
+            regex += ".*" if is_last else "(?:.*/)?"
+        else:
+            regex += _translate_part(part)
+            if not is_last:
+                regex += "/"
+    return regex
+
+
+def _translate_part(part: str) -> str:
+    regex = ""
+    index = 0
+    while index < len(part):
+        char = part[index]
+        index += 1
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "\\" and index < len(part):
+            regex += re.escape(part[index])
+            index += 1
+        elif char == "[" and (end := part.find("]", index + 1)) != -1:
+            regex += _translate_class(part[index:end])
+            index = end + 1
+        else:
+            regex += re.escape(char)
+    return regex
+
+
+def _translate_class(contents: str) -> str:
+    contents = contents.replace("\\", "\\\\")
+    if contents.startswith("!"):
+        contents = f"^{contents[1:]}"
+    return f"[{contents}]"
@@ -20,6 +20,26 @@ class BumpItError(Exception):
     def __rich__(self) -> Text:
         return Text(str(self))
 
+    def __reduce__(self) -> tuple["_RestoreError", "_ErrorState"]:
+        # The arguments of most errors are not the message that is given to `Exception`, so the
+        # error is rebuilt from its attributes when it is sent from another process.
+        return _restore_error, (type(self), self.args, self.__dict__)
+
+
+_ErrorState = tuple[type[BumpItError], tuple[object, ...], dict[str, object]]
+_RestoreError = Callable[
+    [type[BumpItError], tuple[object, ...], dict[str, object]], BumpItError
+]
+
+
+def _restore_error(
+    error_type: type[BumpItError], args: tuple[object, ...], state: dict[str, object]
+) -> BumpItError:
+    error = error_type.__new__(error_type, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
 
 class FormatError(BumpItError):
     """Base for formatting errors"""
@@ -168,6 +188,32 @@ class PathTraversalError(BumpItError):
         return message
 
 
+class FileEncodingError(BumpItError):
+    def __init__(self, file: Path) -> None:
+        self.file = file
+        super().__init__(f"File '{self.file}' does not contain valid UTF-8 text")
+
+    def __rich__(self) -> Text:
+        message = Text("File '")
+        message.append(str(self.file), style="file.path")
+        message.append("' does not contain valid UTF-8 text")
+        return message
+
+
+class FileChangedError(BumpItError):
+    def __init__(self, file: Path) -> None:
+        self.file = file
+        super().__init__(
+            f"File '{self.file}' was modified after the changes to it were planned"
+        )
+
+    def __rich__(self) -> Text:
+        message = Text("File '")
+        message.append(str(self.file), style="file.path")
+        message.append("' was modified after the changes to it were planned")
+        return message
+
+
 class KeystoneError(BumpItError):
     """Base for keystone file errors"""
 
@@ -221,6 +267,45 @@ class SearchTextNotFound(KeystoneError):
         return message
 
 
+class RegionNotFoundError(BumpItError):
+    def __init__(self, file: Path, region: str) -> None:
+        self.file = file
+        self.region = region
+        super().__init__(
+            f"The region ({self.region}) was not found in file '{self.file}'"
+        )
+
+    def __rich__(self) -> Text:
+        message = Text("The region (")
+        message.append(self.region, style="format.pattern")
+        message.append(") was not found in file '")
+        message.append(str(self.file), style="file.path")
+        message.append("'")
+        return message
+
+
+class TooFewMatchesError(BumpItError):
+    def __init__(
+        self, file: Path, search_pattern: str, found: int, minimum: int
+    ) -> None:
+        self.file = file
+        self.search_pattern = search_pattern
+        self.found = found
+        self.minimum = minimum
+        super().__init__(
+            f"The search pattern '{self.search_pattern}' was found {self.found} time(s) in file"
+            f" '{self.file}', but at least {self.minimum} are required"
+        )
+
+    def __rich__(self) -> Text:
+        message = Text("The search pattern '")
+        message.append(self.search_pattern, style="format.pattern")
+        message.append(f"' was found {self.found} time(s) in file '")
+        message.append(str(self.file), style="file.path")
+        message.append(f"', but at least {self.minimum} are required")
+        return message
+
+
 class VersionNotFound(KeystoneError):
     def __init__(self, file: Path, search_pattern: str) -> None:
         self.file = file
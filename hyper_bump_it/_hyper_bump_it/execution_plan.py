@@ -5,15 +5,16 @@ The plan is created before performing any operations so that the user can confir
 to be made before files are edited.
 """
 
+from pathlib import Path
 from typing import Optional, Protocol, TypeVar
 
 from git import Repo
 from rich.text import Text
 
-from . import files, ui, vcs
+from . import diff, files, ui, vcs
 from .compat import LiteralString
 from .config import ConfigVersionUpdater, GitAction
-from .planned_changes import PlannedChange
+from .planned_changes import FileChange
 from .version import Version
 
 
@@ -100,8 +101,9 @@ def update_config_action(updater: ConfigVersionUpdater, new_version: Version) ->
 
 
 class ChangeFileAction:
-    def __init__(self, change: PlannedChange) -> None:
+    def __init__(self, change: FileChange, highlight_diff: bool = False) -> None:
         self._change = change
+        self._highlight_diff = highlight_diff
 
     def __call__(self) -> None:
         message = Text("Updating ")
@@ -111,27 +113,58 @@ class ChangeFileAction:
 
     def display_intent(self) -> None:
         ui.rule(Text(str(self._change.relative_file), style="file.path"))
-        ui.display_diff(self._change.change_diff)
+        # `--patch` displays the full diff, so it can be applied
+        ui.display_diff(
+            diff.shorten_long_lines(self._change.change_diff),
+            highlight=self._highlight_diff,
+        )
 
 
-def update_file_actions(planned_changes: list[PlannedChange]) -> Action:
+def update_file_actions(
+    planned_changes: list[FileChange], highlight_diff: bool = False
+) -> Action:
     return ActionGroup(
         intent_description="Update files",
         execution_description="Updating files",
-        actions=[ChangeFileAction(change) for change in planned_changes],
+        actions=[
+            ChangeFileAction(change, highlight_diff) for change in planned_changes
+        ],
     )
 
 
+class SkipFilesAction:
+    def __init__(self, skipped_files: list[Path]) -> None:
+        self._skipped_files = skipped_files
+
+    def __call__(self) -> None:
+        # the files are left unchanged, so there is nothing to perform
+        pass
+
+    def display_intent(self) -> None:
+        count = len(self._skipped_files)
+        ui.display(
+            Text(
+                f"Skip {count} binary {'file' if count == 1 else 'files'}"
+                " matched by text only file definitions"
+            )
+        )
+
+
+def skip_files_action(skipped_files: list[Path]) -> Action:
+    return SkipFilesAction(skipped_files)
+
+
 class DisplayFilePatchesAction:
-    def __init__(self, changes: list[PlannedChange]) -> None:
+    def __init__(self, changes: list[FileChange], highlight_diff: bool = False) -> None:
         self._changes = changes
+        self._highlight_diff = highlight_diff
 
     def __call__(self) -> None:
         raise ValueError("This action should only every be used to display an intent")
 
     def display_intent(self) -> None:
         for change in self._changes:
-            ui.display_diff(change.change_diff)
+            ui.display_diff(change.change_diff, highlight=self._highlight_diff)
 
 
 class CreateBranchAction:
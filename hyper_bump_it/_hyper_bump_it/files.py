@@ -2,103 +2,596 @@
 Operation on files.
 """
 
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
+from re import Pattern
+from typing import Optional, Union
 
-from . import format_pattern
-from .config import File
-from .error import FileGlobError, PathTraversalError, SearchTextNotFound
+from . import format_pattern, parallel, streaming
+from .config import (
+    DEFAULT_JOB_BACKEND,
+    DEFAULT_JOBS,
+    DEFAULT_STREAMING_THRESHOLD,
+    Discovery,
+    File,
+    JobBackend,
+    Region,
+)
+from .diff import Replacement
+from .error import (
+    FileChangedError,
+    FileEncodingError,
+    FileGlobError,
+    PathTraversalError,
+    RegionNotFoundError,
+    SearchTextNotFound,
+    TooFewMatchesError,
+)
 from .format_pattern import FormatContext, TextFormatter, keys
-from .planned_changes import PlannedChange
+from .planned_changes import (
+    FileChange,
+    PlannedChange,
+    StreamedChange,
+    file_state,
+    is_utf8,
+)
+from .region import Bounds, find_region
+from .run_cache import RunCache
+from .search import Match, MultiPatternSearch
 
 
-def collect_planned_changes(
-    project_root: Path, config: File, formatter: TextFormatter
-) -> list[PlannedChange]:
+def collect_all_planned_changes(
+    project_root: Path,
+    configs: list[File],
+    formatter: TextFormatter,
+    discovery_settings: Discovery,
+    run_cache: RunCache,
+    streaming_threshold: int = DEFAULT_STREAMING_THRESHOLD,
+    skipped_files: Optional[list[Path]] = None,
+    jobs: int = DEFAULT_JOBS,
+    job_backend: JobBackend = DEFAULT_JOB_BACKEND,
+) -> list[FileChange]:
     """
-    Aggregate a collection of changes that would occur across multiple files.
+    Aggregate a collection of changes that would occur for multiple file definitions.
+
+    The project root is only walked once to find the files for all the definitions, and each
+    definition is only formatted once. When multiple definitions match the same file, all of their
+    search patterns are found in a single scan of the contents to produce a single change for the
+    file.
+
+    Files that are at least as large as the streaming threshold and are only matched by a single
+    definition are not loaded into memory. Instead, the file is processed in chunks.
+
+    Definitions that are text only ignore files that appear to be binary, based on the start of
+    the file. A file that is only matched by text only definitions is skipped.
+
+    When more than one job is used, the changes for several files are planned at the same time,
+    using either threads or processes. The result and any error are the same as planning the
+    files one at a time.
 
     :param project_root: Root directory to start looking for files.
-    :param config: Configuration of how the changes should operate.
+    :param configs: Configurations of how the changes should operate.
     :param formatter: Object that converts format patterns into text.
+    :param discovery_settings: Configuration of how files should be discovered.
+    :param run_cache: Contents of files and discovery results that have already been produced.
+    :param streaming_threshold: Size in bytes at which files are processed in chunks.
+    :param skipped_files: If provided, binary files that were skipped are added to this list.
+    :param jobs: Number of files that changes are planned for at the same time.
+    :param job_backend: Whether threads or processes are used when there is more than one job.
     :return: Descriptions of the change that would occur.
     :raises FileGlobError: Glob pattern for selecting files did not find any files.
     :raises SearchTextNotFound: A file did not contain the produced search text.
     """
-    changes = [
-        _planned_change_for(
-            file.resolve(),
-            config.search_format_pattern,
-            config.replace_format_pattern,
-            formatter,
-            project_root,
-            config.file_glob,
+    matched_files = run_cache.find_files(
+        project_root, (config.file_glob for config in configs), discovery_settings
+    )
+    all_matched = _match_definitions(
+        project_root,
+        [(config, matched_files[config.file_glob]) for config in configs],
+        formatter,
+        run_cache,
+    )
+    if job_backend == JobBackend.Process and jobs > 1:
+        results = _plan_in_processes(
+            all_matched, project_root, streaming_threshold, jobs
         )
-        for file in project_root.glob(config.file_glob)
-    ]
-    if not changes:
-        raise FileGlobError(project_root, config.file_glob)
+    else:
+        # Files that are matched by the same definitions share the combined search
+        searches: dict[tuple[_FileMatcher, ...], MultiPatternSearch] = {}
+
+        def plan(matched: _MatchedDefinitions) -> Optional[FileChange]:
+            if _remove_text_only_if_binary(matched, run_cache):
+                return None
+            return _change_for(
+                matched, project_root, run_cache, streaming_threshold, searches
+            )
+
+        # Planning a change mostly waits on reading the file, so files on high latency file
+        # systems benefit from being read at the same time.
+        results = parallel.map_in_order(plan, all_matched, jobs)
+
+    changes: list[FileChange] = []
+    for matched, change in zip(all_matched, results):
+        if change is None:
+            if skipped_files is not None:
+                skipped_files.append(matched.file)
+        else:
+            changes.append(change)
     return changes
 
 
-def _planned_change_for(
-    file: Path,
-    search_pattern: str,
-    replace_pattern: str,
+# A file definition with its patterns already formatted, so the work is done once for each
+# definition instead of once for each matched file. Compared by identity, so a group of matchers
+# can be used as a key.
+@dataclass(frozen=True, eq=False)
+class _FileMatcher:
+    config: File
+    search_text: Optional[str]  # `None` if the search pattern uses the "today" key
+    search_pattern: Pattern[bytes]
+    replace_data: bytes
+
+    @classmethod
+    def compile(cls, config: File, formatter: TextFormatter) -> "_FileMatcher":
+        """
+        Format the patterns of a file definition.
+
+        :param config: File definition to compile.
+        :param formatter: Object that converts format patterns into text.
+        :return: Matcher for the file definition.
+        :raises FormatError: A format pattern was invalid or attempted to use an invalid key.
+        """
+        search_text_maybe = formatter.format(
+            config.search_format_pattern, FormatContext.search
+        )
+        replace_data = formatter.format(
+            config.replace_format_pattern, FormatContext.replace
+        ).encode()
+        if TextFormatter.is_used(keys.TODAY, search_text_maybe):
+            # The first pass formatted all the keys except "today". Now, that is the only key to
+            # convert into a regex pattern, in order to match any date.
+            match_pattern = format_pattern.create_matching_pattern(search_text_maybe)
+            return cls(
+                config,
+                search_text=None,
+                search_pattern=re.compile(match_pattern.pattern.encode()),
+                replace_data=replace_data,
+            )
+        return cls(
+            config,
+            search_text=search_text_maybe,
+            search_pattern=re.compile(re.escape(search_text_maybe.encode())),
+            replace_data=replace_data,
+        )
+
+
+def _match_definitions(
+    project_root: Path,
+    definitions: list[tuple[File, list[Path]]],
     formatter: TextFormatter,
+    run_cache: RunCache,
+) -> list["_MatchedDefinitions"]:
+    # Keyed by the identity of the file, so paths that refer to the same file through a symlink or
+    # hard link are also combined into one change.
+    matched_definitions: dict[tuple[int, int], _MatchedDefinitions] = {}
+    for config, matched_files in definitions:
+        if not matched_files:
+            raise FileGlobError(project_root, config.file_glob)
+        matcher = _FileMatcher.compile(config, formatter)
+        for file in matched_files:
+            resolved_file = run_cache.resolve(file)
+            if not is_contained_within(resolved_file, project_root, run_cache):
+                raise PathTraversalError(project_root, config.file_glob, resolved_file)
+            file_stat = resolved_file.stat()
+            file_id = (file_stat.st_dev, file_stat.st_ino)
+            matched_definitions.setdefault(
+                file_id, _MatchedDefinitions(resolved_file, file_stat.st_size)
+            ).matchers.append(matcher)
+    return list(matched_definitions.values())
+
+
+def _remove_text_only_if_binary(
+    matched: "_MatchedDefinitions", run_cache: RunCache
+) -> bool:
+    # Returns `True` if there are no definitions left for the file
+    if not any(
+        matcher.config.text_only for matcher in matched.matchers
+    ) or not run_cache.is_binary(matched.file):
+        return False
+    matched.matchers = [
+        matcher for matcher in matched.matchers if not matcher.config.text_only
+    ]
+    return not matched.matchers
+
+
+def _change_for(
+    matched: "_MatchedDefinitions",
+    project_root: Path,
+    run_cache: RunCache,
+    streaming_threshold: int,
+    searches: dict[tuple[_FileMatcher, ...], MultiPatternSearch],
+) -> FileChange:
+    streamed_change = _streamed_change_for(matched, project_root, streaming_threshold)
+    if streamed_change is not None:
+        return streamed_change
+    return _planned_change_for(
+        matched, _search_for(matched.matchers, searches), project_root, run_cache
+    )
+
+
+def _search_for(
+    matchers: list[_FileMatcher],
+    searches: dict[tuple[_FileMatcher, ...], MultiPatternSearch],
+) -> Optional[MultiPatternSearch]:
+    # Definitions that are limited to a region are searched separately, only within the region
+    key = tuple(matcher for matcher in matchers if matcher.config.region is None)
+    if not key:
+        return None
+    search = searches.get(key)
+    if search is None:
+        search = MultiPatternSearch([matcher.search_pattern for matcher in key])
+        searches[key] = search
+    return search
+
+
+@dataclass
+class _MatchedDefinitions:
+    file: Path  # absolute resolved path
+    size: int
+    matchers: list[_FileMatcher] = field(default_factory=list)
+
+    @property
+    def replace_data(self) -> list[bytes]:
+        return [matcher.replace_data for matcher in self.matchers]
+
+
+def _streamed_change_for(
+    matched: _MatchedDefinitions, project_root: Path, streaming_threshold: int
+) -> Optional[StreamedChange]:
+    if matched.size < streaming_threshold or len(matched.matchers) != 1:
+        return None
+    file = matched.file
+    matcher = matched.matchers[0]
+    if not matcher.search_text:
+        # Matching the date uses a regular expression, which requires the full contents
+        return None
+    # Taken before reading the file, so writes during planning are also detected
+    state = file_state(file)
+    bounds = None
+    if matcher.config.region is not None:
+        bounds = _streamed_region_bounds(file, matcher.config.region, project_root)
+    try:
+        spans = streaming.scan(
+            file,
+            matcher.search_text.encode(),
+            max_count=matcher.config.max_replacements,
+            bounds=bounds,
+        )
+    except UnicodeDecodeError:
+        raise FileEncodingError(file.relative_to(project_root))
+    _check_found(file, matcher, len(spans), project_root)
+    return StreamedChange(
+        file,
+        project_root,
+        spans=spans,
+        replace_data=matcher.replace_data,
+        state=state,
+    )
+
+
+def _streamed_region_bounds(file: Path, region: Region, project_root: Path) -> Bounds:
+    # The region is found using a memory map, so only the pages that are searched are read
+    with (
+        file.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        bounds = find_region(data, region)
+    if bounds is None:
+        raise RegionNotFoundError(file.relative_to(project_root), region.description)
+    return bounds
+
+
+def _planned_change_for(
+    matched: _MatchedDefinitions,
+    search: Optional[MultiPatternSearch],
     project_root: Path,
-    file_glob: str,
+    run_cache: RunCache,
 ) -> PlannedChange:
-    if not is_contained_within(file, project_root):
-        raise PathTraversalError(project_root, file_glob, file)
+    file = matched.file
+    matchers = matched.matchers
+    if not _may_contain(file, matchers[0], run_cache):
+        raise SearchTextNotFound(
+            file.relative_to(project_root), matchers[0].config.search_format_pattern
+        )
+    # Large files are searched using a memory map, so the rest of the file is not read when the
+    # search stops early.
+    with run_cache.open_contents(file) as data:
+        matches, planned_size = _find_matches(
+            file, matchers, search, data, project_root
+        )
+        return PlannedChange(
+            file,
+            project_root,
+            old_data=data,
+            replacements=_replacements(matches, matched.replace_data),
+            planned_size=planned_size,
+        )
 
-    file_data = file.read_bytes()
-    file_text = file_data.decode()
 
-    replace_text = formatter.format(replace_pattern, FormatContext.replace)
-    search_text_maybe = formatter.format(search_pattern, FormatContext.search)
+def _find_matches(
+    file: Path,
+    matchers: list[_FileMatcher],
+    search: Optional[MultiPatternSearch],
+    data: Union[bytes, mmap.mmap],
+    project_root: Path,
+) -> tuple[list[Match], Optional[int]]:
+    # Returns the matches and the number of bytes at the start of the contents that were needed to
+    # find them, which is `None` if all the contents were needed.
+    matches, all_bounds = _search_all(file, matchers, search, data, project_root)
+    counts = Counter(match.pattern_index for match in matches)
+    planned_size = _planned_size(matchers, matches, counts, all_bounds)
+    # Like the streamed search, the encoding is only checked up to where the search stopped
+    if not is_utf8(data, planned_size):
+        raise FileEncodingError(file.relative_to(project_root))
+    for index, matcher in enumerate(matchers):
+        found = counts[index]
+        if found < matcher.config.min_replacements:
+            # Text that overlaps the text found for another definition (such as two definitions
+            # with the same search pattern) is still considered to be found.
+            start, end = all_bounds.get(index, (0, len(data)))
+            occurrences = matcher.search_pattern.finditer(data, start, end)
+            found = max(
+                found,
+                sum(1 for _ in islice(occurrences, matcher.config.min_replacements)),
+            )
+        _check_found(file, matcher, found, project_root)
+    return matches, planned_size
+
 
-    if TextFormatter.is_used(keys.TODAY, search_text_maybe):
-        # we need to convert the search text into a regex in order to match any date
-        updated_text, no_replacement = _today_replace(
-            search_text_maybe, file_text, replace_text
+def _planned_size(
+    matchers: list[_FileMatcher],
+    matches: list[Match],
+    counts: Counter[int],
+    all_bounds: dict[int, Bounds],
+) -> Optional[int]:
+    ends = {match.pattern_index: match.end for match in matches}
+    planned_size = 0
+    for index, matcher in enumerate(matchers):
+        if counts[index] == matcher.config.max_replacements:
+            # the search for the definition stopped at its last match
+            planned_size = max(planned_size, ends[index])
+        elif index in all_bounds:
+            planned_size = max(planned_size, all_bounds[index][1])
+        else:
+            return None
+    return planned_size
+
+
+def _search_all(
+    file: Path,
+    matchers: list[_FileMatcher],
+    search: Optional[MultiPatternSearch],
+    data: Union[bytes, mmap.mmap],
+    project_root: Path,
+) -> tuple[list[Match], dict[int, Bounds]]:
+    # Returns the matches and the region of each definition that is limited to a region
+    unscoped = [
+        index for index, matcher in enumerate(matchers) if matcher.config.region is None
+    ]
+    matches: list[Match] = []
+    if search is not None:
+        # All the definitions that search the entire file are searched for in a single scan of
+        # the contents, so the file costs the same no matter how many definitions match it.
+        matches = search.find_all(
+            data, [matchers[index].config.max_replacements for index in unscoped]
         )
-    else:
-        no_replacement = search_text_maybe not in file_text
-        updated_text = file_text.replace(search_text_maybe, replace_text)
+    if len(unscoped) == len(matchers):
+        return matches, {}
+
+    matches = [
+        Match(match.start, match.end, unscoped[match.pattern_index])
+        for match in matches
+    ]
+    all_bounds: dict[int, Bounds] = {}
+    for index, matcher in enumerate(matchers):
+        region = matcher.config.region
+        if region is None:
+            continue
+        bounds = find_region(data, region)
+        if bounds is None:
+            raise RegionNotFoundError(
+                file.relative_to(project_root), region.description
+            )
+        all_bounds[index] = bounds
+        found = matcher.search_pattern.finditer(data, *bounds)
+        matches.extend(
+            Match(match.start(), match.end(), index)
+            for match in islice(found, matcher.config.max_replacements)
+        )
+    return _without_overlaps(matches), all_bounds
+
+
+def _without_overlaps(matches: list[Match]) -> list[Match]:
+    # Matches from separate searches can overlap. Like the combined search, the earliest match is
+    # used, then the match for the definition that was given first.
+    result = []
+    end = 0
+    for match in sorted(matches, key=lambda m: (m.start, m.pattern_index)):
+        if match.start >= end:
+            result.append(match)
+            end = match.end
+    return result
+
+
+def _check_found(
+    file: Path, matcher: _FileMatcher, found: int, project_root: Path
+) -> None:
+    if not found:
+        raise SearchTextNotFound(
+            file.relative_to(project_root), matcher.config.search_format_pattern
+        )
+    if found < matcher.config.min_replacements:
+        raise TooFewMatchesError(
+            file.relative_to(project_root),
+            matcher.config.search_format_pattern,
+            found,
+            matcher.config.min_replacements,
+        )
+
+
+def _plan_in_processes(
+    all_matched: list[_MatchedDefinitions],
+    project_root: Path,
+    streaming_threshold: int,
+    jobs: int,
+) -> list[Optional[FileChange]]:
+    # Searching with a regular expression and producing the diff hold the GIL, so that work is
+    # done by other processes. The changes only hold the replacements and the diff, so the
+    # contents of the files are not sent back.
+    tasks = [(matched, project_root, streaming_threshold) for matched in all_matched]
+    return parallel.map_in_order(_plan_in_worker, tasks, jobs, JobBackend.Process)
+
+
+def _plan_in_worker(
+    task: tuple[_MatchedDefinitions, Path, int],
+) -> Optional[FileChange]:
+    matched, project_root, streaming_threshold = task
+    run_cache = RunCache()
+    if _remove_text_only_if_binary(matched, run_cache):
+        return None
+    streamed_change = _streamed_change_for(matched, project_root, streaming_threshold)
+    if streamed_change is not None:
+        # the diff is cached by the instance, so it is sent back with the change
+        _ = streamed_change.change_diff
+        return streamed_change
+    change = _planned_change_for(
+        matched, _search_for(matched.matchers, {}), project_root, run_cache
+    )
+    # the diff is held by the instance, so it is sent back with the change
+    _ = change.change_diff
+    return change
+
+
+def _may_contain(file: Path, matcher: _FileMatcher, run_cache: RunCache) -> bool:
+    if matcher.search_text is None:
+        # the search text is still a format pattern, so it can't be searched for directly
+        return True
+    # Searching the encoded contents avoids decoding files that don't contain the search text
+    return run_cache.contains(file, matcher.search_text)
+
+
+def _replacements(matches: list[Match], replace_data: list[bytes]) -> list[Replacement]:
+    return [
+        (match.start, match.end - match.start, replace_data[match.pattern_index])
+        for match in matches
+    ]
 
-    if no_replacement:
-        raise SearchTextNotFound(file.relative_to(project_root), search_pattern)
 
+def combine_changes(
+    change: FileChange, other_change: PlannedChange, project_root: Path
+) -> PlannedChange:
+    """
+    Combine two changes to the same file into a single change, so the file is only written once.
+    Writing the changes separately would fail, since the first write modifies the contents the
+    other change was planned for.
+
+    Where the replacements of the changes overlap, only the replacements of the first change are
+    made.
+
+    :param change: Change to the file.
+    :param other_change: Another change to the same file, with the current contents held in
+        memory.
+    :param project_root: Absolute resolved path of the project root.
+    :return: Change that makes the replacements of both changes.
+    :raises OSError: The file could not be read.
+    :raises FileChangedError: The changes were not planned for the same contents.
+    """
+    old_data = other_change.old_data
+    if isinstance(change, StreamedChange):
+        if change.file.read_bytes() != old_data:
+            raise FileChangedError(change.relative_file)
+        replacements = [
+            (start, end - start, change.replace_data) for start, end in change.spans
+        ]
+    elif not change.planned_for(old_data):
+        raise FileChangedError(change.relative_file)
+    else:
+        replacements = change.replacements
+    replacements = sorted(
+        [
+            *replacements,
+            *(
+                replacement
+                for replacement in other_change.replacements
+                if not any(
+                    _overlaps(replacement, existing) for existing in replacements
+                )
+            ),
+        ],
+        key=lambda replacement: (replacement[0], replacement[1]),
+    )
     return PlannedChange(
-        file,
+        change.file,
         project_root,
-        old_content=file_text,
-        new_content=updated_text,
-        newline=PlannedChange.detect_line_ending(file_data),
+        old_data=old_data,
+        replacements=replacements,
+        keep_old_data=True,
     )
 
 
-def _today_replace(
-    partial_format_pattern: str,
-    file_text: str,
-    replace_text: str,
-) -> tuple[str, bool]:
-    # The first pass formatted all the keys except "today". Now, that is the only key to convert
-    # into a regex pattern.
-    match_pattern = format_pattern.create_matching_pattern(partial_format_pattern)
-    updated_text, replace_count = match_pattern.subn(replace_text, file_text)
-    return updated_text, replace_count == 0
+def _overlaps(replacement: Replacement, other: Replacement) -> bool:
+    # Text inserted at the same position as other text would be ambiguous, so it also overlaps
+    start, length, _ = replacement
+    other_start, other_length, _ = other
+    return start == other_start or (
+        start < other_start + other_length and other_start < start + length
+    )
 
 
-def perform_change(change: PlannedChange) -> None:
+def perform_change(change: FileChange) -> None:
     try:
-        with change.file.open("w", newline=change.newline) as f:
-            f.write(change.new_content)
+        if isinstance(change, StreamedChange):
+            _perform_streamed_change(change)
+            return
+        # Opening for update (instead of writing) ensures that the file already exists
+        with change.file.open("r+b") as f:
+            f.write(change.new_data)
+            f.truncate()
     except FileNotFoundError:
         raise ValueError(
             f"Given file '{change.file}' does not exist. PlannedChange is not valid."
         )
 
 
-def is_contained_within(file: Path, project_root: Path) -> bool:
-    return file.resolve().is_relative_to(project_root.resolve())
+def _perform_streamed_change(change: StreamedChange) -> None:
+    # The new contents are written to a temporary file next to the original, so the original is
+    # only replaced once all the new contents have been written.
+    with (
+        change.file.open("rb") as source,
+        tempfile.NamedTemporaryFile(
+            dir=change.file.parent, prefix=f".{change.file.name}.", delete=False
+        ) as sink,
+    ):
+        try:
+            streaming.replace_spans(source, sink, change.spans, change.replace_data)
+            # The file is not locked, so it could have been written since the change was planned
+            change.check_state()
+        except BaseException:
+            sink.close()
+            os.unlink(sink.name)
+            raise
+    shutil.copymode(change.file, sink.name)
+    os.replace(sink.name, change.file)
+
+
+def is_contained_within(
+    file: Path, project_root: Path, run_cache: Optional[RunCache] = None
+) -> bool:
+    resolve = Path.resolve if run_cache is None else run_cache.resolve
+    return resolve(file).is_relative_to(resolve(project_root))
@@ -0,0 +1,82 @@
+"""
+Perform the same work for several items at the same time.
+
+The results are always produced in the order of the items, so running the work in parallel produces
+the same result (or error) as performing the work for one item at a time.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import (
+    CancelledError,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import TypeVar
+
+from .config import JobBackend
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def map_in_order(
+    function: Callable[[_T], _R],
+    items: list[_T],
+    jobs: int,
+    backend: JobBackend = JobBackend.Thread,
+) -> list[_R]:
+    """
+    Call a function for each item, using up to the given number of jobs at the same time.
+
+    If the function raises an error for any of the items, the error for the first of those items
+    is raised. Items after the failed item are not started, since their results are not needed.
+
+    :param function: Function to call. When using processes, the function and the items must be
+        able to be pickled.
+    :param items: Items to call the function with.
+    :param jobs: Maximum number of items to perform the work for at the same time.
+    :param backend: Whether the work is performed by threads or processes.
+    :return: Result of the function for each of the items, in the same order as the items.
+    """
+    if jobs <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    if backend == JobBackend.Process:
+        # Processes can't share whether an item has failed, so only the items that have not
+        # started yet are skipped once the failure is reached.
+        with ProcessPoolExecutor(max_workers=jobs) as process_executor:
+            return _results_in_order(
+                [process_executor.submit(function, item) for item in items]
+            )
+
+    first_failure = len(items)
+    lock = threading.Lock()
+
+    def call(index: int, item: _T) -> _R:
+        nonlocal first_failure
+        if index > first_failure:
+            raise CancelledError()
+        try:
+            return function(item)
+        except BaseException:
+            with lock:
+                first_failure = min(first_failure, index)
+            raise
+
+    with ThreadPoolExecutor(max_workers=jobs) as thread_executor:
+        return _results_in_order(
+            [
+                thread_executor.submit(call, index, item)
+                for index, item in enumerate(items)
+            ]
+        )
+
+
+def _results_in_order(futures: list[Future[_R]]) -> list[_R]:
+    try:
+        return [future.result() for future in futures]
+    finally:
+        # once an error is raised, the results of any remaining work are not needed
+        for future in futures:
+            future.cancel()
@@ -2,57 +2,323 @@
 Low level primitives for file interactions.
 """
 
-import difflib
+import codecs
+import hashlib
+import mmap
+import os
 from dataclasses import InitVar, dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-_LINE_FEED = b"\n"[0]
-_CARRIAGE_RETURN = b"\r"[0]
+from . import streaming
+from .diff import Replacement, apply_replacements, replacement_diff
+from .error import FileChangedError
+
+
+@dataclass(frozen=True)
+class ContentProfile:
+    bom: bool  # starts with the UTF-8 byte order mark
+    is_utf8: bool
+
+    @classmethod
+    def detect(cls, data: Union[bytes, mmap.mmap]) -> "ContentProfile":
+        """
+        Determine how the contents of a file are encoded.
+
+        The content is checked in chunks, so the content of a large file is never decoded all at
+        once.
+
+        :param data: Binary content of the file.
+        :return: Encoding information of the content.
+        """
+        return cls(
+            bom=data[: len(codecs.BOM_UTF8)] == codecs.BOM_UTF8, is_utf8=is_utf8(data)
+        )
+
+
+def is_utf8(data: Union[bytes, mmap.mmap], end: Optional[int] = None) -> bool:
+    """
+    Check if some binary content is valid UTF-8, one chunk at a time.
+
+    :param data: Binary content to check.
+    :param end: Only check the content before this offset. A multibyte character that is cut off
+        by the offset is not considered to be invalid. `None` to check all the content.
+    :return: `True` if the content is valid UTF-8.
+    """
+    size = len(data) if end is None else min(end, len(data))
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for start in range(0, size, streaming.CHUNK_SIZE):
+            chunk_end = min(start + streaming.CHUNK_SIZE, size)
+            chunk = data[start:chunk_end]
+            # ASCII can't complete a character that was cut off by the previous chunk
+            if not chunk.isascii() or decoder.getstate()[0]:
+                decoder.decode(chunk)
+        decoder.decode(b"", final=size == len(data))
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def looks_binary(sample: bytes, complete: bool) -> bool:
+    """
+    Guess if the contents of a file are binary data instead of text, based on a sample.
+
+    :param sample: Data from the start of the file.
+    :param complete: The sample contains the entire file. Otherwise, a multibyte character that
+        is cut off at the end of the sample is not considered to be invalid.
+    :return: `True` if the sample contains a NUL byte or is not valid UTF-8.
+    """
+    if b"\0" in sample:
+        return True
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=complete)
+    except UnicodeDecodeError:
+        return True
+    return False
 
 
-@dataclass
 class PlannedChange:
+    """
+    Change to the contents of a file, kept as the replacements to make.
+
+    The contents of the file are not held in memory. They are read again when they are needed to
+    produce the diff or the new contents, and verified against a hash of the contents the change
+    was planned for.
+    """
+
+    __slots__ = (
+        "file",
+        "relative_file",
+        "digest",
+        "replacements",
+        "_planned_size",
+        "_old_data",
+        "_change_diff",
+    )
+
+    def __init__(
+        self,
+        file: Path,
+        project_root: Path,
+        old_data: Union[bytes, mmap.mmap],
+        replacements: list[Replacement],
+        keep_old_data: bool = False,
+        change_diff: Optional[str] = None,
+        planned_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param file: Absolute resolved path of the file.
+        :param project_root: Absolute resolved path of the project root.
+        :param old_data: Current contents of the file.
+        :param replacements: Sorted, non-overlapping replacements to make.
+        :param keep_old_data: Hold the current contents in memory instead of reading the file
+            again. Used when the contents don't come from the file.
+        :param change_diff: Unified diff text for the change, if it has already been produced.
+        :param planned_size: Number of bytes at the start of the contents that the change was
+            planned from, such as when the search stopped early. Only those bytes are verified
+            when the file is read again. `None` if the change was planned from all the contents.
+        """
+        self.file = file  # absolute resolved path
+        self.relative_file = file.relative_to(project_root)
+        self.digest = _digest(old_data, planned_size)
+        self.replacements = replacements
+        self._planned_size = planned_size
+        self._old_data = bytes(old_data) if keep_old_data else None
+        self._change_diff = change_diff
+
+    @classmethod
+    def from_data(
+        cls,
+        file: Path,
+        project_root: Path,
+        old_data: bytes,
+        new_data: bytes,
+    ) -> "PlannedChange":
+        """
+        Create an instance from the binary contents of the file before and after the change.
+
+        The given contents are held in memory, since they may not match the file.
+
+        :param file: Absolute resolved path of the file.
+        :param project_root: Absolute resolved path of the project root.
+        :param old_data: Current contents of the file.
+        :param new_data: Contents of the file after the change.
+        :return: Representation of the change.
+        """
+        # A single replacement covers everything between the common prefix and suffix
+        prefix = len(os.path.commonprefix([old_data, new_data]))
+        suffix = len(
+            os.path.commonprefix([old_data[prefix:][::-1], new_data[prefix:][::-1]])
+        )
+        new_end = len(new_data) - suffix
+        replacements = (
+            []
+            if old_data == new_data
+            else [(prefix, len(old_data) - suffix - prefix, new_data[prefix:new_end])]
+        )
+        return cls(
+            file,
+            project_root,
+            old_data=old_data,
+            replacements=replacements,
+            keep_old_data=True,
+        )
+
+    @classmethod
+    def from_text(
+        cls,
+        file: Path,
+        project_root: Path,
+        old_content: str,
+        new_content: str,
+    ) -> "PlannedChange":
+        """
+        Create an instance from decoded contents of the file.
+
+        :param file: Absolute resolved path of the file.
+        :param project_root: Absolute resolved path of the project root.
+        :param old_content: Current contents of the file.
+        :param new_content: Contents of the file after the change.
+        :return: Representation of the change.
+        """
+        return cls.from_data(
+            file,
+            project_root,
+            old_data=old_content.encode(),
+            new_data=new_content.encode(),
+        )
+
+    @property
+    def old_data(self) -> bytes:
+        """
+        Current contents of the file.
+
+        :raises OSError: The file could not be read.
+        :raises FileChangedError: The file no longer has the contents the change was planned for.
+        """
+        if self._old_data is not None:
+            return self._old_data
+        data = self.file.read_bytes()
+        if not self.planned_for(data):
+            raise FileChangedError(self.relative_file)
+        return data
+
+    def planned_for(self, data: bytes) -> bool:
+        """
+        Check if the change was planned for some contents.
+
+        :param data: Contents to check.
+        :return: `True` if the contents are the same as the contents the change was planned for.
+        """
+        return _digest(data, self._planned_size) == self.digest
+
+    @property
+    def new_data(self) -> bytes:
+        """
+        Contents of the file after the change.
+        """
+        return apply_replacements(self.old_data, self.replacements)
+
+    @property
+    def old_content(self) -> str:
+        """
+        Current contents of the file as text.
+        """
+        return self.old_data.decode()
+
+    @property
+    def new_content(self) -> str:
+        """
+        Contents of the file after the change as text.
+        """
+        return self.new_data.decode()
+
+    @property
+    def change_diff(self) -> str:
+        """
+        Unified diff text for the intended change.
+        """
+        if self._change_diff is None:
+            self._change_diff = replacement_diff(
+                str(self.relative_file), self.old_data, self.replacements
+            )
+        return self._change_diff
+
+    def __eq__(self, other: object) -> bool:
+        # Changes that produce the same contents from the same contents are equal, no matter how
+        # the replacements are split up.
+        if not isinstance(other, PlannedChange):
+            return NotImplemented
+        return (self.file, self.relative_file, self.digest, self._planned_size) == (
+            other.file,
+            other.relative_file,
+            other.digest,
+            other._planned_size,
+        ) and (
+            self.replacements == other.replacements or self.new_data == other.new_data
+        )
+
+    def __repr__(self) -> str:
+        return f"PlannedChange(file={self.file!r}, replacements={self.replacements!r})"
+
+
+def _digest(data: Union[bytes, mmap.mmap], size: Optional[int] = None) -> bytes:
+    # only the start of the data is used, if the size is given
+    return hashlib.blake2b(
+        data if size is None else data[:size], digest_size=16
+    ).digest()
+
+
+FileState = tuple[int, int]  # size and modification time of a file
+
+
+def file_state(file: Path) -> FileState:
+    """
+    Determine the state of a file that changes whenever its contents are written.
+
+    :param file: File to inspect.
+    :return: Size and modification time of the file.
+    :raises OSError: The file could not be inspected.
+    """
+    file_stat = file.stat()
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
+@dataclass
+class StreamedChange:
     file: Path  # absolute resolved path
     project_root: InitVar[Path]  # absolute resolved path
     relative_file: Path = field(init=False)
-    old_content: str
-    new_content: str
-    newline: Optional[str]
+    spans: list[streaming.Span]  # locations in the file to replace
+    replace_data: bytes
+    # state of the file the change was planned for, `None` to not check it
+    state: Optional[FileState] = field(default=None, compare=False)
 
     def __post_init__(self, project_root: Path) -> None:
         self.relative_file = self.file.relative_to(project_root)
 
+    def check_state(self) -> None:
+        """
+        Verify that the file has not been written since the change was planned.
+
+        :raises OSError: The file could not be inspected.
+        :raises FileChangedError: The size or modification time of the file is different.
+        """
+        if self.state is not None and file_state(self.file) != self.state:
+            raise FileChangedError(self.relative_file)
+
     @cached_property
     def change_diff(self) -> str:
         """
         Unified diff text for the intended change.
         """
-        relative_file_str = str(self.relative_file)
-        return "".join(
-            difflib.unified_diff(
-                self.old_content.splitlines(keepends=True),
-                self.new_content.splitlines(keepends=True),
-                fromfile=relative_file_str,
-                tofile=relative_file_str,
-            )
+        return streaming.unified_diff(
+            self.file, str(self.relative_file), self.spans, self.replace_data
         )
 
-    @staticmethod
-    def detect_line_ending(data: bytes) -> Optional[str]:
-        """
-        Attempt to determine the line ending used within a file.
 
-        :param data: Binary content of the file.
-        :return: New line character sequence for the file. `None` if no new line characters are
-            found.
-        """
-        cr_found = False
-        for byte in data:
-            if byte == _CARRIAGE_RETURN:
-                cr_found = True
-            elif byte == _LINE_FEED:
-                return "\r\n" if cr_found else "\n"
-        # no trailing new line
-        return None
+FileChange = Union[PlannedChange, StreamedChange]
@@ -0,0 +1,119 @@
+"""
+Find the part of a file that a file definition limits its search to.
+
+The region is found without decoding the file, so it can be found in a memory map of a file that
+is too large to read into memory.
+"""
+
+import mmap
+import re
+from typing import Optional, Union
+
+from .config import Region
+
+Bounds = tuple[int, int]  # start and end offset of the region
+
+# A TOML table (or array of tables) header or an INI section header, with an optional comment. The
+# name can contain quoted keys, but not commas or brackets outside of them, so a line of a
+# multi-line array like `[1, 2]` is not a header.
+_SECTION_HEADER = re.compile(
+    rb"^[ \t]*\[\[?((?:[^\[\]\n,\"']|\"[^\"\n]*\"|'[^'\n]*')*)\]\]?[ \t]*(?:[#;][^\n]*)?\r?$",
+    re.MULTILINE,
+)
+# Brackets of array values, skipping strings and comments that could contain brackets
+_BRACKET_TOKEN = re.compile(rb"\"(?:[^\"\\\n]|\\.)*\"|'[^'\n]*'|[#;][^\n]*|[\[\]]")
+
+
+def find_region(data: Union[bytes, mmap.mmap], region: Region) -> Optional[Bounds]:
+    """
+    Find where a region is located within the contents of a file.
+
+    :param data: Contents of the file.
+    :param region: Region to find.
+    :return: Location of the region. `None` if the region is not in the file.
+    """
+    if region.section is not None:
+        return _section_bounds(data, region.section.encode())
+    if region.start_anchor is not None or region.end_anchor is not None:
+        return _anchor_bounds(
+            data,
+            None if region.start_anchor is None else region.start_anchor.encode(),
+            None if region.end_anchor is None else region.end_anchor.encode(),
+        )
+    return _line_bounds(data, region.start_line or 1, region.end_line)
+
+
+def _line_bounds(
+    data: Union[bytes, mmap.mmap], start_line: int, end_line: Optional[int]
+) -> Optional[Bounds]:
+    start = _skip_lines(data, 0, start_line - 1)
+    if start is None:
+        return None
+    end = (
+        None
+        if end_line is None
+        else _skip_lines(data, start, end_line - start_line + 1)
+    )
+    return start, len(data) if end is None else end
+
+
+def _skip_lines(
+    data: Union[bytes, mmap.mmap], position: int, count: int
+) -> Optional[int]:
+    # Returns the position of the start of the line that is `count` lines after `position`
+    for _ in range(count):
+        line_feed = data.find(b"\n", position)
+        if line_feed == -1:
+            return None
+        position = line_feed + 1
+    return position
+
+
+def _anchor_bounds(
+    data: Union[bytes, mmap.mmap],
+    start_anchor: Optional[bytes],
+    end_anchor: Optional[bytes],
+) -> Optional[Bounds]:
+    start = 0
+    if start_anchor is not None:
+        anchor_start = data.find(start_anchor)
+        if anchor_start == -1:
+            return None
+        start = anchor_start + len(start_anchor)
+    end = len(data)
+    if end_anchor is not None:
+        end = data.find(end_anchor, start)
+        if end == -1:
+            return None
+    return start, end
+
+
+def _section_bounds(data: Union[bytes, mmap.mmap], section: bytes) -> Optional[Bounds]:
+    start = None
+    depth = 0  # number of array values that are open
+    position = 0
+    for header in _SECTION_HEADER.finditer(data):
+        depth = _bracket_depth(data, position, header.start(), depth)
+        position = header.end()
+        if depth:
+            # a line within a multi-line array value, such as `["a"]`
+            depth = _bracket_depth(data, header.start(), header.end(), depth)
+            continue
+        if start is not None:
+            # the section ends at the next header, including the header of a sub-table
+            return start, header.start()
+        if header.group(1).strip() == section:
+            start = header.end()
+    return None if start is None else (start, len(data))
+
+
+def _bracket_depth(
+    data: Union[bytes, mmap.mmap], start: int, end: int, depth: int
+) -> int:
+    # Returns the number of array values that are open at the end, after starting with `depth`
+    for token in _BRACKET_TOKEN.finditer(data, start, end):
+        if token.group() == b"[":
+            depth += 1
+        elif token.group() == b"]":
+            depth = max(depth - 1, 0)
+    return depth
@@ -0,0 +1,216 @@
+"""
+Contents of files and file discovery results that are shared across a single invocation.
+
+Files are not expected to change while the program is deciding what to do, so each file only needs
+to be read and decoded once, and each glob pattern only needs to be discovered once. The different
+stages (reading the configuration, parsing the keystone file, planning the changes) go through a
+shared instance so they don't repeat that work.
+"""
+
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from .planned_changes import ContentProfile, looks_binary
+
+if TYPE_CHECKING:
+    from .config import Discovery
+
+# Files at least this large are searched using a memory map before reading them.
+MMAP_THRESHOLD = 1024 * 1024
+# Number of bytes at the start of a file that are inspected to decide if the file is binary.
+SNIFF_SIZE = 8 * 1024
+
+
+class RunCache:
+    def __init__(self) -> None:
+        """
+        Initialize an instance.
+        """
+        self._matched_files: dict[
+            tuple[Path, str, Optional["Discovery"]], list[Path]
+        ] = {}
+        self._resolved: dict[Path, Path] = {}
+        self._data: dict[Path, bytes] = {}
+        self._text: dict[Path, str] = {}
+        self._profiles: dict[Path, ContentProfile] = {}
+
+    def find_files(
+        self,
+        project_root: Path,
+        file_globs: Iterable[str],
+        settings: Optional["Discovery"] = None,
+    ) -> dict[str, list[Path]]:
+        """
+        Find the files that match each of the given glob patterns. Only the glob patterns that
+        have not already been discovered are used to find files.
+
+        :param project_root: Root directory to start looking for files.
+        :param file_globs: Glob patterns relative to the project root.
+        :param settings: Configuration of how files should be discovered.
+        :return: Sorted list of matched files for each of the glob patterns. A glob pattern that
+            did not match any files will map to an empty list.
+        :raises NoRepositoryError: Discovery uses the git index, but the project root is not a
+            git repository.
+        """
+        unique_globs = list(dict.fromkeys(file_globs))
+        missing_globs = [
+            file_glob
+            for file_glob in unique_globs
+            if (project_root, file_glob, settings) not in self._matched_files
+        ]
+        if missing_globs:
+            from . import discovery  # prevents circular import
+
+            found = discovery.find_files(project_root, missing_globs, settings)
+            for file_glob, matched_files in found.items():
+                self._matched_files[(project_root, file_glob, settings)] = matched_files
+        return {
+            file_glob: list(self._matched_files[(project_root, file_glob, settings)])
+            for file_glob in unique_globs
+        }
+
+    def resolve(self, path: Path) -> Path:
+        """
+        Make a path absolute, resolving any symlinks.
+
+        Resolved directories are remembered, so resolving the other entries of the same directory
+        only needs to check if the entry itself is a symlink.
+
+        :param path: Path to resolve.
+        :return: Resolved path.
+        """
+        resolved = self._resolved.get(path)
+        if resolved is None:
+            if path.name in ("", ".."):
+                # The root of the file system, the current directory, or a parent reference
+                resolved = path.resolve()
+            else:
+                resolved = self.resolve(path.parent) / path.name
+                if resolved.is_symlink():
+                    resolved = resolved.resolve()
+            self._resolved[path] = resolved
+        return resolved
+
+    def contains(self, file: Path, text: str) -> bool:
+        """
+        Check if a file contains some text without decoding the file.
+
+        Large files that have not been read yet are searched using a memory map, so their contents
+        are only read into memory if they are needed later.
+
+        :param file: File to search.
+        :param text: Text to search for.
+        :return: `True` if the UTF-8 encoding of the text is in the file.
+        :raises OSError: The file could not be read.
+        """
+        with self.open_contents(file) as data:
+            return data.find(text.encode()) != -1
+
+    @contextmanager
+    def open_contents(self, file: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+        """
+        Provide the contents of a file, without reading a large file into memory.
+
+        Large files that have not been read yet are provided as a memory map, so only the parts of
+        the file that are used are read. Other files are read, and their contents are kept. The
+        provided contents are only valid while in the context.
+
+        :param file: File to provide the contents of.
+        :raises OSError: The file could not be read.
+        """
+        key = self.resolve(file)
+        data = self._data.get(key)
+        if data is not None:
+            yield data
+            return
+        with key.open("rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                data = f.read()
+                self._data[key] = data
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield mapped
+                    return
+        yield data
+
+    def is_binary(self, file: Path) -> bool:
+        """
+        Guess if a file contains binary data, without reading the entire file.
+
+        :param file: File to inspect.
+        :return: `True` if the start of the file does not look like UTF-8 text.
+        :raises OSError: The file could not be read.
+        """
+        key = self.resolve(file)
+        data = self._data.get(key)
+        if data is None:
+            with key.open("rb") as f:
+                data = f.read(SNIFF_SIZE + 1)
+        sample = data[:SNIFF_SIZE]
+        return looks_binary(sample, complete=len(data) == len(sample))
+
+    def read_bytes(self, file: Path) -> bytes:
+        """
+        Read the contents of a file.
+
+        :param file: File to read.
+        :return: Contents of the file.
+        :raises OSError: The file could not be read.
+        """
+        key = self.resolve(file)
+        data = self._data.get(key)
+        if data is None:
+            data = key.read_bytes()
+            self._data[key] = data
+        return data
+
+    def profile(self, file: Path) -> ContentProfile:
+        """
+        Determine how the contents of a file are encoded.
+
+        Like searching, a large file that has not been read yet is inspected using a memory map,
+        so inspecting it doesn't read its contents into memory.
+
+        :param file: File to inspect.
+        :return: Encoding information of the file.
+        :raises OSError: The file could not be read.
+        """
+        key = self.resolve(file)
+        profile = self._profiles.get(key)
+        if profile is None:
+            with self.open_contents(key) as data:
+                profile = ContentProfile.detect(data)
+            self._profiles[key] = profile
+        return profile
+
+    def release_contents(self) -> None:
+        """
+        Stop holding the contents of the files that have been read, once they are no longer
+        needed. Everything else that was determined about the files is kept.
+        """
+        self._data.clear()
+        self._text.clear()
+
+    def read_text(self, file: Path, universal_newlines: bool = False) -> str:
+        """
+        Read the contents of a file as UTF-8 text.
+
+        :param file: File to read.
+        :param universal_newlines: Convert all line endings to "\\n", like reading the file in
+            text mode. Otherwise, line endings are not translated.
+        :return: Decoded contents of the file.
+        :raises OSError: The file could not be read.
+        :raises UnicodeDecodeError: The file does not contain UTF-8 text.
+        """
+        key = self.resolve(file)
+        text = self._text.get(key)
+        if text is None:
+            text = self.read_bytes(key).decode()
+            self._text[key] = text
+        if universal_newlines and "\r" in text:
+            return text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
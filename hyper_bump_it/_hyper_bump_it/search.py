@@ -0,0 +1,104 @@
+"""
+Find the occurrences of several search patterns using a single scan of the contents of a file.
+"""
+
+import mmap
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from re import Pattern
+from typing import Optional, Union, cast
+
+# The same group name can be used by more than one pattern, which is not allowed within a single
+# regular expression. So, the named groups are converted into unnamed groups.
+_NAMED_GROUP_START = re.compile(rb"\(\?P<\w+>")
+
+
+@dataclass(frozen=True)
+class Match:
+    start: int
+    end: int
+    # position of the pattern that matched within the searched patterns
+    pattern_index: int
+
+
+class MultiPatternSearch:
+    def __init__(self, patterns: list[Pattern[bytes]]) -> None:
+        """
+        Initialize an instance.
+
+        The patterns are combined into a single regular expression, with each pattern as one of
+        the alternatives. Only the text of each pattern is used, so any flags are ignored.
+
+        :param patterns: Patterns to search for. Must not be empty.
+        """
+        self._patterns = patterns
+        # combined expression for each group of patterns that has been searched for
+        self._combined: dict[tuple[int, ...], tuple[Pattern[bytes], dict[int, int]]] = (
+            {}
+        )
+
+    def find_all(
+        self,
+        data: Union[bytes, mmap.mmap],
+        max_counts: Optional[Sequence[Optional[int]]] = None,
+    ) -> list[Match]:
+        """
+        Find all the occurrences of the patterns.
+
+        Occurrences are found from the start of the data and never overlap. When more than one
+        pattern matches at the same position, the pattern that was given first is used. Once a
+        pattern has reached its maximum, the rest of the data is searched without it, so its
+        occurrences don't hide overlapping occurrences of the other patterns.
+
+        :param data: Data to search.
+        :param max_counts: Maximum number of occurrences to find for each of the patterns. `None`
+            for a pattern (or for all of them) finds every occurrence. The scan stops as soon as
+            every pattern has reached its maximum.
+        :return: Each occurrence, ordered by position.
+        """
+        remaining: list[Optional[int]] = (
+            [None] * len(self._patterns) if max_counts is None else list(max_counts)
+        )
+        active = list(range(len(self._patterns)))
+        matches: list[Match] = []
+        position = 0
+        while active:
+            pattern, pattern_indexes = self._pattern_for(tuple(active))
+            for match in pattern.finditer(data, position):
+                # The outermost group is the last group to be closed, so it is always the last
+                # index
+                index = pattern_indexes[cast(int, match.lastindex)]
+                matches.append(Match(match.start(), match.end(), index))
+                count = remaining[index]
+                if count is None:
+                    continue
+                remaining[index] = count - 1
+                if count == 1:
+                    active.remove(index)
+                    position = match.end()
+                    break
+            else:
+                break
+        return matches
+
+    def _pattern_for(
+        self, indexes: tuple[int, ...]
+    ) -> tuple[Pattern[bytes], dict[int, int]]:
+        # Returns the combined expression and the index of the pattern for the number of the group
+        # surrounding each pattern
+        combined = self._combined.get(indexes)
+        if combined is None:
+            pattern_indexes: dict[int, int] = {}
+            alternatives = []
+            group = 1
+            for index in indexes:
+                pattern = self._patterns[index]
+                pattern_indexes[group] = index
+                alternatives.append(
+                    b"(" + _NAMED_GROUP_START.sub(b"(", pattern.pattern) + b")"
+                )
+                group += pattern.groups + 1
+            combined = (re.compile(b"|".join(alternatives)), pattern_indexes)
+            self._combined[indexes] = combined
+        return combined
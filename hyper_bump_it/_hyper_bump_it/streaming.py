@@ -0,0 +1,314 @@
+"""
+Replace text in files that are too large to hold in memory.
+
+The file is processed in fixed size chunks. The location of each occurrence of the search text is
+found during planning, so that the diff can be produced and the replacement can be performed later
+without needing to search the file again.
+"""
+
+import codecs
+import difflib
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Optional
+
+from .diff import DIFF_CONTEXT_LINES, Hunk, format_diff
+
+CHUNK_SIZE = 1024 * 1024
+
+Span = tuple[int, int]  # start and end offset of an occurrence of the search text
+
+
+def scan(
+    file: Path,
+    search_data: bytes,
+    chunk_size: int = CHUNK_SIZE,
+    max_count: Optional[int] = None,
+    bounds: Optional[Span] = None,
+) -> list[Span]:
+    """
+    Find all the non-overlapping occurrences of the search text in a file.
+
+    Consecutive chunks overlap by one less than the length of the search text, so occurrences
+    that cross the boundary between chunks are found.
+
+    :param file: File to search.
+    :param search_data: Encoded text to search for. Must not be empty.
+    :param chunk_size: Number of bytes read from the file at once.
+    :param max_count: Stop once this many occurrences are found, without reading (or checking
+        the encoding of) the rest of the file. `None` to find every occurrence.
+    :param bounds: Only read and search this part of the file. `None` to search the entire file.
+    :return: Location of each occurrence.
+    :raises OSError: The file could not be read.
+    :raises UnicodeDecodeError: The file does not contain UTF-8 text.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    spans: list[Span] = []
+    offset, end = (0, None) if bounds is None else bounds
+    buffer = b""  # starts at `offset` within the file
+    with file.open("rb") as f:
+        f.seek(offset)
+        while chunk := f.read(
+            chunk_size if end is None else min(chunk_size, end - offset - len(buffer))
+        ):
+            decoder.decode(chunk)
+            buffer += chunk
+            position = 0
+            while (
+                len(spans) != max_count
+                and (start := buffer.find(search_data, position)) != -1
+            ):
+                position = start + len(search_data)
+                spans.append((offset + start, offset + position))
+            if len(spans) == max_count:
+                return spans
+            # Anything after this could be the start of an occurrence that ends in the next chunk
+            keep_from = max(position, len(buffer) - len(search_data) + 1)
+            offset += keep_from
+            buffer = buffer[keep_from:]
+    decoder.decode(b"", final=True)
+    return spans
+
+
+def replace_spans(
+    source: IO[bytes],
+    sink: IO[bytes],
+    spans: list[Span],
+    replace_data: bytes,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Copy the contents of a file, replacing each of the given locations.
+
+    :param source: File to copy from.
+    :param sink: File to copy to.
+    :param spans: Sorted, non-overlapping locations in the source to replace.
+    :param replace_data: Encoded text to write in place of each location.
+    :param chunk_size: Maximum number of bytes read from the source at once.
+    """
+    position = 0
+    for start, end in spans:
+        _copy(source, sink, start - position, chunk_size)
+        source.seek(end)
+        sink.write(replace_data)
+        position = end
+    _copy(source, sink, None, chunk_size)
+
+
+def unified_diff(
+    file: Path, file_name: str, spans: list[Span], replace_data: bytes
+) -> str:
+    """
+    Produce a unified diff for replacing each of the given locations, like
+    `difflib.unified_diff()` would for the full contents of the file.
+
+    Only the lines that are changed and the surrounding context lines are held in memory. Lines
+    are only split on "\\n", since the file is read one line at a time.
+
+    :param file: File to replace text in.
+    :param file_name: Name of the file to use in the diff.
+    :param spans: Sorted, non-overlapping locations in the file to replace.
+    :param replace_data: Encoded text to write in place of each location.
+    :return: Unified diff text for the change.
+    """
+    return format_diff(file_name, list(_hunks(file, spans, replace_data)))
+
+
+@dataclass
+class _Group:
+    # consecutive lines that contain at least part of an occurrence of the search text, or that
+    # follow a line break that is replaced
+    line_number: int
+    start: int
+    lines: list[bytes] = field(default_factory=list)
+    spans: list[Span] = field(default_factory=list)
+
+    def new_data(self, replace_data: bytes) -> bytes:
+        old_data = b"".join(self.lines)
+        parts = []
+        position = 0
+        for start, end in self.spans:
+            relative_start = start - self.start
+            parts.append(old_data[position:relative_start])
+            parts.append(replace_data)
+            position = end - self.start
+        parts.append(old_data[position:])
+        return b"".join(parts)
+
+    def new_lines(self, replace_data: bytes) -> list[bytes]:
+        return _split_lines(self.new_data(replace_data))
+
+
+def _hunks(file: Path, spans: list[Span], replace_data: bytes) -> Iterator[Hunk]:
+    builder = HunkBuilder(replace_data)
+    span_index = 0
+    offset = 0
+    joined = False  # the line break before the line is replaced
+    with file.open("rb") as f:
+        for line_number, line in enumerate(f):
+            line_end = offset + len(line)
+            if joined or (span_index < len(spans) and spans[span_index][0] < line_end):
+                line_spans = []
+                while span_index < len(spans) and spans[span_index][1] <= line_end:
+                    line_spans.append(spans[span_index])
+                    span_index += 1
+                builder.changed_line(line_number, offset, line, line_spans)
+                # Without its line break, the new line continues with the next line
+                joined = (
+                    bool(line_spans)
+                    and line_spans[-1][1] == line_end
+                    and builder.missing_line_break()
+                )
+            else:
+                yield from builder.unchanged_line(line)
+                if span_index == len(spans) and not builder.building:
+                    # the rest of the file is not part of any hunk
+                    return
+            offset = line_end
+    yield from builder.finish()
+
+
+class HunkBuilder:
+    def __init__(self, replace_data: bytes) -> None:
+        """
+        Initialize an instance.
+
+        :param replace_data: Encoded text to write in place of each location.
+        """
+        self._replace_data = replace_data
+        self._before: deque[bytes] = deque(maxlen=DIFF_CONTEXT_LINES)
+        self._after: list[bytes] = []
+        self._hunk: Optional[Hunk] = None
+        self._group: Optional[_Group] = None
+        # difference between the line numbers in the new and old content
+        self._line_delta = 0
+
+    def changed_line(
+        self, line_number: int, offset: int, line: bytes, spans: list[Span]
+    ) -> None:
+        """
+        Add a line that contains at least part of an occurrence of the search text.
+
+        :param line_number: Zero based line number of the line.
+        :param offset: Position of the start of the line within the file.
+        :param line: Content of the line.
+        :param spans: Locations that end within the line.
+        """
+        if self._group is None:
+            self._group = _Group(line_number, offset)
+        self._group.lines.append(line)
+        self._group.spans.extend(spans)
+
+    def missing_line_break(self) -> bool:
+        """
+        Check if the replacements remove the line break at the end of the changed lines.
+
+        :return: `True` if the new content of the changed lines is not empty and does not end
+            with a line break.
+        """
+        if self._group is None:
+            return False
+        new_data = self._group.new_data(self._replace_data)
+        return bool(new_data) and not new_data.endswith(b"\n")
+
+    @property
+    def building(self) -> bool:
+        """
+        `True` if there are changed lines that are not part of a completed hunk yet.
+        """
+        return self._hunk is not None or self._group is not None
+
+    def unchanged_line(self, line: bytes) -> list[Hunk]:
+        """
+        Add a line that does not change.
+
+        :param line: Content of the line.
+        :return: Hunks that are complete, since there are too many unchanged lines after them.
+        """
+        hunks = self._end_group()
+        hunks.extend(self._unchanged(line))
+        return hunks
+
+    def finish(self) -> list[Hunk]:
+        """
+        Complete the current hunk.
+
+        :return: Hunks that were being built. Empty if there were no changed lines.
+        """
+        hunks = self._end_group()
+        if self._hunk is not None:
+            self._hunk.add(" ", self._after[:DIFF_CONTEXT_LINES])
+            hunks.append(self._hunk)
+        self._hunk = None
+        self._after = []
+        return hunks
+
+    def _unchanged(self, line: bytes) -> list[Hunk]:
+        self._before.append(line)
+        if self._hunk is None:
+            return []
+        self._after.append(line)
+        if len(self._after) <= 2 * DIFF_CONTEXT_LINES:
+            return []
+        # Too many unchanged lines to be part of the same hunk
+        return self.finish()
+
+    def _end_group(self) -> list[Hunk]:
+        group = self._group
+        if group is None:
+            return []
+        self._group = None
+        old_lines = group.lines
+        new_lines = group.new_lines(self._replace_data)
+        # The changed lines are compared the same way `difflib` compares the full contents, so
+        # lines that are the same after the replacements are only context. A group where nothing
+        # changes is not part of any hunk.
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        hunks = []
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            if tag == "equal":
+                for line in old_lines[old_start:old_end]:
+                    hunks.extend(self._unchanged(line))
+            else:
+                self._add_changed(
+                    group.line_number + old_start,
+                    old_lines[old_start:old_end],
+                    new_lines[new_start:new_end],
+                )
+        return hunks
+
+    def _add_changed(
+        self, line_number: int, old_lines: list[bytes], new_lines: list[bytes]
+    ) -> None:
+        if self._hunk is None:
+            old_start = line_number - len(self._before)
+            self._hunk = Hunk(old_start, old_start + self._line_delta)
+            self._hunk.add(" ", list(self._before))
+        else:
+            self._hunk.add(" ", self._after)
+        self._after = []
+        self._hunk.add("-", old_lines)
+        self._hunk.add("+", new_lines)
+        self._line_delta += len(new_lines) - len(old_lines)
+
+
+def _split_lines(data: bytes) -> list[bytes]:
+    # Split the same way as iterating over a binary file
+    lines = [line + b"\n" for line in data.split(b"\n")]
+    lines[-1] = lines[-1][:-1]
+    return lines if lines[-1] else lines[:-1]
+
+
+def _copy(
+    source: IO[bytes], sink: IO[bytes], length: Optional[int], chunk_size: int
+) -> None:
+    # Copy `length` bytes, or everything that is left when `None`
+    while length is None or length > 0:
+        chunk = source.read(chunk_size if length is None else min(chunk_size, length))
+        if not chunk:
+            return
+        sink.write(chunk)
+        if length is not None:
+            length -= len(chunk)
@@ -2,13 +2,15 @@
 Display interface for working with rich.
 """
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from enum import Enum
 from typing import Optional, TypeAlias, TypeVar, Union, overload
 
 from rich import prompt
 from rich.align import AlignMethod
 from rich.console import Console, RichCast
+from rich.markup import render as render_markup
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.style import Style, StyleType
@@ -35,6 +37,7 @@ _DISPLAY_THEME = Theme(
         "format.text": Style(color="orange4"),
         "patch.old": Style(color="red"),
         "patch.new": Style(color="green"),
+        "patch.hunk": Style(color="cyan"),
         "vcs.branch": Style(color="cyan", bold=True),
         "vcs.commit": Style(color="magenta", bold=True),
         "vcs.tag": Style(color="cyan", bold=True),
@@ -47,17 +50,61 @@ _DISPLAY_THEME = Theme(
 )
 
 _CONSOLE = Console(theme=_DISPLAY_THEME, highlight=False)
+_PLAIN_OUTPUT = False
+
+
+@contextmanager
+def plain_output(enabled: Optional[bool] = None) -> Iterator[None]:
+    """
+    Display messages, rules and diffs as plain text while in the context.
+
+    Plain text is written directly to the output stream, without styling, line wrapping or
+    flushing after each message, so large amounts of output are not limited by rendering. Panels
+    and prompts are still displayed using rich.
+
+    :param enabled: Use plain text. `None` to only use plain text when the output is not a terminal.
+    """
+    global _PLAIN_OUTPUT
+    original = _PLAIN_OUTPUT
+    _PLAIN_OUTPUT = not _CONSOLE.is_terminal if enabled is None else enabled
+    try:
+        yield
+    finally:
+        if _PLAIN_OUTPUT:
+            _CONSOLE.file.flush()
+        _PLAIN_OUTPUT = original
+
+
+def _write_plain(text: str) -> None:
+    _CONSOLE.file.write(text)
+
+
+def _plain_text(message: Optional[TextType]) -> str:
+    if isinstance(message, Text):
+        return message.plain
+    if isinstance(message, str):
+        return render_markup(message).plain
+    return str(message)
 
 
 def blank_line() -> None:
+    if _PLAIN_OUTPUT:
+        _write_plain("\n")
+        return
     _CONSOLE.print()
 
 
 def display(message: Optional[TextType]) -> None:
+    if _PLAIN_OUTPUT:
+        _write_plain(f"{_plain_text(message)}\n")
+        return
     _CONSOLE.print(message)
 
 
 def rule(message: TextType) -> None:
+    if _PLAIN_OUTPUT:
+        _write_plain(f"=== {_plain_text(message)} ===\n")
+        return
     _CONSOLE.print(Rule(title=message))
 
 
@@ -187,9 +234,43 @@ def choice_enum(
     return enum_type(result_value)
 
 
-def display_diff(diff_text: str) -> None:
-    syntax = Syntax(diff_text, "udiff", background_color="default")
-    _CONSOLE.print(syntax)
+def display_diff(diff_text: str, highlight: bool = False) -> None:
+    """
+    Display unified diff text.
+
+    :param diff_text: Unified diff text to display.
+    :param highlight: Use syntax highlighting. Otherwise, each line is only styled based on its
+        prefix, which avoids lexing the entire diff. Ignored when displaying plain text.
+    """
+    if _PLAIN_OUTPUT:
+        _write_plain(f"{diff_text}\n")
+        return
+    if highlight:
+        _CONSOLE.print(Syntax(diff_text, "udiff", background_color="default"))
+        return
+    text = Text()
+    lines = diff_text.split("\n")
+    in_header = True
+    for index, line in enumerate(lines):
+        if line.startswith("@@"):
+            in_header = False
+        text.append(line, style=_diff_line_style(line, in_header))
+        if index < len(lines) - 1:
+            text.append("\n")
+    _CONSOLE.print(text)
+
+
+def _diff_line_style(line: str, in_header: bool) -> Optional[str]:
+    # Within a hunk, "---" and "+++" are removed or added lines that start with "--" or "++"
+    if in_header and line.startswith(("---", "+++")):
+        return "emphasis"
+    if line.startswith("@@"):
+        return "patch.hunk"
+    if line.startswith("-"):
+        return "patch.old"
+    if line.startswith("+"):
+        return "patch.new"
+    return None
 
 
 def list_options(
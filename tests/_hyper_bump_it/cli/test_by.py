@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from hyper_bump_it._hyper_bump_it import cli
+from hyper_bump_it._hyper_bump_it import cli, ui
 from hyper_bump_it._hyper_bump_it.error import BumpItError
 from tests._hyper_bump_it import sample_data as sd
 from tests._hyper_bump_it.cli.common import (
@@ -271,3 +271,140 @@ def test_by__patch_options__args_sent_to_config_for_bump_to(patch_args, mocker):
             patch=True,
         )
     )
+
+
+@pytest.mark.parametrize(
+    "cache_args",
+    [
+        (["--no-cache"]),
+        (["--no-cache", "--cache", "--no-cache"]),
+    ],
+)
+def test_by__cache_options__args_sent_to_config_for_bump_by(cache_args, mocker):
+    mock_config_for_bump_by = mocker.patch(
+        "hyper_bump_it._hyper_bump_it.cli.by.config_for_bump_by"
+    )
+    mocker.patch("hyper_bump_it._hyper_bump_it.core.do_bump")
+
+    result = runner.invoke(
+        cli.app,
+        [
+            "by",
+            sd.SOME_BUMP_PART.value,
+            *CLI_OVERRIDE_ARGS,
+            *cache_args,
+        ],
+    )
+
+    assert_success(result)
+    mock_config_for_bump_by.assert_called_once_with(
+        sd.some_bump_by_args(
+            config_file=sd.SOME_ABSOLUTE_CONFIG_FILE,
+            project_root=sd.SOME_ABSOLUTE_DIRECTORY,
+            dry_run=True,
+            use_cache=False,
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ["highlight_args", "expected_highlight_diff"],
+    [
+        (["--highlight-diff"], True),
+        (["--highlight-diff", "--no-highlight-diff"], False),
+    ],
+)
+def test_by__highlight_diff_options__args_sent_to_config_for_bump_by(
+    highlight_args, expected_highlight_diff, mocker
+):
+    mock_config_for_bump_by = mocker.patch(
+        "hyper_bump_it._hyper_bump_it.cli.by.config_for_bump_by"
+    )
+    mocker.patch("hyper_bump_it._hyper_bump_it.core.do_bump")
+
+    result = runner.invoke(
+        cli.app,
+        [
+            "by",
+            sd.SOME_BUMP_PART.value,
+            *CLI_OVERRIDE_ARGS,
+            *highlight_args,
+        ],
+    )
+
+    assert_success(result)
+    mock_config_for_bump_by.assert_called_once_with(
+        sd.some_bump_by_args(
+            config_file=sd.SOME_ABSOLUTE_CONFIG_FILE,
+            project_root=sd.SOME_ABSOLUTE_DIRECTORY,
+            dry_run=True,
+            highlight_diff=expected_highlight_diff,
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ["plain_args", "expected_plain_output"],
+    [
+        ([], None),
+        (["--plain-output"], True),
+        (["--rich-output"], False),
+    ],
+)
+def test_by__plain_output_options__used_to_display_bump(
+    plain_args, expected_plain_output, mocker
+):
+    mocker.patch("hyper_bump_it._hyper_bump_it.cli.by.config_for_bump_by")
+    mocker.patch("hyper_bump_it._hyper_bump_it.core.do_bump")
+    plain_output = mocker.spy(ui, "plain_output")
+
+    result = runner.invoke(
+        cli.app,
+        [
+            "by",
+            sd.SOME_BUMP_PART.value,
+            *CLI_OVERRIDE_ARGS,
+            *plain_args,
+        ],
+    )
+
+    assert_success(result)
+    plain_output.assert_called_once_with(expected_plain_output)
+
+
+@pytest.mark.parametrize("jobs_args", [["--jobs", "4"], ["-j", "4"]])
+def test_by__jobs_option__args_sent_to_config_for_bump_by(jobs_args, mocker):
+    mock_config_for_bump_by = mocker.patch(
+        "hyper_bump_it._hyper_bump_it.cli.by.config_for_bump_by"
+    )
+    mocker.patch("hyper_bump_it._hyper_bump_it.core.do_bump")
+
+    result = runner.invoke(
+        cli.app,
+        [
+            "by",
+            sd.SOME_BUMP_PART.value,
+            *CLI_OVERRIDE_ARGS,
+            *jobs_args,
+        ],
+    )
+
+    assert_success(result)
+    mock_config_for_bump_by.assert_called_once_with(
+        sd.some_bump_by_args(
+            config_file=sd.SOME_ABSOLUTE_CONFIG_FILE,
+            project_root=sd.SOME_ABSOLUTE_DIRECTORY,
+            dry_run=True,
+            jobs=4,
+        )
+    )
+
+
+def test_by__jobs_not_positive__error(mocker):
+    mocker.patch("hyper_bump_it._hyper_bump_it.cli.by.config_for_bump_by")
+
+    result = runner.invoke(
+        cli.app, ["by", sd.SOME_BUMP_PART.value, *CLI_OVERRIDE_ARGS, "--jobs", "0"]
+    )
+
+    assert result.exit_code != 0
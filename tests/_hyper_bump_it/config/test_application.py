@@ -6,13 +6,21 @@ import pytest
 import tomlkit
 
 from hyper_bump_it._hyper_bump_it.cli.init import _config_to_dict as config_to_dict
-from hyper_bump_it._hyper_bump_it.config import BumpPart, GitAction, application, file
+from hyper_bump_it._hyper_bump_it.config import (
+    BumpPart,
+    GitAction,
+    Region,
+    RegionConfigFile,
+    application,
+    file,
+)
 from hyper_bump_it._hyper_bump_it.config.core import (
     DEFAULT_ALLOWED_INITIAL_BRANCHES,
     DEFAULT_BRANCH_ACTION,
     DEFAULT_BRANCH_FORMAT_PATTERN,
     DEFAULT_COMMIT_ACTION,
     DEFAULT_COMMIT_FORMAT_PATTERN,
+    DEFAULT_EXCLUDE_PATTERNS,
     DEFAULT_REMOTE,
     DEFAULT_SEARCH_PATTERN,
     DEFAULT_TAG_ACTION,
@@ -217,6 +225,7 @@ def test_config_for_bump_to__cli_dry_run__values_has_dry_run(
         git=_default_git(),
         project_root=tmp_path,
         dry_run=True,
+        discovery=sd.some_discovery(update_cache=False),
     )
 
 
@@ -400,6 +409,7 @@ def test_config_for_bump_by__cli_dry_run__values_has_dry_run(
         git=_default_git(),
         project_root=tmp_path,
         dry_run=True,
+        discovery=sd.some_discovery(update_cache=False),
     )
 
 
@@ -576,6 +586,246 @@ def test_config_for_bump_by__allowed_initial_branches__expected_result(
     )
 
 
+@pytest.mark.parametrize(
+    [
+        "file_exclude_patterns",
+        "file_extend_exclude_patterns",
+        "expected_patterns",
+    ],
+    [
+        (
+            DEFAULT_EXCLUDE_PATTERNS,
+            set(),
+            DEFAULT_EXCLUDE_PATTERNS,
+        ),
+        (
+            DEFAULT_EXCLUDE_PATTERNS,
+            {sd.SOME_EXCLUDE_PATTERN},
+            DEFAULT_EXCLUDE_PATTERNS | {sd.SOME_EXCLUDE_PATTERN},
+        ),
+        (
+            {sd.SOME_EXCLUDE_PATTERN},
+            {sd.SOME_OTHER_EXCLUDE_PATTERN},
+            {sd.SOME_EXCLUDE_PATTERN, sd.SOME_OTHER_EXCLUDE_PATTERN},
+        ),
+        (
+            {sd.SOME_EXCLUDE_PATTERN},
+            set(),
+            {sd.SOME_EXCLUDE_PATTERN},
+        ),
+    ],
+)
+def test_config_for_bump_by__exclude_patterns__expected_result(
+    file_exclude_patterns: set[str],
+    file_extend_exclude_patterns: set[str],
+    expected_patterns: set[str],
+    tmp_path: Path,
+):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    file_config = sd.some_config_file(
+        files=sd.some_file_definition(replace_format_pattern=None),
+        discovery=sd.some_discovery_config_file(
+            exclude_patterns=file_exclude_patterns,
+            extend_exclude_patterns=file_extend_exclude_patterns,
+        ),
+    )
+    config_file.write_text(tomlkit.dumps(config_to_dict(file_config)))
+
+    config = application.config_for_bump_by(
+        sd.some_bump_by_args(
+            current_version=sd.SOME_VERSION,
+            config_file=config_file,
+            project_root=tmp_path,
+        )
+    )
+
+    assert config == sd.some_application_config(
+        new_version=sd.SOME_VERSION.next_minor(),
+        files=[_default_file(file_glob=sd.SOME_FILE_GLOB)],
+        discovery=sd.some_discovery(exclude_patterns=frozenset(expected_patterns)),
+        project_root=tmp_path,
+    )
+
+
+def test_config_for_bump_by__keystone_in_excluded_dir__error(tmp_path: Path):
+    excluded_dir = tmp_path / "excluded"
+    excluded_dir.mkdir()
+    (excluded_dir / sd.SOME_GLOB_MATCHED_FILE_NAME).write_text(sd.SOME_VERSION_STRING)
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    file_config = sd.some_config_file(
+        current_version=None,
+        files=sd.some_file_definition(
+            file_glob=f"**/{sd.SOME_FILE_GLOB}", keystone=True
+        ),
+        discovery=sd.some_discovery_config_file(extend_exclude_patterns={"excluded/"}),
+    )
+    config_file.write_text(tomlkit.dumps(config_to_dict(file_config)))
+
+    with pytest.raises(KeystoneFileGlobError, match="No files matched"):
+        application.config_for_bump_by(
+            sd.some_bump_by_args(
+                current_version=None, config_file=config_file, project_root=tmp_path
+            )
+        )
+
+
+@pytest.mark.parametrize("highlight_diff", [True, False])
+def test_config_for_bump_by__highlight_diff__passed_to_config(
+    highlight_diff: bool, tmp_path: Path
+):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    config_file.write_text(
+        sd.some_minimal_config_text(file.ROOT_TABLE_KEY, sd.SOME_VERSION_STRING)
+    )
+
+    config = application.config_for_bump_by(
+        sd.no_config_override_bump_by_args(
+            config_file=config_file,
+            project_root=tmp_path,
+            highlight_diff=highlight_diff,
+        )
+    )
+
+    assert config.highlight_diff == highlight_diff
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_config_for_bump_to__use_cache__discovery_uses_cache(
+    use_cache: bool, tmp_path: Path
+):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    config_file.write_text(
+        sd.some_minimal_config_text(file.ROOT_TABLE_KEY, sd.SOME_VERSION_STRING)
+    )
+
+    config = application.config_for_bump_to(
+        sd.no_config_override_bump_to_args(
+            config_file=config_file, project_root=tmp_path, use_cache=use_cache
+        )
+    )
+
+    assert config.discovery == sd.some_discovery(use_cache=use_cache)
+
+
+@pytest.mark.parametrize(
+    ["dry_run", "patch", "expected_update_cache"],
+    [(False, False, True), (True, False, False), (False, True, False)],
+)
+def test_config_for_bump_by__preview__cache_not_updated(
+    dry_run: bool, patch: bool, expected_update_cache: bool, tmp_path: Path
+):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    config_file.write_text(
+        sd.some_minimal_config_text(file.ROOT_TABLE_KEY, sd.SOME_VERSION_STRING)
+    )
+
+    config = application.config_for_bump_by(
+        sd.no_config_override_bump_by_args(
+            config_file=config_file, project_root=tmp_path, dry_run=dry_run, patch=patch
+        )
+    )
+
+    assert config.discovery.update_cache == expected_update_cache
+
+
+@pytest.mark.parametrize("text_only", [True, False])
+def test_config_for_bump_by__text_only__passed_to_file(text_only: bool, tmp_path: Path):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    file_config = sd.some_config_file(
+        files=sd.some_file_definition(replace_format_pattern=None, text_only=text_only)
+    )
+    config_file.write_text(tomlkit.dumps(config_to_dict(file_config)))
+
+    config = application.config_for_bump_by(
+        sd.some_bump_by_args(
+            current_version=sd.SOME_VERSION,
+            config_file=config_file,
+            project_root=tmp_path,
+        )
+    )
+
+    assert [f.text_only for f in config.files] == [text_only]
+
+
+@pytest.mark.parametrize(
+    ["max_replacements", "first_only", "expected_max_replacements"],
+    [(None, False, None), (3, False, 3), (None, True, 1)],
+)
+def test_config_for_bump_by__replacement_limits__passed_to_file(
+    max_replacements: Optional[int],
+    first_only: bool,
+    expected_max_replacements: Optional[int],
+    tmp_path: Path,
+):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    file_config = sd.some_config_file(
+        files=sd.some_file_definition(
+            replace_format_pattern=None,
+            max_replacements=max_replacements,
+            first_only=first_only,
+        )
+    )
+    config_file.write_text(tomlkit.dumps(config_to_dict(file_config)))
+
+    config = application.config_for_bump_by(
+        sd.some_bump_by_args(
+            current_version=sd.SOME_VERSION,
+            config_file=config_file,
+            project_root=tmp_path,
+        )
+    )
+
+    assert [f.max_replacements for f in config.files] == [expected_max_replacements]
+
+
+def test_config_for_bump_by__region__passed_to_file(tmp_path: Path):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    file_config = sd.some_config_file(
+        files=sd.some_file_definition(
+            replace_format_pattern=None,
+            region=RegionConfigFile(start_anchor="foo", end_anchor="bar"),
+        )
+    )
+    config_file.write_text(tomlkit.dumps(config_to_dict(file_config)))
+
+    config = application.config_for_bump_by(
+        sd.some_bump_by_args(
+            current_version=sd.SOME_VERSION,
+            config_file=config_file,
+            project_root=tmp_path,
+        )
+    )
+
+    assert [f.region for f in config.files] == [
+        Region(start_anchor="foo", end_anchor="bar")
+    ]
+
+
+@pytest.mark.parametrize(
+    ["file_jobs", "cli_jobs", "expected_jobs"],
+    [(1, None, 1), (4, None, 4), (1, 8, 8), (4, 2, 2)],
+)
+def test_config_for_bump_by__jobs__expected_result(
+    file_jobs: int, cli_jobs: Optional[int], expected_jobs: int, tmp_path: Path
+):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    file_config = sd.some_config_file(
+        files=sd.some_file_definition(replace_format_pattern=None), jobs=file_jobs
+    )
+    config_file.write_text(tomlkit.dumps(config_to_dict(file_config)))
+
+    config = application.config_for_bump_by(
+        sd.some_bump_by_args(
+            current_version=sd.SOME_VERSION,
+            jobs=cli_jobs,
+            config_file=config_file,
+            project_root=tmp_path,
+        )
+    )
+
+    assert config.jobs == expected_jobs
+
+
 def _default_file(file_glob: str) -> application.File:
     return application.File(
         file_glob=file_glob,
@@ -1,11 +1,23 @@
 from pathlib import Path
 from textwrap import dedent
+from typing import Optional
 
 import pytest
 from pydantic import ValidationError
 
-from hyper_bump_it._hyper_bump_it.config import GitAction, file
-from hyper_bump_it._hyper_bump_it.config.core import DEFAULT_SEARCH_PATTERN
+from hyper_bump_it._hyper_bump_it.config import (
+    DiscoveryMode,
+    GitAction,
+    JobBackend,
+    file,
+)
+from hyper_bump_it._hyper_bump_it.config.core import (
+    DEFAULT_DISCOVERY_MODE,
+    DEFAULT_DISCOVERY_WORKERS,
+    DEFAULT_EXCLUDE_PATTERNS,
+    DEFAULT_RESPECT_GITIGNORE,
+    DEFAULT_SEARCH_PATTERN,
+)
 from hyper_bump_it._hyper_bump_it.error import (
     ConfigurationFileNotFoundError,
     ConfigurationFileReadError,
@@ -120,6 +132,71 @@ def test_git__invalid__error(values, description):
         file.Git(**values)
 
 
+def test_discovery__no_args__valid():
+    result = file.Discovery()
+
+    assert result == file.Discovery(
+        exclude_patterns=DEFAULT_EXCLUDE_PATTERNS,
+        extend_exclude_patterns=frozenset(),
+        respect_gitignore=DEFAULT_RESPECT_GITIGNORE,
+        mode=DEFAULT_DISCOVERY_MODE,
+        workers=DEFAULT_DISCOVERY_WORKERS,
+    )
+
+
+@pytest.mark.parametrize("mode", list(DiscoveryMode))
+def test_discovery__mode_value__created_as_enum(mode: DiscoveryMode):
+    result = file.Discovery(mode=mode.value)
+
+    assert result.mode == mode
+
+
+@pytest.mark.parametrize("backend", list(JobBackend))
+def test_config_file__job_backend_value__created_as_enum(backend: JobBackend):
+    result = file.ConfigFile(
+        current_version=sd.SOME_VERSION_STRING,
+        files=[{"file_glob": sd.SOME_FILE_GLOB}],
+        job_backend=backend.value,
+    )
+
+    assert result.job_backend == backend
+
+
+def test_discovery__list_patterns__converted_to_set():
+    result = file.Discovery(
+        exclude_patterns=[sd.SOME_EXCLUDE_PATTERN, sd.SOME_EXCLUDE_PATTERN],
+        extend_exclude_patterns=[sd.SOME_OTHER_EXCLUDE_PATTERN],
+    )
+
+    assert result.exclude_patterns == frozenset([sd.SOME_EXCLUDE_PATTERN])
+    assert result.extend_exclude_patterns == frozenset([sd.SOME_OTHER_EXCLUDE_PATTERN])
+
+
+@pytest.mark.parametrize(
+    ["description", "values"],
+    [
+        ("an invalid field name", SOME_INVALID_OBJECT),
+        ("exclude_patterns not a list", {"exclude_patterns": SOME_NON_STRING}),
+        (
+            "exclude_patterns contains an empty string",
+            {"exclude_patterns": [""]},
+        ),
+        (
+            "extend_exclude_patterns not a list",
+            {"extend_exclude_patterns": SOME_NON_STRING},
+        ),
+        ("respect_gitignore not a bool", {"respect_gitignore": SOME_NON_BOOL}),
+        ("mode not a string", {"mode": SOME_NON_STRING}),
+        ("mode not a valid value", {"mode": "not-a-mode"}),
+        ("workers not an int", {"workers": "4"}),
+        ("workers less than one", {"workers": 0}),
+    ],
+)
+def test_discovery__invalid__error(values, description):
+    with pytest.raises(ValidationError):
+        file.Discovery(**values)
+
+
 def test_file__just_file_glob__valid():
     result = file.File(file_glob=sd.SOME_FILE_GLOB)
 
@@ -128,9 +205,73 @@ def test_file__just_file_glob__valid():
         keystone=False,
         search_format_pattern=DEFAULT_SEARCH_PATTERN,
         replace_format_pattern=None,
+        text_only=False,
+        max_replacements=None,
+        first_only=False,
+        min_replacements=1,
+        region=None,
     )
 
 
+@pytest.mark.parametrize(
+    ["values", "expected_limit"],
+    [
+        ({}, None),
+        ({"max_replacements": 3}, 3),
+        ({"first_only": True}, 1),
+        ({"first_only": True, "max_replacements": 1}, 1),
+    ],
+)
+def test_file__replacement_limits__expected_limit(
+    values: dict[str, object], expected_limit: Optional[int]
+):
+    result = file.File(file_glob=sd.SOME_FILE_GLOB, **values)
+
+    assert result.replacement_limit == expected_limit
+
+
+@pytest.mark.parametrize(
+    ["description", "values"],
+    [
+        ("max_replacements less than one", {"max_replacements": 0}),
+        ("min_replacements less than one", {"min_replacements": 0}),
+        (
+            "first_only with a different max_replacements",
+            {"first_only": True, "max_replacements": 2},
+        ),
+        (
+            "min_replacements greater than max_replacements",
+            {"max_replacements": 2, "min_replacements": 3},
+        ),
+        (
+            "min_replacements greater than one with first_only",
+            {"first_only": True, "min_replacements": 2},
+        ),
+    ],
+)
+def test_file__invalid_replacement_limits__error(values, description):
+    with pytest.raises(ValidationError):
+        file.File(file_glob=sd.SOME_FILE_GLOB, **values)
+
+
+@pytest.mark.parametrize(
+    ["description", "values"],
+    [
+        ("no fields", {}),
+        ("an invalid field name", SOME_INVALID_OBJECT),
+        ("start_line less than one", {"start_line": 0}),
+        ("start_line after end_line", {"start_line": 3, "end_line": 2}),
+        ("empty start_anchor", {"start_anchor": ""}),
+        ("empty section", {"section": ""}),
+        ("lines and anchors", {"start_line": 1, "end_anchor": "foo"}),
+        ("anchors and section", {"start_anchor": "foo", "section": "bar"}),
+    ],
+)
+def test_region__invalid__error(values, description):
+    with pytest.raises(ValidationError):
+        file.Region(**values)
+
+
 def test_file__default_search_pattern__formats_to_version():
     search_pattern = file.File(file_glob=sd.SOME_FILE_GLOB).search_format_pattern
 
@@ -288,6 +429,30 @@ def test_config_file__current_version_already_parsed__valid():
                 "show_confirm_prompt": SOME_NON_BOOL,
             },
         ),
+        (
+            "jobs not positive",
+            {
+                "current_version": sd.SOME_VERSION_STRING,
+                "files": [{"file_glob": sd.SOME_FILE_GLOB}],
+                "jobs": 0,
+            },
+        ),
+        (
+            "job_backend not a backend",
+            {
+                "current_version": sd.SOME_VERSION_STRING,
+                "files": [{"file_glob": sd.SOME_FILE_GLOB}],
+                "job_backend": "coroutine",
+            },
+        ),
+        (
+            "streaming_threshold not positive",
+            {
+                "current_version": sd.SOME_VERSION_STRING,
+                "files": [{"file_glob": sd.SOME_FILE_GLOB}],
+                "streaming_threshold": 0,
+            },
+        ),
     ],
 )
 def test_config_file__invalid__error(values, description):
@@ -436,7 +601,6 @@ def test_read_pyproject_config__valid_current_version__returned_updater_produces
             PYPROJECT_ROOT_TABLE,
             sd.SOME_OTHER_VERSION_STRING,
         ),
-        newline="\n",
     )
 
 
@@ -542,7 +706,6 @@ def test_read_hyper_config__valid_current_version__returned_updater_updates_file
             file.ROOT_TABLE_KEY,
             sd.SOME_OTHER_VERSION_STRING,
         ),
-        newline="\n",
     )
 
 
@@ -569,10 +732,43 @@ def test_read_hyper_config__crlf_newline__newline_as_crlf(
         new_content=sd.some_minimal_config_text(
             file.ROOT_TABLE_KEY, sd.SOME_OTHER_VERSION_STRING, crlf_newline=True
         ),
-        newline="\r\n",
     )
 
 
+def test_read_hyper_config__byte_order_mark__byte_order_mark_kept(
+    tmp_path: Path,
+):
+    project_root = tmp_path
+    config_file = project_root / sd.SOME_CONFIG_FILE_NAME
+    original_text = "\ufeff" + sd.some_minimal_config_text(
+        file.ROOT_TABLE_KEY, sd.SOME_VERSION_STRING
+    )
+    config_file.write_text(original_text)
+
+    config, updater = file.read_hyper_config(config_file, project_root=tmp_path)
+
+    assert updater is not None
+    result = updater(sd.SOME_OTHER_VERSION)
+
+    assert result == sd.some_planned_change(
+        config_file,
+        project_root,
+        old_content=original_text,
+        new_content="\ufeff"
+        + sd.some_minimal_config_text(
+            file.ROOT_TABLE_KEY, sd.SOME_OTHER_VERSION_STRING
+        ),
+    )
+
+
+def test_read_hyper_config__not_utf8__error(tmp_path: Path):
+    config_file = tmp_path / sd.SOME_CONFIG_FILE_NAME
+    config_file.write_bytes(b"\xff\xfe")
+
+    with pytest.raises(ConfigurationFileReadError):
+        file.read_hyper_config(config_file, project_root=tmp_path)
+
+
 def test_read_hyper_config__valid_keystone__config_returned(
     tmp_path: Path,
 ):
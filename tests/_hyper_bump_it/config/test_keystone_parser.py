@@ -8,6 +8,7 @@ from hyper_bump_it._hyper_bump_it.error import (
     VersionNotFound,
 )
 from hyper_bump_it._hyper_bump_it.format_pattern import keys
+from hyper_bump_it._hyper_bump_it.run_cache import RunCache
 from hyper_bump_it._hyper_bump_it.version import Version
 
 SOME_FILE = "foo.txt"
@@ -104,7 +105,8 @@ def test_find_current_version__valid_pattern_match__found(
     file.write_text(file_content)
 
     assert (
-        keystone_parser.find_current_version(file, pattern) == expected_version
+        keystone_parser.find_current_version(file, pattern, RunCache())
+        == expected_version
     ), description
 
 
@@ -123,7 +125,7 @@ def test_find_current_version__missing_required_part__error(
     file.write_text(file_content)
 
     with pytest.raises(IncompleteKeystoneVersionError):
-        keystone_parser.find_current_version(file, pattern)
+        keystone_parser.find_current_version(file, pattern, RunCache())
 
 
 @pytest.mark.parametrize(
@@ -141,7 +143,7 @@ def test_find_current_version__new_part__ignored_causing_error(
     file.write_text(file_content)
 
     with pytest.raises(IncompleteKeystoneVersionError):
-        keystone_parser.find_current_version(file, pattern)
+        keystone_parser.find_current_version(file, pattern, RunCache())
 
 
 def test_find_current_version__not_found__error(tmp_path: Path):
@@ -149,4 +151,4 @@ def test_find_current_version__not_found__error(tmp_path: Path):
     file.touch()
 
     with pytest.raises(VersionNotFound):
-        keystone_parser.find_current_version(file, "foo")
+        keystone_parser.find_current_version(file, "foo", RunCache())
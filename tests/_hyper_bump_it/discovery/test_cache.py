@@ -0,0 +1,218 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it.discovery import cache
+
+SOME_KEY = "some-key"
+SOME_OTHER_KEY = "some-other-key"
+SOME_FILE_GLOB = "*.txt"
+SOME_FILE_NAME = "foo.txt"
+SOME_DIRECTORY_NAME = "some_directory"
+# Well in the past, so the times are not considered to be racy
+SOME_OLD_MTIME_NS = 1_600_000_000_000_000_000
+
+
+def _age(*paths: Path) -> None:
+    for path in paths:
+        os.utime(path, ns=(SOME_OLD_MTIME_NS, SOME_OLD_MTIME_NS))
+
+
+def _snapshot(project_root: Path, *relative_paths: str) -> cache.Snapshot:
+    snapshot = cache.Snapshot(project_root)
+    for relative in relative_paths:
+        snapshot.record(relative)
+    return snapshot
+
+
+def _some_cache(tmp_path: Path) -> cache.DiscoveryCache:
+    return cache.DiscoveryCache(tmp_path / "cache" / cache.CACHE_FILE_NAME)
+
+
+def test_snapshot_record__missing_path__none(tmp_path: Path):
+    snapshot = _snapshot(tmp_path, SOME_FILE_NAME)
+
+    assert snapshot.mtimes == {SOME_FILE_NAME: None}
+
+
+def test_snapshot_record_directory__contains_gitignore__both_recorded(
+    tmp_path: Path,
+):
+    directory = tmp_path / SOME_DIRECTORY_NAME
+    directory.mkdir()
+    (directory / ".gitignore").touch()
+    _age(directory / ".gitignore", directory)
+    snapshot = cache.Snapshot(tmp_path)
+
+    with os.scandir(directory) as entries:
+        snapshot.record_directory(SOME_DIRECTORY_NAME, list(entries))
+
+    assert snapshot.mtimes == {
+        SOME_DIRECTORY_NAME: SOME_OLD_MTIME_NS,
+        f"{SOME_DIRECTORY_NAME}/.gitignore": SOME_OLD_MTIME_NS,
+    }
+
+
+def test_lookup__nothing_stored__none(tmp_path: Path):
+    assert _some_cache(tmp_path).lookup(tmp_path, SOME_KEY) is None
+
+
+def test_lookup__unchanged__stored_results(tmp_path: Path):
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    _age(project_root)
+    discovery_cache = _some_cache(tmp_path)
+    results = {SOME_FILE_GLOB: [project_root / SOME_FILE_NAME]}
+    discovery_cache.store(project_root, SOME_KEY, _snapshot(project_root, ""), results)
+
+    assert discovery_cache.lookup(project_root, SOME_KEY) == results
+
+
+def test_lookup__directory_changed__none(tmp_path: Path):
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    _age(project_root)
+    discovery_cache = _some_cache(tmp_path)
+    discovery_cache.store(
+        project_root,
+        SOME_KEY,
+        _snapshot(project_root, ""),
+        {SOME_FILE_GLOB: [project_root / SOME_FILE_NAME]},
+    )
+
+    (project_root / SOME_FILE_NAME).touch()
+
+    assert discovery_cache.lookup(project_root, SOME_KEY) is None
+
+
+def test_lookup__other_key__none(tmp_path: Path):
+    _age(tmp_path)
+    discovery_cache = _some_cache(tmp_path)
+    discovery_cache.store(tmp_path, SOME_KEY, _snapshot(tmp_path), {SOME_FILE_GLOB: []})
+
+    assert discovery_cache.lookup(tmp_path, SOME_OTHER_KEY) is None
+
+
+def test_lookup__invalid_cache_file__none(tmp_path: Path):
+    discovery_cache = _some_cache(tmp_path)
+    cache_file = tmp_path / "cache" / cache.CACHE_FILE_NAME
+    cache_file.parent.mkdir()
+    cache_file.write_text("not a cache")
+
+    assert discovery_cache.lookup(tmp_path, SOME_KEY) is None
+
+
+def test_store__invalid_cache_file__replaced(tmp_path: Path):
+    discovery_cache = _some_cache(tmp_path)
+    cache_file = tmp_path / "cache" / cache.CACHE_FILE_NAME
+    cache_file.parent.mkdir()
+    cache_file.write_text("not a cache")
+
+    discovery_cache.store(tmp_path, SOME_KEY, _snapshot(tmp_path), {SOME_FILE_GLOB: []})
+
+    assert discovery_cache.lookup(tmp_path, SOME_KEY) == {SOME_FILE_GLOB: []}
+
+
+def test_store__recently_modified__not_stored(tmp_path: Path):
+    (tmp_path / SOME_FILE_NAME).touch()
+    discovery_cache = _some_cache(tmp_path)
+
+    discovery_cache.store(
+        tmp_path, SOME_KEY, _snapshot(tmp_path, SOME_FILE_NAME), {SOME_FILE_GLOB: []}
+    )
+
+    assert discovery_cache.lookup(tmp_path, SOME_KEY) is None
+
+
+def test_store__read_only__file_not_written(tmp_path: Path):
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    _age(project_root)
+    cache_file = tmp_path / "cache" / cache.CACHE_FILE_NAME
+    discovery_cache = cache.DiscoveryCache(cache_file, read_only=True)
+
+    discovery_cache.store(
+        project_root, SOME_KEY, _snapshot(project_root, ""), {SOME_FILE_GLOB: []}
+    )
+
+    assert not cache_file.parent.exists()
+
+
+def test_lookup__read_only__stored_results_without_writing(tmp_path: Path):
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    _age(project_root)
+    cache_file = tmp_path / "cache" / cache.CACHE_FILE_NAME
+    results = {SOME_FILE_GLOB: [project_root / SOME_FILE_NAME]}
+    cache.DiscoveryCache(cache_file).store(
+        project_root, SOME_KEY, _snapshot(project_root, ""), results
+    )
+    cache_data = cache_file.read_bytes()
+
+    result = cache.DiscoveryCache(cache_file, read_only=True).lookup(
+        project_root, SOME_KEY
+    )
+
+    assert result == results
+    assert cache_file.read_bytes() == cache_data
+
+
+def test_store__too_many_entries__least_recently_used_evicted(tmp_path: Path, mocker):
+    mocker.patch.object(cache, "MAX_CACHE_ENTRIES", 2)
+    discovery_cache = _some_cache(tmp_path)
+    for key in ("first", "second"):
+        discovery_cache.store(tmp_path, key, _snapshot(tmp_path), {SOME_FILE_GLOB: []})
+    # using the first entry makes the second entry the least recently used
+    discovery_cache.lookup(tmp_path, "first")
+
+    discovery_cache.store(tmp_path, "third", _snapshot(tmp_path), {SOME_FILE_GLOB: []})
+
+    assert discovery_cache.lookup(tmp_path, "first") is not None
+    assert discovery_cache.lookup(tmp_path, "second") is None
+    assert discovery_cache.lookup(tmp_path, "third") is not None
+
+
+def test_store__entry_too_large__not_stored(tmp_path: Path, mocker):
+    mocker.patch.object(cache, "MAX_CACHE_BYTES", 100)
+    discovery_cache = _some_cache(tmp_path)
+
+    discovery_cache.store(
+        tmp_path,
+        SOME_KEY,
+        _snapshot(tmp_path),
+        {SOME_FILE_GLOB: [tmp_path / f"{index}.txt" for index in range(100)]},
+    )
+
+    assert discovery_cache.lookup(tmp_path, SOME_KEY) is None
+
+
+def test_for_project__git_repository__stored_in_git_directory(tmp_path: Path):
+    (tmp_path / ".git").mkdir()
+    discovery_cache = cache.DiscoveryCache.for_project(tmp_path)
+
+    discovery_cache.store(tmp_path, SOME_KEY, _snapshot(tmp_path), {SOME_FILE_GLOB: []})
+
+    assert (tmp_path / ".git" / cache.CACHE_DIR_NAME / cache.CACHE_FILE_NAME).is_file()
+
+
+def test_for_project__not_git_repository__stored_in_user_cache_directory(
+    tmp_path: Path, user_cache_dir: Path
+):
+    discovery_cache = cache.DiscoveryCache.for_project(tmp_path)
+
+    discovery_cache.store(tmp_path, SOME_KEY, _snapshot(tmp_path), {SOME_FILE_GLOB: []})
+
+    assert (user_cache_dir / cache.CACHE_DIR_NAME / cache.CACHE_FILE_NAME).is_file()
+
+
+@pytest.mark.parametrize(
+    ["parts", "other_parts"],
+    [
+        (("root", ["*.txt"]), ("root", ["*.md"])),
+        (("root", ["*.txt"]), ("other-root", ["*.txt"])),
+        (("root", ["*.txt"], True), ("root", ["*.txt"], False)),
+    ],
+)
+def test_cache_key__different_parts__different_keys(parts, other_parts):
+    assert cache.cache_key(*parts) != cache.cache_key(*other_parts)
@@ -0,0 +1,485 @@
+import os
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from hyper_bump_it._hyper_bump_it import discovery
+from hyper_bump_it._hyper_bump_it.config import DiscoveryMode
+from hyper_bump_it._hyper_bump_it.discovery import finder
+from hyper_bump_it._hyper_bump_it.error import NoRepositoryError
+from tests._hyper_bump_it import sample_data as sd
+
+SOME_FILE_NAME = "foo.txt"
+SOME_OTHER_FILE_NAME = "bar.txt"
+SOME_NON_MATCHING_FILE_NAME = "baz.md"
+SOME_DIRECTORY_NAME = "some_directory"
+SOME_OTHER_DIRECTORY_NAME = "other_directory"
+SOME_NESTED_DIRECTORY_NAME = "nested"
+
+SOME_TREE = [
+    SOME_FILE_NAME,
+    SOME_OTHER_FILE_NAME,
+    SOME_NON_MATCHING_FILE_NAME,
+    f".{SOME_FILE_NAME}",
+    f"{SOME_DIRECTORY_NAME}/{SOME_FILE_NAME}",
+    f"{SOME_DIRECTORY_NAME}/{SOME_NON_MATCHING_FILE_NAME}",
+    f"{SOME_DIRECTORY_NAME}/{SOME_NESTED_DIRECTORY_NAME}/{SOME_FILE_NAME}",
+    f"{SOME_OTHER_DIRECTORY_NAME}/{SOME_OTHER_FILE_NAME}",
+]
+
+SOME_OLD_MTIME_NS = 1_600_000_000_000_000_000
+
+SOME_PARITY_GLOBS = [
+    SOME_FILE_NAME,
+    "*.txt",
+    "*",
+    "b?r.txt",
+    "[fb]*.txt",
+    f"{SOME_DIRECTORY_NAME}/{SOME_FILE_NAME}",
+    f"{SOME_DIRECTORY_NAME}/*",
+    f"*/{SOME_FILE_NAME}",
+    f"**/{SOME_FILE_NAME}",
+    "**/*.txt",
+    f"{SOME_DIRECTORY_NAME}/**/{SOME_FILE_NAME}",
+    f"**/{SOME_NESTED_DIRECTORY_NAME}/*.txt",
+    f"./{SOME_FILE_NAME}",
+    "non-existent.txt",
+]
+
+
+def _create_tree(root: Path, relative_files: list[str]) -> None:
+    for relative_file in relative_files:
+        file = root / relative_file
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.touch()
+
+
+def _create_tracked_tree(root: Path, relative_files: list[str]) -> None:
+    _create_tree(root, relative_files)
+    repo = Repo.init(root)
+    repo.index.add(relative_files)
+    repo.index.write()
+
+
+def _age_directories(root: Path) -> None:
+    # Modification times that are too recent are not trusted by the discovery cache
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(SOME_OLD_MTIME_NS, SOME_OLD_MTIME_NS))
+
+
+def _pathlib_glob_files(root: Path, file_glob: str) -> list[Path]:
+    return sorted(path for path in root.glob(file_glob) if path.is_file())
+
+
+@pytest.mark.parametrize("file_glob", SOME_PARITY_GLOBS)
+def test_find_files__same_files_as_pathlib_glob(file_glob: str, tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(tmp_path, [file_glob])
+
+    assert result == {file_glob: _pathlib_glob_files(tmp_path, file_glob)}
+
+
+def test_find_files__trailing_recursive_wildcard__all_nested_files(tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(tmp_path, [f"{SOME_DIRECTORY_NAME}/**"])
+
+    assert result == {
+        f"{SOME_DIRECTORY_NAME}/**": [
+            tmp_path / SOME_DIRECTORY_NAME / SOME_NON_MATCHING_FILE_NAME,
+            tmp_path / SOME_DIRECTORY_NAME / SOME_FILE_NAME,
+            tmp_path
+            / SOME_DIRECTORY_NAME
+            / SOME_NESTED_DIRECTORY_NAME
+            / SOME_FILE_NAME,
+        ]
+    }
+
+
+def test_find_files__multiple_globs__results_for_each(tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+    file_globs = ["*.txt", f"**/{SOME_FILE_NAME}", "*.md", "non-existent.txt"]
+
+    result = discovery.find_files(tmp_path, file_globs)
+
+    assert result == {
+        file_glob: _pathlib_glob_files(tmp_path, file_glob) for file_glob in file_globs
+    }
+
+
+def test_find_files__multiple_globs__each_directory_scanned_once(
+    tmp_path: Path, mocker
+):
+    _create_tree(tmp_path, SOME_TREE)
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    discovery.find_files(
+        tmp_path, ["*.txt", f"**/{SOME_FILE_NAME}", "**/*.md", f"*/{SOME_FILE_NAME}"]
+    )
+
+    scanned = [Path(call.args[0]) for call in scandir_spy.call_args_list]
+    assert sorted(scanned) == sorted(
+        [
+            tmp_path,
+            tmp_path / SOME_DIRECTORY_NAME,
+            tmp_path / SOME_DIRECTORY_NAME / SOME_NESTED_DIRECTORY_NAME,
+            tmp_path / SOME_OTHER_DIRECTORY_NAME,
+        ]
+    )
+
+
+def test_find_files__no_recursive_wildcard__unrelated_directories_not_scanned(
+    tmp_path: Path, mocker
+):
+    _create_tree(tmp_path, SOME_TREE)
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    discovery.find_files(tmp_path, [f"{SOME_DIRECTORY_NAME}/*.md"])
+
+    scanned = [Path(call.args[0]) for call in scandir_spy.call_args_list]
+    assert sorted(scanned) == [tmp_path, tmp_path / SOME_DIRECTORY_NAME]
+
+
+def test_find_files__directories__not_matched(tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(tmp_path, [f"{SOME_DIRECTORY_NAME}*"])
+
+    assert result == {f"{SOME_DIRECTORY_NAME}*": []}
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlink support")
+def test_find_files__symlink_cycle__recursive_wildcard_does_not_follow(
+    tmp_path: Path,
+):
+    _create_tree(tmp_path, SOME_TREE)
+    (tmp_path / SOME_DIRECTORY_NAME / "cycle").symlink_to(
+        tmp_path, target_is_directory=True
+    )
+
+    result = discovery.find_files(tmp_path, [f"**/{SOME_FILE_NAME}"])
+
+    assert result == {
+        f"**/{SOME_FILE_NAME}": _pathlib_glob_files(tmp_path, f"**/{SOME_FILE_NAME}")
+    }
+
+
+def test_find_files__traverses_above_project_root__matched(tmp_path: Path):
+    matched_file = tmp_path / SOME_FILE_NAME
+    matched_file.touch()
+    project_root = tmp_path / SOME_DIRECTORY_NAME
+    project_root.mkdir()
+
+    result = discovery.find_files(project_root, [f"../{SOME_FILE_NAME}"])
+
+    assert result == {f"../{SOME_FILE_NAME}": [project_root / ".." / SOME_FILE_NAME]}
+
+
+def test_find_files__default_settings__ignored_and_tool_directories_matched(
+    tmp_path: Path,
+):
+    tree = [
+        SOME_FILE_NAME,
+        f".git/{SOME_FILE_NAME}",
+        f"node_modules/{SOME_DIRECTORY_NAME}/{SOME_FILE_NAME}",
+        f".venv/{SOME_FILE_NAME}",
+    ]
+    _create_tree(tmp_path, tree)
+    (tmp_path / ".gitignore").write_text(".venv/\n")
+
+    result = discovery.find_files(
+        tmp_path, [f"**/{SOME_FILE_NAME}"], sd.some_discovery()
+    )
+
+    assert result == {
+        f"**/{SOME_FILE_NAME}": _pathlib_glob_files(tmp_path, f"**/{SOME_FILE_NAME}")
+    }
+    assert len(result[f"**/{SOME_FILE_NAME}"]) == len(tree)
+
+
+def test_find_files__excluded_directories__not_scanned(tmp_path: Path, mocker):
+    _create_tree(
+        tmp_path,
+        [
+            SOME_FILE_NAME,
+            f".git/{SOME_FILE_NAME}",
+            f"node_modules/{SOME_DIRECTORY_NAME}/{SOME_FILE_NAME}",
+        ],
+    )
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    result = discovery.find_files(
+        tmp_path,
+        [f"**/{SOME_FILE_NAME}"],
+        sd.some_discovery(exclude_patterns=frozenset({".git/", "node_modules/"})),
+    )
+
+    assert result == {f"**/{SOME_FILE_NAME}": [tmp_path / SOME_FILE_NAME]}
+    assert [Path(call.args[0]) for call in scandir_spy.call_args_list] == [tmp_path]
+
+
+def test_find_files__configured_exclusions__excluded_files_not_matched(
+    tmp_path: Path,
+):
+    _create_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(
+        tmp_path,
+        ["**/*.txt"],
+        sd.some_discovery(
+            exclude_patterns=frozenset(
+                {f"{SOME_DIRECTORY_NAME}/", SOME_OTHER_FILE_NAME}
+            )
+        ),
+    )
+
+    assert result == {
+        "**/*.txt": [tmp_path / f".{SOME_FILE_NAME}", tmp_path / SOME_FILE_NAME]
+    }
+
+
+def test_find_files__gitignore__ignored_paths_not_matched(tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+    (tmp_path / ".gitignore").write_text(f"{SOME_OTHER_DIRECTORY_NAME}/\n.*\n")
+    (tmp_path / SOME_DIRECTORY_NAME / ".gitignore").write_text(f"/{SOME_FILE_NAME}\n")
+
+    result = discovery.find_files(
+        tmp_path, ["**/*.txt"], sd.some_discovery(respect_gitignore=True)
+    )
+
+    assert result == {
+        "**/*.txt": [
+            tmp_path / SOME_OTHER_FILE_NAME,
+            tmp_path / SOME_FILE_NAME,
+            tmp_path
+            / SOME_DIRECTORY_NAME
+            / SOME_NESTED_DIRECTORY_NAME
+            / SOME_FILE_NAME,
+        ]
+    }
+
+
+def test_find_files__git_info_exclude__ignored_paths_not_matched(tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+    info_dir = tmp_path / ".git" / "info"
+    info_dir.mkdir(parents=True)
+    (info_dir / "exclude").write_text(f"{SOME_OTHER_FILE_NAME}\n")
+
+    result = discovery.find_files(
+        tmp_path, ["*.txt"], sd.some_discovery(respect_gitignore=True)
+    )
+
+    assert result == {
+        "*.txt": [tmp_path / f".{SOME_FILE_NAME}", tmp_path / SOME_FILE_NAME]
+    }
+
+
+def test_find_files__gitignore_not_respected__ignored_paths_matched(
+    tmp_path: Path,
+):
+    _create_tree(tmp_path, SOME_TREE)
+    (tmp_path / ".gitignore").write_text("*.txt\n")
+
+    result = discovery.find_files(
+        tmp_path, ["*.txt"], sd.some_discovery(respect_gitignore=False)
+    )
+
+    assert result == {"*.txt": _pathlib_glob_files(tmp_path, "*.txt")}
+
+
+@pytest.mark.parametrize("file_glob", SOME_PARITY_GLOBS)
+def test_find_files__git_index__same_files_as_pathlib_glob(
+    file_glob: str, tmp_path: Path
+):
+    _create_tracked_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(
+        tmp_path, [file_glob], sd.some_discovery(mode=DiscoveryMode.GitIndex)
+    )
+
+    assert result == {file_glob: _pathlib_glob_files(tmp_path, file_glob)}
+
+
+def test_find_files__git_index__file_system_not_scanned(tmp_path: Path, mocker):
+    _create_tracked_tree(tmp_path, SOME_TREE)
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    discovery.find_files(
+        tmp_path, ["**/*.txt"], sd.some_discovery(mode=DiscoveryMode.GitIndex)
+    )
+
+    scandir_spy.assert_not_called()
+
+
+def test_find_files__git_index__untracked_files_not_matched(tmp_path: Path):
+    _create_tracked_tree(tmp_path, [SOME_FILE_NAME])
+    _create_tree(tmp_path, [f"{SOME_DIRECTORY_NAME}/{SOME_FILE_NAME}"])
+
+    result = discovery.find_files(
+        tmp_path,
+        [f"**/{SOME_FILE_NAME}"],
+        sd.some_discovery(mode=DiscoveryMode.GitIndex),
+    )
+
+    assert result == {f"**/{SOME_FILE_NAME}": [tmp_path / SOME_FILE_NAME]}
+
+
+def test_find_files__git_index_deleted_file__not_matched(tmp_path: Path):
+    _create_tracked_tree(tmp_path, [SOME_FILE_NAME, SOME_OTHER_FILE_NAME])
+    (tmp_path / SOME_OTHER_FILE_NAME).unlink()
+
+    result = discovery.find_files(
+        tmp_path, ["*.txt"], sd.some_discovery(mode=DiscoveryMode.GitIndex)
+    )
+
+    assert result == {"*.txt": [tmp_path / SOME_FILE_NAME]}
+
+
+def test_find_files__git_index_configured_exclusions__excluded_files_not_matched(
+    tmp_path: Path,
+):
+    _create_tracked_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(
+        tmp_path,
+        ["**/*.txt"],
+        sd.some_discovery(
+            exclude_patterns=frozenset(
+                {f"{SOME_DIRECTORY_NAME}/", SOME_OTHER_FILE_NAME}
+            ),
+            mode=DiscoveryMode.GitIndex,
+        ),
+    )
+
+    assert result == {
+        "**/*.txt": [tmp_path / f".{SOME_FILE_NAME}", tmp_path / SOME_FILE_NAME]
+    }
+
+
+def test_find_files__git_index_tracked_file_in_gitignore__matched(tmp_path: Path):
+    _create_tracked_tree(tmp_path, [SOME_FILE_NAME])
+    (tmp_path / ".gitignore").write_text(f"{SOME_FILE_NAME}\n")
+
+    result = discovery.find_files(
+        tmp_path, ["*.txt"], sd.some_discovery(mode=DiscoveryMode.GitIndex)
+    )
+
+    assert result == {"*.txt": [tmp_path / SOME_FILE_NAME]}
+
+
+def test_find_files__git_index_not_a_repository__error(tmp_path: Path):
+    _create_tree(tmp_path, [SOME_FILE_NAME])
+
+    with pytest.raises(NoRepositoryError):
+        discovery.find_files(
+            tmp_path, ["*.txt"], sd.some_discovery(mode=DiscoveryMode.GitIndex)
+        )
+
+
+def test_find_files__cached_and_unchanged__directories_not_scanned(
+    tmp_path: Path, mocker
+):
+    _create_tree(tmp_path, SOME_TREE)
+    _age_directories(tmp_path)
+    settings = sd.some_discovery(use_cache=True)
+    first_result = discovery.find_files(tmp_path, ["**/*.txt"], settings)
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    result = discovery.find_files(tmp_path, ["**/*.txt"], settings)
+
+    assert result == first_result
+    scandir_spy.assert_not_called()
+
+
+def test_find_files__cached_and_file_added__new_file_matched(tmp_path: Path):
+    _create_tree(tmp_path, SOME_TREE)
+    _age_directories(tmp_path)
+    settings = sd.some_discovery(use_cache=True)
+    discovery.find_files(tmp_path, ["**/*.txt"], settings)
+    _create_tree(tmp_path, [f"{SOME_OTHER_DIRECTORY_NAME}/{SOME_FILE_NAME}"])
+
+    result = discovery.find_files(tmp_path, ["**/*.txt"], settings)
+
+    assert result == {"**/*.txt": _pathlib_glob_files(tmp_path, "**/*.txt")}
+
+
+def test_find_files__cached_and_gitignore_changed__ignored_file_not_matched(
+    tmp_path: Path,
+):
+    _create_tree(tmp_path, [SOME_FILE_NAME, SOME_OTHER_FILE_NAME, ".gitignore"])
+    os.utime(tmp_path / ".gitignore", ns=(SOME_OLD_MTIME_NS, SOME_OLD_MTIME_NS))
+    _age_directories(tmp_path)
+    settings = sd.some_discovery(respect_gitignore=True, use_cache=True)
+    discovery.find_files(tmp_path, ["*.txt"], settings)
+    (tmp_path / ".gitignore").write_text(f"{SOME_OTHER_FILE_NAME}\n")
+
+    result = discovery.find_files(tmp_path, ["*.txt"], settings)
+
+    assert result == {"*.txt": [tmp_path / SOME_FILE_NAME]}
+
+
+def test_find_files__cache_disabled__directories_scanned(tmp_path: Path, mocker):
+    _create_tree(tmp_path, SOME_TREE)
+    _age_directories(tmp_path)
+    settings = sd.some_discovery(use_cache=False)
+    discovery.find_files(tmp_path, ["*.txt"], settings)
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    discovery.find_files(tmp_path, ["*.txt"], settings)
+
+    scandir_spy.assert_called_once()
+
+
+@pytest.mark.parametrize("file_glob", SOME_PARITY_GLOBS)
+def test_find_files__multiple_workers__same_files_as_pathlib_glob(
+    file_glob: str, tmp_path: Path
+):
+    _create_tree(tmp_path, SOME_TREE)
+
+    result = discovery.find_files(
+        tmp_path, [file_glob], sd.some_discovery(workers=4, use_cache=False)
+    )
+
+    assert result == {file_glob: _pathlib_glob_files(tmp_path, file_glob)}
+
+
+def test_find_files__multiple_workers__each_directory_scanned_once(
+    tmp_path: Path, mocker
+):
+    _create_tree(tmp_path, SOME_TREE)
+    scandir_spy = mocker.spy(finder.os, "scandir")
+
+    discovery.find_files(
+        tmp_path, ["**/*.txt"], sd.some_discovery(workers=4, use_cache=False)
+    )
+
+    assert sorted(Path(call.args[0]) for call in scandir_spy.call_args_list) == [
+        tmp_path,
+        tmp_path / SOME_OTHER_DIRECTORY_NAME,
+        tmp_path / SOME_DIRECTORY_NAME,
+        tmp_path / SOME_DIRECTORY_NAME / SOME_NESTED_DIRECTORY_NAME,
+    ]
+
+
+def test_find_files__multiple_workers_and_gitignore__ignored_paths_not_matched(
+    tmp_path: Path,
+):
+    _create_tree(tmp_path, SOME_TREE)
+    (tmp_path / SOME_DIRECTORY_NAME / ".gitignore").write_text(
+        f"{SOME_NESTED_DIRECTORY_NAME}/\n"
+    )
+
+    result = discovery.find_files(
+        tmp_path,
+        [f"**/{SOME_FILE_NAME}"],
+        sd.some_discovery(respect_gitignore=True, workers=4),
+    )
+
+    assert result == {
+        f"**/{SOME_FILE_NAME}": [
+            tmp_path / SOME_FILE_NAME,
+            tmp_path / SOME_DIRECTORY_NAME / SOME_FILE_NAME,
+        ]
+    }
@@ -0,0 +1,95 @@
+import fnmatch
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it.discovery.glob_set import GlobSet
+
+SOME_NAMES = [
+    "foo.txt",
+    "bar.txt",
+    "foo.md",
+    ".hidden",
+    "a-b-c",
+    "version.py",
+    "[weird].txt",
+    "archive.tar.gz",
+    "foo[.txt",
+    "no-extension",
+]
+
+
+@pytest.mark.parametrize(
+    "file_globs",
+    [
+        ["foo.txt"],
+        ["*.txt"],
+        ["*.txt", "foo.*", "*"],
+        ["f?o.*", "[fb]*.txt", "[!f]*"],
+        # older versions of fnmatch produce named groups for multiple wildcards
+        ["*a*b*", "*-*-*", "*o*o*"],
+        ["foo.txt", "*.txt", "foo.txt"],
+        ["*.tar.gz", "*.gz", "*.t[xy]t", "foo.*", "foo[.txt", "*[.]txt"],
+        ["no-*", "*extension", "*.py", "*.*"],
+    ],
+)
+def test_step__file__same_globs_as_fnmatch(file_globs: list[str]):
+    glob_set = GlobSet(file_globs)
+
+    for name in SOME_NAMES:
+        matched_globs, child_states = glob_set.step(
+            glob_set.initial_states, name, is_dir=False, is_symlink=False
+        )
+
+        assert sorted(matched_globs) == sorted(
+            file_glob
+            for file_glob in file_globs
+            if fnmatch.fnmatchcase(name, file_glob)
+        ), name
+        assert child_states == frozenset()
+
+
+def test_step__many_globs__each_matching_glob_returned():
+    literal_globs = [f"file-{index}.txt" for index in range(100)]
+    wildcard_globs = [f"*-{index}.txt" for index in range(100)]
+    glob_set = GlobSet([*literal_globs, *wildcard_globs])
+
+    matched_globs, _ = glob_set.step(
+        glob_set.initial_states, "file-42.txt", is_dir=False, is_symlink=False
+    )
+
+    assert sorted(matched_globs) == ["*-42.txt", "file-42.txt"]
+
+
+def test_step__directory__child_states_match_next_segment():
+    glob_set = GlobSet(["src/*.py", "docs/*.md", "**/*.toml"])
+
+    _, child_states = glob_set.step(
+        glob_set.initial_states, "src", is_dir=True, is_symlink=False
+    )
+    matched_globs, _ = glob_set.step(
+        child_states, "version.py", is_dir=False, is_symlink=False
+    )
+    other_matched_globs, _ = glob_set.step(
+        child_states, "pyproject.toml", is_dir=False, is_symlink=False
+    )
+
+    assert matched_globs == ["src/*.py"]
+    assert other_matched_globs == ["**/*.toml"]
+
+
+def test_step__symlink_directory__recursive_wildcard_not_followed():
+    glob_set = GlobSet(["**/*.txt"])
+
+    _, child_states = glob_set.step(
+        glob_set.initial_states, "linked", is_dir=True, is_symlink=True
+    )
+
+    assert child_states == frozenset()
+
+
+def test_step__no_match__nothing():
+    glob_set = GlobSet(["src/*.py"])
+
+    assert glob_set.step(
+        glob_set.initial_states, "docs", is_dir=True, is_symlink=False
+    ) == ([], frozenset())
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it.discovery.ignore import IgnoreRules
+
+
+@pytest.mark.parametrize(
+    ["pattern", "relative_path", "is_dir", "expected"],
+    [
+        ("foo.txt", "foo.txt", False, True),
+        ("foo.txt", "a/b/foo.txt", False, True),
+        ("foo.txt", "foo.txt.bak", False, False),
+        ("*.txt", "a/foo.txt", False, True),
+        ("*.txt", "a.txt/b", False, True),
+        ("f?o.txt", "fxo.txt", False, True),
+        ("f?o.txt", "f/o.txt", False, False),
+        ("[ab].txt", "b.txt", False, True),
+        ("[!ab].txt", "b.txt", False, False),
+        ("[!ab].txt", "c.txt", False, True),
+        ("/foo.txt", "foo.txt", False, True),
+        ("/foo.txt", "a/foo.txt", False, False),
+        ("a/foo.txt", "a/foo.txt", False, True),
+        ("a/foo.txt", "b/a/foo.txt", False, False),
+        ("build/", "build", True, True),
+        ("build/", "build", False, False),
+        ("build/", "a/build", True, True),
+        ("build/", "build/foo.txt", False, True),
+        ("**/foo.txt", "a/b/foo.txt", False, True),
+        ("**/foo.txt", "foo.txt", False, True),
+        ("a/**/foo.txt", "a/foo.txt", False, True),
+        ("a/**/foo.txt", "a/b/c/foo.txt", False, True),
+        ("a/**", "a/b/c", False, True),
+        ("a/**", "a", True, False),
+        ("# comment", "# comment", False, False),
+        ("\\#foo", "#foo", False, True),
+        ("", "", False, False),
+        ("foo.txt   ", "foo.txt", False, True),
+        ("foo\\ ", "foo ", False, True),
+        ("\\*.txt", "*.txt", False, True),
+        ("\\*.txt", "a.txt", False, False),
+    ],
+)
+def test_is_ignored__single_pattern__expected_result(
+    pattern: str, relative_path: str, is_dir: bool, expected: bool
+):
+    rules = IgnoreRules().with_patterns("", [pattern])
+
+    assert rules.is_ignored(relative_path, is_dir) == expected
+
+
+@pytest.mark.parametrize(
+    ["patterns", "relative_path", "expected"],
+    [
+        (["*.txt", "!keep.txt"], "keep.txt", False),
+        (["*.txt", "!keep.txt"], "other.txt", True),
+        (["!keep.txt", "*.txt"], "keep.txt", True),
+        (["\\!keep.txt"], "!keep.txt", True),
+    ],
+)
+def test_is_ignored__negated_pattern__last_matching_pattern_wins(
+    patterns: list[str], relative_path: str, expected: bool
+):
+    rules = IgnoreRules().with_patterns("", patterns)
+
+    assert rules.is_ignored(relative_path, is_dir=False) == expected
+
+
+@pytest.mark.parametrize(
+    ["relative_path", "expected"],
+    [
+        ("sub/foo.txt", True),
+        ("sub/nested/foo.txt", True),
+        ("foo.txt", False),
+        ("other/foo.txt", False),
+        ("sub/anchored.txt", True),
+        ("sub/nested/anchored.txt", False),
+    ],
+)
+def test_is_ignored__nested_base__relative_to_base(relative_path: str, expected: bool):
+    rules = IgnoreRules().with_patterns("sub", ["foo.txt", "/anchored.txt"])
+
+    assert rules.is_ignored(relative_path, is_dir=False) == expected
+
+
+def test_is_ignored__nested_base_negates_parent__not_ignored():
+    rules = (
+        IgnoreRules().with_patterns("", ["*.txt"]).with_patterns("sub", ["!foo.txt"])
+    )
+
+    assert not rules.is_ignored("sub/foo.txt", is_dir=False)
+    assert rules.is_ignored("foo.txt", is_dir=False)
+
+
+def test_with_patterns__only_comments__no_rules():
+    rules = IgnoreRules().with_patterns("", ["# comment", ""])
+
+    assert not rules
+
+
+def test_with_file__file_patterns_used(tmp_path: Path):
+    ignore_file = tmp_path / ".gitignore"
+    ignore_file.write_text("*.txt\n!keep.txt\n")
+
+    rules = IgnoreRules().with_file("", ignore_file)
+
+    assert rules.is_ignored("foo.txt", is_dir=False)
+    assert not rules.is_ignored("keep.txt", is_dir=False)
+
+
+def test_with_file__missing_file__no_rules(tmp_path: Path):
+    rules = IgnoreRules().with_file("", tmp_path / ".gitignore")
+
+    assert not rules
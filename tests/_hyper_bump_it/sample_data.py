@@ -12,11 +12,21 @@ from git import Repo
 from tomlkit import TOMLDocument
 
 from hyper_bump_it._hyper_bump_it.config import (
+    DEFAULT_DISCOVERY_MODE,
+    DEFAULT_DISCOVERY_WORKERS,
+    DEFAULT_EXCLUDE_PATTERNS,
+    DEFAULT_JOB_BACKEND,
+    DEFAULT_JOBS,
+    DEFAULT_RESPECT_GITIGNORE,
+    DEFAULT_STREAMING_THRESHOLD,
     BumpByArgs,
     BumpPart,
     BumpToArgs,
     Config,
     ConfigFile,
+    Discovery,
+    DiscoveryConfigFile,
+    DiscoveryMode,
     File,
     FileDefinition,
     Git,
@@ -24,6 +34,9 @@ from hyper_bump_it._hyper_bump_it.config import (
     GitActions,
     GitActionsConfigFile,
     GitConfigFile,
+    JobBackend,
+    Region,
+    RegionConfigFile,
 )
 from hyper_bump_it._hyper_bump_it.config.file import ConfigVersionUpdater
 from hyper_bump_it._hyper_bump_it.files import PlannedChange
@@ -224,6 +237,47 @@ def some_git_config_file(
     )
 
 
+SOME_EXCLUDE_PATTERN = "some-excluded-dir/"
+SOME_OTHER_EXCLUDE_PATTERN = "*.bak"
+SOME_EXCLUDE_PATTERNS = frozenset({SOME_EXCLUDE_PATTERN})
+SOME_USE_CACHE = True
+SOME_UPDATE_CACHE = True
+
+
+def some_discovery(
+    exclude_patterns: frozenset[str] = DEFAULT_EXCLUDE_PATTERNS,
+    respect_gitignore: bool = DEFAULT_RESPECT_GITIGNORE,
+    mode: DiscoveryMode = DEFAULT_DISCOVERY_MODE,
+    workers: int = DEFAULT_DISCOVERY_WORKERS,
+    use_cache: bool = SOME_USE_CACHE,
+    update_cache: bool = SOME_UPDATE_CACHE,
+) -> Discovery:
+    return Discovery(
+        exclude_patterns=exclude_patterns,
+        respect_gitignore=respect_gitignore,
+        mode=mode,
+        workers=workers,
+        use_cache=use_cache,
+        update_cache=update_cache,
+    )
+
+
+def some_discovery_config_file(
+    exclude_patterns: Union[frozenset[str], set[str]] = DEFAULT_EXCLUDE_PATTERNS,
+    extend_exclude_patterns: Union[frozenset[str], set[str]] = SOME_EXCLUDE_PATTERNS,
+    respect_gitignore: bool = DEFAULT_RESPECT_GITIGNORE,
+    mode: DiscoveryMode = DEFAULT_DISCOVERY_MODE,
+    workers: int = DEFAULT_DISCOVERY_WORKERS,
+) -> DiscoveryConfigFile:
+    return DiscoveryConfigFile(
+        exclude_patterns=frozenset(exclude_patterns),
+        extend_exclude_patterns=frozenset(extend_exclude_patterns),
+        respect_gitignore=respect_gitignore,
+        mode=mode,
+        workers=workers,
+    )
+
+
 SOME_PROJECT_ROOT = Path("fake-project-root-dir")
 SOME_FILE_GLOB = "foo*.txt"
 SOME_OTHER_FILE_GLOB = "bar*.txt"
@@ -240,11 +294,19 @@ def some_file(
     file_glob=SOME_FILE_GLOB,
     search_format_pattern=SOME_SEARCH_FORMAT_PATTERN,
     replace_format_pattern=SOME_REPLACE_FORMAT_PATTERN,
+    text_only: bool = False,
+    max_replacements: Optional[int] = None,
+    min_replacements: int = 1,
+    region: Optional[Region] = None,
 ) -> File:
     return File(
         file_glob=file_glob,
         search_format_pattern=search_format_pattern,
         replace_format_pattern=replace_format_pattern,
+        text_only=text_only,
+        max_replacements=max_replacements,
+        min_replacements=min_replacements,
+        region=region,
     )
 
 
@@ -253,12 +315,22 @@ def some_file_definition(
     keystone: bool = False,
     search_format_pattern=SOME_SEARCH_FORMAT_PATTERN,
     replace_format_pattern=SOME_REPLACE_FORMAT_PATTERN,
+    text_only: bool = False,
+    max_replacements: Optional[int] = None,
+    first_only: bool = False,
+    min_replacements: int = 1,
+    region: Optional[RegionConfigFile] = None,
 ) -> FileDefinition:
     return FileDefinition(
         file_glob=file_glob,
         keystone=keystone,
         search_format_pattern=search_format_pattern,
         replace_format_pattern=replace_format_pattern,
+        text_only=text_only,
+        max_replacements=max_replacements,
+        first_only=first_only,
+        min_replacements=min_replacements,
+        region=region,
     )
 
 
@@ -291,6 +363,8 @@ def some_config_file(
     show_confirm_prompt: bool = SOME_SHOW_CONFIRM_PROMPT,
     files: Union[list[FileDefinition], FileDefinition] = some_file_definition(),
     git: GitConfigFile = some_git_config_file(),
+    discovery: DiscoveryConfigFile = DiscoveryConfigFile(),
+    jobs: int = DEFAULT_JOBS,
 ) -> ConfigFile:
     if isinstance(files, FileDefinition):
         files = [files]
@@ -300,6 +374,8 @@ def some_config_file(
         show_confirm_prompt=show_confirm_prompt,
         files=files,
         git=git,
+        discovery=discovery,
+        jobs=jobs,
     )
 
 
@@ -350,6 +426,9 @@ def no_config_override_bump_to_args(
     config_file: Optional[Path] = None,
     dry_run: bool = False,
     patch: bool = False,
+    highlight_diff: bool = False,
+    use_cache: bool = SOME_USE_CACHE,
+    jobs: Optional[int] = None,
     skip_confirm_prompt: Optional[bool] = None,
 ) -> BumpToArgs:
     return BumpToArgs(
@@ -358,6 +437,9 @@ def no_config_override_bump_to_args(
         project_root=project_root,
         dry_run=dry_run,
         patch=patch,
+        highlight_diff=highlight_diff,
+        use_cache=use_cache,
+        jobs=jobs,
         skip_confirm_prompt=skip_confirm_prompt,
         current_version=None,
         commit=None,
@@ -378,6 +460,9 @@ def some_bump_to_args(
     config_file: Optional[Path] = None,
     dry_run: bool = False,
     patch: bool = False,
+    highlight_diff: bool = False,
+    use_cache: bool = SOME_USE_CACHE,
+    jobs: Optional[int] = None,
     skip_confirm_prompt: Optional[bool] = None,
     current_version: Optional[Version] = SOME_OTHER_PARTIAL_VERSION,
     commit: Optional[GitAction] = SOME_COMMIT_ACTION,
@@ -396,6 +481,9 @@ def some_bump_to_args(
         project_root=project_root,
         dry_run=dry_run,
         patch=patch,
+        highlight_diff=highlight_diff,
+        use_cache=use_cache,
+        jobs=jobs,
         skip_confirm_prompt=skip_confirm_prompt,
         current_version=current_version,
         commit=commit,
@@ -420,6 +508,9 @@ def no_config_override_bump_by_args(
     config_file: Optional[Path] = None,
     dry_run: bool = False,
     patch: bool = False,
+    highlight_diff: bool = False,
+    use_cache: bool = SOME_USE_CACHE,
+    jobs: Optional[int] = None,
     skip_confirm_prompt: Optional[bool] = None,
 ) -> BumpByArgs:
     return BumpByArgs(
@@ -428,6 +519,9 @@ def no_config_override_bump_by_args(
         project_root=project_root,
         dry_run=dry_run,
         patch=patch,
+        highlight_diff=highlight_diff,
+        use_cache=use_cache,
+        jobs=jobs,
         skip_confirm_prompt=skip_confirm_prompt,
         current_version=None,
         commit=None,
@@ -448,6 +542,9 @@ def some_bump_by_args(
     config_file: Optional[Path] = None,
     dry_run: bool = False,
     patch: bool = False,
+    highlight_diff: bool = False,
+    use_cache: bool = SOME_USE_CACHE,
+    jobs: Optional[int] = None,
     skip_confirm_prompt: Optional[bool] = None,
     current_version: Optional[Version] = SOME_OTHER_PARTIAL_VERSION,
     commit: Optional[GitAction] = SOME_COMMIT_ACTION,
@@ -468,6 +565,9 @@ def some_bump_by_args(
         project_root=project_root,
         dry_run=dry_run,
         patch=patch,
+        highlight_diff=highlight_diff,
+        use_cache=use_cache,
+        jobs=jobs,
         skip_confirm_prompt=skip_confirm_prompt,
         current_version=current_version,
         commit=commit,
@@ -490,7 +590,7 @@ class AnyConfigVersionUpdater(ConfigVersionUpdater):
     """A helper object that compares equal to any ConfigVersionUpdater instance."""
 
     def __init__(self):
-        super().__init__(Path(), Path(), TOMLDocument(), TOMLDocument(), newline=None)
+        super().__init__(Path(), Path(), TOMLDocument(), TOMLDocument())
 
     def __eq__(self, other):
         return isinstance(other, ConfigVersionUpdater)
@@ -508,8 +608,13 @@ def some_application_config(
     new_version: Version = SOME_OTHER_VERSION,
     files: Optional[list[File]] = None,
     git: Git = some_git(),
+    discovery: Discovery = some_discovery(),
+    streaming_threshold: int = DEFAULT_STREAMING_THRESHOLD,
+    jobs: int = DEFAULT_JOBS,
+    job_backend: JobBackend = DEFAULT_JOB_BACKEND,
     dry_run: bool = False,
     patch: bool = False,
+    highlight_diff: bool = False,
     show_confirm_prompt: bool = True,
     config_version_updater: Optional[ConfigVersionUpdater] = AnyConfigVersionUpdater(),
 ) -> Config:
@@ -521,8 +626,13 @@ def some_application_config(
         project_root=project_root,
         files=files,
         git=git,
+        discovery=discovery,
+        streaming_threshold=streaming_threshold,
+        jobs=jobs,
+        job_backend=job_backend,
         dry_run=dry_run,
         patch=patch,
+        highlight_diff=highlight_diff,
         show_confirm_prompt=show_confirm_prompt,
         config_version_updater=config_version_updater,
     )
@@ -533,14 +643,12 @@ def some_planned_change(
     project_root=SOME_ABSOLUTE_DIRECTORY,
     old_content=SOME_FILE_CONTENT,
     new_content=SOME_OTHER_FILE_CONTENT,
-    newline: Optional[str] = "\n",
 ) -> PlannedChange:
-    return PlannedChange(
+    return PlannedChange.from_text(
         file=file,
         project_root=project_root,
         old_content=old_content,
         new_content=new_content,
-        newline=newline,
     )
 
 
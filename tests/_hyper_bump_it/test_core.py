@@ -1,17 +1,26 @@
+import os
 from io import StringIO
 from pathlib import Path
+from textwrap import dedent
 
+import pytest
 import tomlkit
 
 from hyper_bump_it._hyper_bump_it import core
 from hyper_bump_it._hyper_bump_it.config import (
+    PYPROJECT_FILE_NAME,
     Config,
     ConfigVersionUpdater,
     GitAction,
+    application,
     file,
 )
+from hyper_bump_it._hyper_bump_it.format_pattern import keys
 from tests._hyper_bump_it import sample_data as sd
 
+# Well in the past, so the times are not considered to be racy
+SOME_OLD_MTIME_NS = 1_600_000_000_000_000_000
+
 
 def test_do_bump__keystone_no_git_confirm_prompt__file_updated(
     tmp_path: Path, force_input
@@ -69,7 +78,6 @@ def test_do_bump__config_version_no_git__files_updated(tmp_path: Path):
             project_root,
             toml_doc,
             toml_doc[file.ROOT_TABLE_KEY],
-            newline="\n",
         ),
     )
 
@@ -87,6 +95,96 @@ def test_do_bump__config_version_no_git__files_updated(tmp_path: Path):
     )
 
 
+def _pyproject_text(current_version: str, version: str, release: str) -> str:
+    return dedent(f"""\
+        [project]
+        name = "foo"
+        version = "{version}"
+        release = "{release}"
+
+        [tool.{file.ROOT_TABLE_KEY}]
+        current_version = "{current_version}"
+
+        [[tool.{file.ROOT_TABLE_KEY}.files]]
+        file_glob = "{PYPROJECT_FILE_NAME}"
+        """)
+
+
+@pytest.mark.parametrize(
+    ["key", "expected_version", "expected_release"],
+    [
+        # also matches the version in the configuration table
+        ("version", sd.SOME_OTHER_VERSION_STRING, sd.SOME_VERSION_STRING),
+        ("release", sd.SOME_VERSION_STRING, sd.SOME_OTHER_VERSION_STRING),
+    ],
+)
+def test_do_bump__config_file_matched_by_file_definition__both_changes_written(
+    tmp_path: Path, key: str, expected_version: str, expected_release: str
+):
+    pyproject_file = tmp_path / PYPROJECT_FILE_NAME
+    pyproject_file.write_text(
+        _pyproject_text(
+            sd.SOME_VERSION_STRING, sd.SOME_VERSION_STRING, sd.SOME_VERSION_STRING
+        )
+    )
+    _, updater = file.read_pyproject_config(pyproject_file, tmp_path)
+    config = sd.some_application_config(
+        project_root=tmp_path,
+        files=[
+            sd.some_file(
+                PYPROJECT_FILE_NAME,
+                search_format_pattern=f'{key} = "{{{keys.VERSION}}}"',
+                replace_format_pattern=f'{key} = "{{{keys.NEW_VERSION}}}"',
+            )
+        ],
+        git=sd.some_git(
+            actions=sd.some_git_actions(GitAction.Skip, GitAction.Skip, GitAction.Skip)
+        ),
+        show_confirm_prompt=False,
+        config_version_updater=updater,
+    )
+
+    core.do_bump(config)
+
+    assert pyproject_file.read_text() == _pyproject_text(
+        sd.SOME_OTHER_VERSION_STRING, expected_version, expected_release
+    )
+
+
+def test_do_bump__patch_config_file_matched_by_file_definition__single_patch_for_file(
+    tmp_path: Path, capture_rich: StringIO
+):
+    pyproject_file = tmp_path / PYPROJECT_FILE_NAME
+    pyproject_file.write_text(
+        _pyproject_text(
+            sd.SOME_VERSION_STRING, sd.SOME_VERSION_STRING, sd.SOME_VERSION_STRING
+        )
+    )
+    _, updater = file.read_pyproject_config(pyproject_file, tmp_path)
+    config = sd.some_application_config(
+        project_root=tmp_path,
+        files=[
+            sd.some_file(
+                PYPROJECT_FILE_NAME,
+                search_format_pattern=f'release = "{{{keys.VERSION}}}"',
+                replace_format_pattern=f'release = "{{{keys.NEW_VERSION}}}"',
+            )
+        ],
+        git=sd.some_git(
+            actions=sd.some_git_actions(GitAction.Skip, GitAction.Skip, GitAction.Skip)
+        ),
+        patch=True,
+        config_version_updater=updater,
+    )
+
+    core.do_bump(config)
+
+    output = capture_rich.getvalue()
+    assert output.count(f"--- {PYPROJECT_FILE_NAME}\n") == 1
+    assert f'+release = "{sd.SOME_OTHER_VERSION_STRING}"' in output
+    assert f'+current_version = "{sd.SOME_OTHER_VERSION_STRING}"' in output
+
+
 def test_do_bump__keystone_git__file_updated(tmp_path: Path):
     git_repo = sd.some_git_repo(tmp_path, remote=sd.SOME_REMOTE)
     project_root = git_repo.committed_file.parent
@@ -153,6 +251,26 @@ def test_do_bump__patch_keystone__file_unchanged(tmp_path: Path):
     _no_edits(tmp_path, config)
 
 
+def test_do_bump__text_only_binary_file__skip_displayed(
+    tmp_path: Path, capture_rich: StringIO
+):
+    config = sd.some_application_config(
+        project_root=tmp_path,
+        files=[sd.some_file(text_only=True)],
+        git=sd.some_git(
+            actions=sd.some_git_actions(GitAction.Skip, GitAction.Skip, GitAction.Skip)
+        ),
+        config_version_updater=None,
+        dry_run=True,
+    )
+    (tmp_path / sd.SOME_GLOB_MATCHED_FILE_NAME).write_text(f"--{sd.SOME_VERSION}--")
+    (tmp_path / "foo-2.txt").write_bytes(b"\x00\xff")
+
+    core.do_bump(config)
+
+    assert "Skip 1 binary file" in capture_rich.getvalue()
+
+
 def test_do_bump__patch_keystone__only_patch_output(
     tmp_path: Path, capture_rich: StringIO
 ):
@@ -191,7 +309,6 @@ def test_do_bump__patch_no_keystone__file_unchanged(tmp_path: Path):
             project_root,
             toml_doc,
             toml_doc[file.ROOT_TABLE_KEY],
-            newline="\n",
         ),
         patch=True,
     )
@@ -218,7 +335,6 @@ def test_do_bump__patch_no_keystone__only_patch_output(
             project_root,
             toml_doc,
             toml_doc[file.ROOT_TABLE_KEY],
-            newline="\n",
         ),
         patch=True,
     )
@@ -231,6 +347,55 @@ def test_do_bump__patch_no_keystone__only_patch_output(
     assert capture_rich.getvalue() == sd.SOME_DIFF_NO_KEYSTONE
 
 
+@pytest.mark.parametrize(["dry_run", "patch"], [(True, False), (False, True)])
+def test_do_bump__preview_git_repository__project_and_git_directory_untouched(
+    tmp_path: Path, user_cache_dir: Path, dry_run: bool, patch: bool
+):
+    git_repo = sd.some_git_repo(tmp_path)
+    project_root = git_repo.path
+    config_file = project_root / sd.SOME_CONFIG_FILE_NAME
+    config_file.write_text(
+        sd.some_minimal_config_text(file.ROOT_TABLE_KEY, sd.SOME_VERSION_STRING)
+    )
+    (project_root / sd.SOME_GLOB_MATCHED_FILE_NAME).write_text(f"--{sd.SOME_VERSION}--")
+    config = application.config_for_bump_to(
+        sd.some_bump_to_args(
+            project_root,
+            config_file=config_file,
+            dry_run=dry_run,
+            patch=patch,
+            use_cache=True,
+            skip_confirm_prompt=True,
+            current_version=None,
+            commit=GitAction.Skip,
+            branch=GitAction.Skip,
+            tag=GitAction.Skip,
+        )
+    )
+    # Recently modified directories are never cached, so the directories are made old enough for
+    # the results of the walk to be stored.
+    for path in [project_root, *project_root.rglob("*")]:
+        if path.is_dir():
+            os.utime(path, ns=(SOME_OLD_MTIME_NS, SOME_OLD_MTIME_NS))
+    original_tree = _tree_state(project_root)
+
+    core.do_bump(config)
+
+    assert _tree_state(project_root) == original_tree
+    assert not any(user_cache_dir.iterdir())
+
+
+def _tree_state(root: Path) -> dict[Path, tuple[int, bytes]]:
+    # modification time and contents of every path, including the git directory
+    return {
+        path: (
+            path.stat().st_mtime_ns,
+            b"" if path.is_dir() else path.read_bytes(),
+        )
+        for path in [root, *root.rglob("*")]
+    }
+
+
 def _no_edits(tmp_path: Path, config: Config):
     original_text = f"--{sd.SOME_VERSION}--"
     some_file = tmp_path / sd.SOME_GLOB_MATCHED_FILE_NAME
@@ -0,0 +1,189 @@
+import random
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it import diff
+from hyper_bump_it._hyper_bump_it.diff import Replacement
+
+SOME_FILE_NAME = "foo.txt"
+
+
+def _replace_all(
+    data: bytes, search_data: bytes, replace_data: bytes
+) -> list[Replacement]:
+    replacements = []
+    position = 0
+    while (start := data.find(search_data, position)) != -1:
+        replacements.append((start, len(search_data), replace_data))
+        position = start + len(search_data)
+    return replacements
+
+
+def _some_lines(count: int) -> bytes:
+    return b"".join(b"line %d\n" % index for index in range(count))
+
+
+@pytest.mark.parametrize(
+    ["data", "replacements"],
+    [
+        (b"", []),
+        (b"abc\n", []),
+        (b"1.2.3\n", [(0, 5, b"4.5.6")]),
+        (b"1.2.3", [(0, 5, b"4.5.6")]),
+        (b"a\r\n1.2.3\r\nb\r\n", [(3, 5, b"4.5.6")]),
+        (b"a-1.2.3-b-1.2.3\n", [(2, 5, b"4.5.6"), (10, 5, b"4")]),
+        # the replacement does not change anything
+        (b"a\n1.2.3\nb\n", [(2, 5, b"1.2.3")]),
+        # added to the end of the last line
+        (b"a\nb", [(3, 0, b"c")]),
+        # added after the last line
+        (b"a\nb\n", [(4, 0, b"c")]),
+        (b"", [(0, 0, b"abc")]),
+        # the replacement contains or removes line breaks
+        (b"a\n1.2.3\nb\n", [(2, 5, b"4\n5")]),
+        (b"a\n1.2.3\nb\n", [(1, 7, b"")]),
+        # line breaks other than "\n" and "\r\n"
+        (b"a\r1.2.3\rb", [(2, 5, b"4.5.6")]),
+        (b"a\x0c1.2.3\nb", [(2, 5, b"4.5.6")]),
+        ("a 1.2.3\nb".encode(), [(4, 5, b"4.5.6")]),
+        (b"a\r\n1.2.3\r\n", [(2, 0, b"x")]),
+        # the new line is the same as another line in the file
+        (b"v=1.2.3\nv=2.0.0\n", [(2, 5, b"2.0.0")]),
+        # the old line is the same as another line in the file that is not replaced
+        (b"v=1.2.3\nv=1.2.3\n", [(2, 5, b"2.0.0")]),
+        (b"v=1.2.3\nv=1.2.3\n", [(2, 5, b"2.0.0"), (10, 5, b"2.0.0")]),
+        # changed lines are near the start and end
+        (_some_lines(2) + b"1.2.3\n" + _some_lines(2), [(14, 5, b"2.0.0")]),
+        # unchanged lines between hunks
+        *(
+            (
+                b"1.2.3\n" + _some_lines(count) + b"1.2.3\n",
+                [(0, 5, b"2.0.0"), (6 + count * 7, 5, b"2.0.0")],
+            )
+            for count in (0, 5, 6, 7, 8)
+        ),
+    ],
+)
+def test_replacement_diff__same_as_unified_diff(
+    data: bytes, replacements: list[Replacement]
+):
+    result = diff.replacement_diff(SOME_FILE_NAME, data, replacements)
+
+    assert result == diff.unified_diff(
+        SOME_FILE_NAME, data, diff.apply_replacements(data, replacements)
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_replacement_diff__random_contents__same_as_unified_diff(seed: int):
+    generator = random.Random(seed)
+    lines = [
+        generator.choice(
+            [b"", b"}", b"v 1.2.3", b"v 1.2.3 %d" % index, b"l %d" % index]
+        )
+        for index in range(generator.choice([10, 250]))
+    ]
+    data = b"\n".join(lines) + generator.choice([b"", b"\n"])
+    replacements = [
+        replacement
+        for replacement in _replace_all(data, b"1.2.3", b"2.0.0")
+        if generator.random() < 0.8
+    ]
+
+    result = diff.replacement_diff(SOME_FILE_NAME, data, replacements)
+
+    assert result == diff.unified_diff(
+        SOME_FILE_NAME, data, diff.apply_replacements(data, replacements)
+    )
+
+
+def test_replacement_diff__replaced_lines_unique__contents_not_compared(mocker):
+    data = b"".join(
+        [
+            _some_lines(300),
+            b"version = 1.2.3\n",
+            b"".join(b"other %d\n" % index for index in range(100)),
+            b"version = 1.2.3\n",
+        ]
+    )
+    unified_diff = mocker.spy(diff, "unified_diff")
+
+    result = diff.replacement_diff(
+        SOME_FILE_NAME, data, _replace_all(data, b"1.2.3", b"2.0.0")
+    )
+
+    assert result == (
+        f"--- {SOME_FILE_NAME}\n"
+        f"+++ {SOME_FILE_NAME}\n"
+        "@@ -298,7 +298,7 @@\n"
+        " line 297\n"
+        " line 298\n"
+        " line 299\n"
+        "-version = 1.2.3\n"
+        "+version = 2.0.0\n"
+        " other 0\n"
+        " other 1\n"
+        " other 2\n"
+        "@@ -399,4 +399,4 @@\n"
+        " other 97\n"
+        " other 98\n"
+        " other 99\n"
+        "-version = 1.2.3\n"
+        "+version = 2.0.0\n"
+    )
+    unified_diff.assert_not_called()
+
+
+def test_replacement_diff__only_common_lines_between_changes__contents_compared(
+    mocker,
+):
+    # `difflib` does not pair up lines that are too common in long sequences
+    data = b"".join([_some_lines(300), b"a 1.2.3\n", b"\n", b"b 1.2.3\n", b"\n" * 100])
+    replacements = _replace_all(data, b"1.2.3", b"2.0.0")
+    unified_diff = mocker.spy(diff, "unified_diff")
+
+    result = diff.replacement_diff(SOME_FILE_NAME, data, replacements)
+
+    assert "-a 1.2.3\n-\n-b 1.2.3\n" in result
+    unified_diff.assert_called_once()
+
+
+def test_shorten_long_lines__short_lines__unchanged():
+    diff_text = diff.replacement_diff(SOME_FILE_NAME, b"a\n1.2.3\nb\n", [(2, 5, b"4")])
+
+    assert diff.shorten_long_lines(diff_text) == diff_text
+
+
+def test_shorten_long_lines__long_changed_line__characters_around_changes_kept():
+    line = b"".join([b"a" * 1000, b"1.2.3", b"b" * 1000, b"1.2.3", b"c" * 1000])
+    diff_text = diff.replacement_diff(
+        SOME_FILE_NAME, line + b"\n", _replace_all(line, b"1.2.3", b"1.10.0")
+    )
+
+    result = diff.shorten_long_lines(diff_text)
+
+    lines = result.splitlines()
+    removed, added = lines[3:]
+    assert lines[:3] == diff_text.splitlines()[:3]
+    assert removed.startswith("-[...")
+    assert added.startswith("+[...")
+    for old_text, new_text in (("a1.2.3b", "a1.10.0b"), ("b1.2.3c", "b1.10.0c")):
+        assert old_text in removed
+        assert new_text in added
+    assert len(removed) < 8 * diff.DISPLAY_LINE_CONTEXT
+    assert len(added) < 8 * diff.DISPLAY_LINE_CONTEXT
+
+
+def test_shorten_long_lines__long_unchanged_line__start_kept():
+    long_line = "x" * (diff.MAX_DISPLAY_LINE_LENGTH + 1)
+    diff_text = f"--- {SOME_FILE_NAME}\n+++ {SOME_FILE_NAME}\n@@ -1,2 +1,2 @@\n {long_line}\n-a\n+b\n"
+
+    result = diff.shorten_long_lines(diff_text)
+
+    assert result.splitlines()[3:] == [
+        " "
+        + "x" * diff.DISPLAY_LINE_CONTEXT
+        + f"[...{len(long_line) - diff.DISPLAY_LINE_CONTEXT} characters...]",
+        "-a",
+        "+b",
+    ]
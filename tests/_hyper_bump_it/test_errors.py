@@ -1,3 +1,4 @@
+import pickle
 from io import StringIO
 from pathlib import Path
 from typing import Literal
@@ -16,108 +17,118 @@ SOME_REF_TYPE: Literal["branch"] = "branch"
 SOME_SUB_TABLES = ("some-name", "some-sub-name")
 
 
-@pytest.mark.parametrize(
-    "exception",
-    [
-        error.BumpItError(SOME_ERROR_MESSAGE),
-        error.FormatKeyError(sd.SOME_SEARCH_FORMAT_PATTERN, SOME_VALID_KEYS),
-        error.FormatKeyError(sd.SOME_ESCAPE_REQUIRED_TEXT, SOME_VALID_KEYS),
-        error.FormatPatternError(sd.SOME_SEARCH_FORMAT_PATTERN, SOME_ERROR_MESSAGE),
-        error.FormatPatternError(sd.SOME_ESCAPE_REQUIRED_TEXT, SOME_ERROR_MESSAGE),
-        error.TodayFormatKeyError(sd.SOME_SEARCH_FORMAT_PATTERN, SOME_VALID_KEYS),
-        error.TodayFormatKeyError(sd.SOME_ESCAPE_REQUIRED_TEXT, SOME_VALID_KEYS),
-        error.IncompleteKeystoneVersionError(
-            Path(sd.SOME_GLOB_MATCHED_FILE_NAME), sd.SOME_SEARCH_FORMAT_PATTERN
-        ),
-        error.IncompleteKeystoneVersionError(
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
-        ),
-        error.FileGlobError(Path(sd.SOME_DIRECTORY_NAME), sd.SOME_FILE_GLOB),
-        error.FileGlobError(
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
-        ),
-        error.PathTraversalError(
-            Path(sd.SOME_DIRECTORY_NAME),
-            sd.SOME_FILE_GLOB,
-            Path(sd.SOME_GLOB_MATCHED_FILE_NAME),
-        ),
-        error.PathTraversalError(
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
-            sd.SOME_ESCAPE_REQUIRED_TEXT,
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
-        ),
-        error.KeystoneFileGlobError(sd.SOME_FILE_GLOB, []),
-        error.KeystoneFileGlobError(
-            sd.SOME_FILE_GLOB,
-            [sd.SOME_GLOB_MATCHED_FILE_NAME, sd.SOME_OTHER_GLOB_MATCHED_FILE_NAME],
-        ),
-        error.KeystoneFileGlobError(
-            sd.SOME_ESCAPE_REQUIRED_TEXT,
-            [sd.SOME_ESCAPE_REQUIRED_TEXT, sd.SOME_OTHER_GLOB_MATCHED_FILE_NAME],
-        ),
-        error.VersionNotFound(
-            Path(sd.SOME_DIRECTORY_NAME), sd.SOME_SEARCH_FORMAT_PATTERN
-        ),
-        error.SearchTextNotFound(
-            Path(sd.SOME_DIRECTORY_NAME), sd.SOME_SEARCH_FORMAT_PATTERN
-        ),
-        error.VersionNotFound(
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
-        ),
-        error.NoRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
-        error.NoRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
-        error.EmptyRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
-        error.EmptyRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
-        error.DirtyRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
-        error.DirtyRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
-        error.DetachedRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
-        error.DetachedRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
-        error.MissingRemoteError(sd.SOME_REMOTE, Path(sd.SOME_DIRECTORY_NAME)),
-        error.MissingRemoteError(
-            sd.SOME_ESCAPE_REQUIRED_TEXT, Path(sd.SOME_ESCAPE_REQUIRED_TEXT)
-        ),
-        error.DisallowedInitialBranchError(
-            frozenset({sd.SOME_ALLOWED_BRANCH}),
-            sd.SOME_BRANCH,
-            Path(sd.SOME_DIRECTORY_NAME),
-        ),
-        error.DisallowedInitialBranchError(
-            frozenset({sd.SOME_ESCAPE_REQUIRED_TEXT}),
-            sd.SOME_ESCAPE_REQUIRED_TEXT,
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
-        ),
-        error.DisallowedInitialBranchError(
-            frozenset({sd.SOME_ALLOWED_BRANCH, sd.SOME_OTHER_ALLOWED_BRANCH}),
-            sd.SOME_BRANCH,
-            Path(sd.SOME_DIRECTORY_NAME),
-        ),
-        error.DisallowedInitialBranchError(
-            frozenset({sd.SOME_ESCAPE_REQUIRED_TEXT, sd.SOME_OTHER_ALLOWED_BRANCH}),
-            sd.SOME_ESCAPE_REQUIRED_TEXT,
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
-        ),
-        error.AlreadyExistsError(
-            SOME_REF_TYPE, sd.SOME_BRANCH, Path(sd.SOME_DIRECTORY_NAME)
-        ),
-        error.AlreadyExistsError(
-            SOME_REF_TYPE,
-            sd.SOME_ESCAPE_REQUIRED_TEXT,
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
-        ),
-        error.ConfigurationFileNotFoundError(Path(sd.SOME_DIRECTORY_NAME)),
-        error.ConfigurationFileNotFoundError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
-        error.ConfigurationFileReadError(
-            Path(sd.SOME_CONFIG_FILE_NAME), Exception(SOME_ERROR_MESSAGE)
-        ),
-        error.ConfigurationFileReadError(
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT), Exception(sd.SOME_ESCAPE_REQUIRED_TEXT)
-        ),
-        error.SubTableNotExistError(Path(sd.SOME_CONFIG_FILE_NAME), SOME_SUB_TABLES),
-        error.SubTableNotExistError(
-            Path(sd.SOME_ESCAPE_REQUIRED_TEXT), SOME_SUB_TABLES
-        ),
-    ],
-)
+SOME_ERRORS = [
+    error.BumpItError(SOME_ERROR_MESSAGE),
+    error.FormatKeyError(sd.SOME_SEARCH_FORMAT_PATTERN, SOME_VALID_KEYS),
+    error.FormatKeyError(sd.SOME_ESCAPE_REQUIRED_TEXT, SOME_VALID_KEYS),
+    error.FormatPatternError(sd.SOME_SEARCH_FORMAT_PATTERN, SOME_ERROR_MESSAGE),
+    error.FormatPatternError(sd.SOME_ESCAPE_REQUIRED_TEXT, SOME_ERROR_MESSAGE),
+    error.TodayFormatKeyError(sd.SOME_SEARCH_FORMAT_PATTERN, SOME_VALID_KEYS),
+    error.TodayFormatKeyError(sd.SOME_ESCAPE_REQUIRED_TEXT, SOME_VALID_KEYS),
+    error.IncompleteKeystoneVersionError(
+        Path(sd.SOME_GLOB_MATCHED_FILE_NAME), sd.SOME_SEARCH_FORMAT_PATTERN
+    ),
+    error.IncompleteKeystoneVersionError(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
+    ),
+    error.FileGlobError(Path(sd.SOME_DIRECTORY_NAME), sd.SOME_FILE_GLOB),
+    error.FileGlobError(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
+    ),
+    error.PathTraversalError(
+        Path(sd.SOME_DIRECTORY_NAME),
+        sd.SOME_FILE_GLOB,
+        Path(sd.SOME_GLOB_MATCHED_FILE_NAME),
+    ),
+    error.PathTraversalError(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
+        sd.SOME_ESCAPE_REQUIRED_TEXT,
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
+    ),
+    error.KeystoneFileGlobError(sd.SOME_FILE_GLOB, []),
+    error.KeystoneFileGlobError(
+        sd.SOME_FILE_GLOB,
+        [sd.SOME_GLOB_MATCHED_FILE_NAME, sd.SOME_OTHER_GLOB_MATCHED_FILE_NAME],
+    ),
+    error.KeystoneFileGlobError(
+        sd.SOME_ESCAPE_REQUIRED_TEXT,
+        [sd.SOME_ESCAPE_REQUIRED_TEXT, sd.SOME_OTHER_GLOB_MATCHED_FILE_NAME],
+    ),
+    error.VersionNotFound(Path(sd.SOME_DIRECTORY_NAME), sd.SOME_SEARCH_FORMAT_PATTERN),
+    error.SearchTextNotFound(
+        Path(sd.SOME_DIRECTORY_NAME), sd.SOME_SEARCH_FORMAT_PATTERN
+    ),
+    error.RegionNotFoundError(Path(sd.SOME_DIRECTORY_NAME), "section [package]"),
+    error.RegionNotFoundError(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
+    ),
+    error.TooFewMatchesError(
+        Path(sd.SOME_DIRECTORY_NAME), sd.SOME_SEARCH_FORMAT_PATTERN, 1, 2
+    ),
+    error.TooFewMatchesError(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT, 1, 2
+    ),
+    error.FileChangedError(Path(sd.SOME_GLOB_MATCHED_FILE_NAME)),
+    error.FileChangedError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.FileEncodingError(Path(sd.SOME_GLOB_MATCHED_FILE_NAME)),
+    error.FileEncodingError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.VersionNotFound(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT), sd.SOME_ESCAPE_REQUIRED_TEXT
+    ),
+    error.NoRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
+    error.NoRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.EmptyRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
+    error.EmptyRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.DirtyRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
+    error.DirtyRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.DetachedRepositoryError(Path(sd.SOME_DIRECTORY_NAME)),
+    error.DetachedRepositoryError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.MissingRemoteError(sd.SOME_REMOTE, Path(sd.SOME_DIRECTORY_NAME)),
+    error.MissingRemoteError(
+        sd.SOME_ESCAPE_REQUIRED_TEXT, Path(sd.SOME_ESCAPE_REQUIRED_TEXT)
+    ),
+    error.DisallowedInitialBranchError(
+        frozenset({sd.SOME_ALLOWED_BRANCH}),
+        sd.SOME_BRANCH,
+        Path(sd.SOME_DIRECTORY_NAME),
+    ),
+    error.DisallowedInitialBranchError(
+        frozenset({sd.SOME_ESCAPE_REQUIRED_TEXT}),
+        sd.SOME_ESCAPE_REQUIRED_TEXT,
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
+    ),
+    error.DisallowedInitialBranchError(
+        frozenset({sd.SOME_ALLOWED_BRANCH, sd.SOME_OTHER_ALLOWED_BRANCH}),
+        sd.SOME_BRANCH,
+        Path(sd.SOME_DIRECTORY_NAME),
+    ),
+    error.DisallowedInitialBranchError(
+        frozenset({sd.SOME_ESCAPE_REQUIRED_TEXT, sd.SOME_OTHER_ALLOWED_BRANCH}),
+        sd.SOME_ESCAPE_REQUIRED_TEXT,
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
+    ),
+    error.AlreadyExistsError(
+        SOME_REF_TYPE, sd.SOME_BRANCH, Path(sd.SOME_DIRECTORY_NAME)
+    ),
+    error.AlreadyExistsError(
+        SOME_REF_TYPE,
+        sd.SOME_ESCAPE_REQUIRED_TEXT,
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT),
+    ),
+    error.ConfigurationFileNotFoundError(Path(sd.SOME_DIRECTORY_NAME)),
+    error.ConfigurationFileNotFoundError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT)),
+    error.ConfigurationFileReadError(
+        Path(sd.SOME_CONFIG_FILE_NAME), Exception(SOME_ERROR_MESSAGE)
+    ),
+    error.ConfigurationFileReadError(
+        Path(sd.SOME_ESCAPE_REQUIRED_TEXT), Exception(sd.SOME_ESCAPE_REQUIRED_TEXT)
+    ),
+    error.SubTableNotExistError(Path(sd.SOME_CONFIG_FILE_NAME), SOME_SUB_TABLES),
+    error.SubTableNotExistError(Path(sd.SOME_ESCAPE_REQUIRED_TEXT), SOME_SUB_TABLES),
+]
+
+
+@pytest.mark.parametrize("exception", SOME_ERRORS)
 def test_errors__rich_output__equivalent_to_str_representation(
     exception, capture_rich: StringIO
 ):
@@ -127,6 +138,16 @@ def test_errors__rich_output__equivalent_to_str_representation(
     assert rich_content.strip().replace("\n", " ") == str(exception)
 
 
+@pytest.mark.parametrize("exception", SOME_ERRORS)
+def test_errors__pickled__same_attributes(exception):
+    result = pickle.loads(pickle.dumps(exception))
+
+    assert type(result) is type(exception)
+    assert str(result) == str(exception)
+    assert result.args == exception.args
+    assert result.__dict__.keys() == exception.__dict__.keys()
+
+
 @pytest.mark.parametrize(
     ["description", "kwargs", "expected_content"],
     [
@@ -366,6 +366,27 @@ def test_update_file_actions__multi_display__each_name_appears(capture_rich: Str
     assert sd.SOME_OTHER_GLOB_MATCHED_FILE_NAME in output
 
 
+def test_skip_files_action__call__nothing_displayed(capture_rich: StringIO):
+    action = execution_plan.skip_files_action([sd.SOME_ABSOLUTE_DIRECTORY])
+
+    action()
+
+    assert capture_rich.getvalue() == ""
+
+
+@pytest.mark.parametrize(
+    ["count", "expected_text"], [(1, "Skip 1 binary file "), (2, "Skip 2 binary files")]
+)
+def test_skip_files_action__display__count_displayed(
+    count: int, expected_text: str, capture_rich: StringIO
+):
+    action = execution_plan.skip_files_action([sd.SOME_ABSOLUTE_DIRECTORY] * count)
+
+    action.display_intent()
+
+    assert expected_text in capture_rich.getvalue()
+
+
 def test_display_file_patches__call__error():
     action = execution_plan.DisplayFilePatchesAction([])
 
@@ -757,3 +778,18 @@ def test_git_actions__some_git_actions__expected_action_lists(
 
     for action, expected_type in zip_longest(final_actions, expected_final_actions):
         assert isinstance(action, expected_type)
+
+
+def test_update_file_actions__display_long_line__shortened(capture_rich: StringIO):
+    padding = "x" * 1000
+    planned_change = sd.some_planned_change(
+        old_content=f"{padding}{sd.SOME_VERSION}{padding}",
+        new_content=f"{padding}{sd.SOME_OTHER_VERSION}{padding}",
+    )
+    action = execution_plan.update_file_actions([planned_change])
+
+    action.display_intent()
+
+    output = capture_rich.getvalue()
+    assert "characters...]" in output
+    assert padding not in output
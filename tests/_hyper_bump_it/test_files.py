@@ -1,19 +1,30 @@
-import os
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional
+from typing import cast
 
 import pytest
 from freezegun.api import FrozenDateTimeFactory
 
-from hyper_bump_it._hyper_bump_it import files
+from hyper_bump_it._hyper_bump_it import files, format_pattern, run_cache, search
+from hyper_bump_it._hyper_bump_it.config import (
+    DEFAULT_STREAMING_THRESHOLD,
+    File,
+    JobBackend,
+    Region,
+)
 from hyper_bump_it._hyper_bump_it.error import (
+    FileChangedError,
+    FileEncodingError,
     FileGlobError,
     PathTraversalError,
+    RegionNotFoundError,
     SearchTextNotFound,
+    TooFewMatchesError,
 )
 from hyper_bump_it._hyper_bump_it.files import PlannedChange
-from hyper_bump_it._hyper_bump_it.format_pattern import keys
+from hyper_bump_it._hyper_bump_it.format_pattern import TextFormatter, keys
+from hyper_bump_it._hyper_bump_it.planned_changes import FileChange, StreamedChange
+from hyper_bump_it._hyper_bump_it.run_cache import RunCache
 from tests._hyper_bump_it import sample_data as sd
 
 SOME_FILE_NAME = "foo.txt"
@@ -50,56 +61,54 @@ TEXT_FORMATTER = sd.some_text_formatter()
     ],
 )
 def test_planned_change_diff__expected_output(old_content, new_content, expected_diff):
-    planned_change = PlannedChange(
+    planned_change = PlannedChange.from_text(
         sd.SOME_ABSOLUTE_DIRECTORY / sd.SOME_GLOB_MATCHED_FILE_NAME,
         sd.SOME_ABSOLUTE_DIRECTORY,
         old_content,
         new_content,
-        "\n",
     )
 
     assert planned_change.change_diff == expected_diff
 
 
 @pytest.mark.parametrize(
-    ["original_text", "expected_text", "newline"],
+    ["original_text", "expected_text"],
     [
-        (f"--{sd.SOME_VERSION}--", f"--{sd.SOME_OTHER_VERSION}--", None),
-        (f"\n\n--{sd.SOME_VERSION}--", f"\n\n--{sd.SOME_OTHER_VERSION}--", "\n"),
+        (f"--{sd.SOME_VERSION}--", f"--{sd.SOME_OTHER_VERSION}--"),
+        (f"\n\n--{sd.SOME_VERSION}--", f"\n\n--{sd.SOME_OTHER_VERSION}--"),
         (
             f"--{sd.SOME_VERSION}-- --{sd.SOME_VERSION}--",
             f"--{sd.SOME_OTHER_VERSION}-- --{sd.SOME_OTHER_VERSION}--",
-            None,
         ),
     ],
 )
-def test_collect_planned_changes__default_search_replace_single_line__planned_change_with_new_content(
+def test_collect_all_planned_changes__default_search_replace_single_line__planned_change_with_new_content(
     original_text,
     expected_text,
-    newline,
     tmp_path: Path,
 ):
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text(original_text)
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file(some_file.name),
+        [sd.some_file(some_file.name)],
         formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert changes == [
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_file,
             project_root=tmp_path,
             old_content=original_text,
             new_content=expected_text,
-            newline=newline,
         )
     ]
 
 
-def test_collect_planned_changes__multi_occurrence__multiple_planned_change_with_new_content(
+def test_collect_all_planned_changes__multi_occurrence__multiple_planned_change_with_new_content(
     tmp_path: Path,
 ):
     original_text = f"--{sd.SOME_VERSION}--\n\n++{sd.SOME_VERSION}++"
@@ -107,52 +116,56 @@ def test_collect_planned_changes__multi_occurrence__multiple_planned_change_with
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text(original_text)
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file(some_file.name),
+        [sd.some_file(some_file.name)],
         formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert changes == [
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_file,
             project_root=tmp_path,
             old_content=original_text,
             new_content=new_text,
-            newline="\n",
         ),
     ]
 
 
-def test_collect_planned_changes__custom_search_replace__planned_change_with_new_content(
+def test_collect_all_planned_changes__custom_search_replace__planned_change_with_new_content(
     tmp_path: Path,
 ):
     original_text = f"--{sd.SOME_MAJOR}.{sd.SOME_MINOR}--\n"
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text(original_text)
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file(
-            some_file.name,
-            search_format_pattern=f"--{{{keys.CURRENT_MAJOR}}}.{{{keys.CURRENT_MINOR}}}--",
-            replace_format_pattern=f"--{{{keys.NEW_MAJOR}}}.{{{keys.NEW_MINOR}}}--",
-        ),
+        [
+            sd.some_file(
+                some_file.name,
+                search_format_pattern=f"--{{{keys.CURRENT_MAJOR}}}.{{{keys.CURRENT_MINOR}}}--",
+                replace_format_pattern=f"--{{{keys.NEW_MAJOR}}}.{{{keys.NEW_MINOR}}}--",
+            )
+        ],
         formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert changes == [
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_file,
             project_root=tmp_path,
             old_content=original_text,
             new_content=f"--{sd.SOME_OTHER_MAJOR}.{sd.SOME_OTHER_MINOR}--\n",
-            newline="\n",
         )
     ]
 
 
-def test_collect_planned_changes__multiple_files__planned_change_for_both(
+def test_collect_all_planned_changes__multiple_files__planned_change_for_both(
     tmp_path: Path,
 ):
     original_text = f"--{sd.SOME_VERSION}--\n"
@@ -163,31 +176,31 @@ def test_collect_planned_changes__multiple_files__planned_change_for_both(
     some_other_file = tmp_path / SOME_OTHER_FILE_NAME
     some_other_file.write_text(other_original_text)
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file("*.txt"),
+        [sd.some_file("*.txt")],
         formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert sorted(changes, key=lambda x: x.file) == [
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_other_file,
             project_root=tmp_path,
             old_content=other_original_text,
             new_content=f"++{sd.SOME_OTHER_VERSION}++",
-            newline=None,
         ),
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_file,
             project_root=tmp_path,
             old_content=original_text,
             new_content=f"--{sd.SOME_OTHER_VERSION}--\n",
-            newline="\n",
         ),
     ]
 
 
-def test_collect_planned_changes__multiline_search_replace__planned_change_with_expected_content(
+def test_collect_all_planned_changes__multiline_search_replace__planned_change_with_expected_content(
     tmp_path: Path,
 ):
     original_text = f"abc\n--{sd.SOME_VERSION}--\nedf\n--{sd.SOME_VERSION}--\n"
@@ -196,51 +209,30 @@ def test_collect_planned_changes__multiline_search_replace__planned_change_with_
     some_file.write_text(original_text)
     format_pattern = f"edf\n--{{{keys.VERSION}}}"
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file(
-            "*.txt",
-            search_format_pattern=format_pattern,
-            replace_format_pattern=format_pattern,
-        ),
+        [
+            sd.some_file(
+                "*.txt",
+                search_format_pattern=format_pattern,
+                replace_format_pattern=format_pattern,
+            )
+        ],
         formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert changes == [
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_file,
             project_root=tmp_path,
             old_content=original_text,
             new_content=expected_text,
-            newline="\n",
         )
     ]
 
 
-@pytest.mark.parametrize(
-    ["text", "expected_line_ending"],
-    [
-        (f"--{sd.SOME_VERSION}--", None),
-        (f"--{sd.SOME_VERSION}--\nabc", "\n"),
-        (f"--{sd.SOME_VERSION}--\r\nabc", "\r\n"),
-    ],
-)
-def test_collect_planned_changes__detect_line_ending__expected_ending(
-    text: str, expected_line_ending: Optional[str], tmp_path: Path
-):
-    some_file = tmp_path / SOME_FILE_NAME
-    some_file.write_bytes(text.encode())
-
-    changes = files.collect_planned_changes(
-        tmp_path,
-        sd.some_file("*.txt"),
-        formatter=TEXT_FORMATTER,
-    )
-
-    assert len(changes) == 1
-    assert changes[0].newline == expected_line_ending
-
-
 @pytest.mark.parametrize(
     ["format_pattern", "original_text", "expected_text"],
     [
@@ -267,7 +259,7 @@ def test_collect_planned_changes__detect_line_ending__expected_ending(
         ),
     ],
 )
-def test_collect_planned_changes__includes_today__matches_any_date(
+def test_collect_all_planned_changes__includes_today__matches_any_date(
     format_pattern: str,
     original_text: str,
     expected_text: str,
@@ -278,93 +270,219 @@ def test_collect_planned_changes__includes_today__matches_any_date(
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text(original_text)
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file(
-            "*.txt",
-            search_format_pattern=format_pattern,
-            replace_format_pattern=format_pattern,
-        ),
+        [
+            sd.some_file(
+                "*.txt",
+                search_format_pattern=format_pattern,
+                replace_format_pattern=format_pattern,
+            )
+        ],
         formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert len(changes) == 1
     assert changes[0].new_content == expected_text
 
 
-def test_collect_planned_changes__replace_matches_search__planned_change_returned(
+def test_collect_all_planned_changes__replace_matches_search__planned_change_returned(
     tmp_path: Path,
 ):
     original_text = f"ab {sd.SOME_DATE} cd"
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text(original_text)
 
-    changes = files.collect_planned_changes(
+    changes = files.collect_all_planned_changes(
         tmp_path,
-        sd.some_file(
-            "*.txt",
-            search_format_pattern=f"{{{keys.TODAY}}}",
-            replace_format_pattern=f"{{{keys.TODAY}}}",
-        ),
+        [
+            sd.some_file(
+                "*.txt",
+                search_format_pattern=f"{{{keys.TODAY}}}",
+                replace_format_pattern=f"{{{keys.TODAY}}}",
+            )
+        ],
         formatter=sd.some_text_formatter(today=sd.SOME_DATE),
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
     )
 
     assert len(changes) == 1
     assert changes[0].new_content == original_text
 
 
-def test_collect_planned_changes__version_not_found__error(tmp_path: Path):
+def test_collect_all_planned_changes__version_not_found__error(tmp_path: Path):
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text("")
 
     with pytest.raises(SearchTextNotFound):
-        files.collect_planned_changes(
+        files.collect_all_planned_changes(
             tmp_path,
-            sd.some_file(some_file.name),
+            [sd.some_file(some_file.name)],
             formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
         )
 
 
-def test_collect_planned_changes__no_files_matched__error(tmp_path: Path):
+def test_collect_all_planned_changes__large_file_contains_version__planned_change(
+    tmp_path: Path, mocker
+):
+    mocker.patch.object(run_cache, "MMAP_THRESHOLD", 0)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"--{sd.SOME_VERSION}--")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(some_file.name)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"--{sd.SOME_OTHER_VERSION}--"
+    ]
+
+
+def test_collect_all_planned_changes__large_file_version_not_found__error(
+    tmp_path: Path, mocker
+):
+    mocker.patch.object(run_cache, "MMAP_THRESHOLD", 0)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text("--no version--")
+
+    with pytest.raises(SearchTextNotFound):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file(some_file.name)],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+def test_collect_all_planned_changes__no_files_matched__error(tmp_path: Path):
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_text("")
 
     with pytest.raises(FileGlobError):
-        files.collect_planned_changes(
+        files.collect_all_planned_changes(
             tmp_path,
-            sd.some_file("non-existent.txt"),
+            [sd.some_file("non-existent.txt")],
             formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
         )
 
 
 @pytest.mark.parametrize(
-    ["newline", "expected_newline"],
-    [
-        (None, os.linesep),
-        ("\n", "\n"),
-        ("\r\n", "\r\n"),
-    ],
+    "newline",
+    ["\n", "\r\n"],
 )
-def test_perform_change__file_updated_proper_end(
-    newline: Optional[str], expected_newline: str, tmp_path: Path
+def test_perform_change__file_updated_same_line_endings(newline: str, tmp_path: Path):
+    original_text = f"--{sd.SOME_VERSION}--{newline}abc{newline}"
+    replacement_text = f"--{sd.SOME_OTHER_VERSION}--{newline}abc{newline}"
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(original_text.encode())
+
+    files.perform_change(
+        PlannedChange.from_text(
+            file=some_file,
+            project_root=tmp_path,
+            old_content=original_text,
+            new_content=replacement_text,
+        )
+    )
+
+    assert some_file.read_bytes() == replacement_text.encode()
+
+
+@pytest.mark.parametrize("streaming_threshold", [0, DEFAULT_STREAMING_THRESHOLD])
+def test_combine_changes__separate_replacements__both_made(
+    tmp_path: Path, streaming_threshold: int
 ):
-    original_text = f"--{sd.SOME_VERSION}--\n"
-    replacement_text = f"--{sd.SOME_OTHER_VERSION}--\n"
+    original_text = f"a={sd.SOME_VERSION}\nb=0\n"
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(original_text)
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+        streaming_threshold=streaming_threshold,
+    )
+    other_change = PlannedChange.from_text(
+        some_file, tmp_path, original_text, f"a={sd.SOME_VERSION}\nb=1\n"
+    )
+
+    result = files.combine_changes(changes[0], other_change, tmp_path)
+    files.perform_change(result)
+
+    assert some_file.read_text() == f"a={sd.SOME_OTHER_VERSION}\nb=1\n"
+
+
+def test_combine_changes__overlapping_replacements__first_change_used(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text("abc")
+    change = PlannedChange.from_text(some_file, tmp_path, "abc", "aXc")
+    other_change = PlannedChange.from_text(some_file, tmp_path, "abc", "YYY")
+
+    result = files.combine_changes(change, other_change, tmp_path)
+
+    assert result.new_content == "aXc"
+
+
+def test_combine_changes__different_contents__error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    change = PlannedChange.from_text(some_file, tmp_path, "abc", "aXc")
+    other_change = PlannedChange.from_text(some_file, tmp_path, "abcd", "abcY")
+
+    with pytest.raises(FileChangedError):
+        files.combine_changes(change, other_change, tmp_path)
+
+
+def test_perform_change__shorter_content__file_truncated(tmp_path: Path):
+    original_text = f"--{sd.SOME_VERSION}--\nabc\n"
+    replacement_text = "--\n"
     some_file = tmp_path / SOME_FILE_NAME
     some_file.write_bytes(original_text.encode())
 
     files.perform_change(
-        PlannedChange(
+        PlannedChange.from_text(
             file=some_file,
             project_root=tmp_path,
             old_content=original_text,
             new_content=replacement_text,
-            newline=newline,
         )
     )
 
-    expected = replacement_text.replace("\n", expected_newline).encode()
-    assert some_file.read_bytes() == expected
+    assert some_file.read_bytes() == replacement_text.encode()
+
+
+def test_collect_all_planned_changes__mixed_line_endings__only_replaced_text_changed(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"a\r\n--{sd.SOME_VERSION}--\nb\rc\r\n".encode())
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+    files.perform_change(changes[0])
+
+    assert (
+        some_file.read_bytes() == f"a\r\n--{sd.SOME_OTHER_VERSION}--\nb\rc\r\n".encode()
+    )
 
 
 def test_perform_change__invalid_file__error(tmp_path: Path):
@@ -372,12 +490,11 @@ def test_perform_change__invalid_file__error(tmp_path: Path):
 
     with pytest.raises(ValueError):
         files.perform_change(
-            PlannedChange(
+            PlannedChange.from_text(
                 file=some_non_existent_file,
                 project_root=tmp_path,
                 old_content=f"--{sd.SOME_VERSION}--",
                 new_content=f"--{sd.SOME_OTHER_VERSION}--",
-                newline="\n",
             )
         )
 
@@ -410,7 +527,7 @@ def test_is_contained_within__expected_result(
     assert files.is_contained_within(file, SOME_PROJECT_ROOT) == expected_result
 
 
-def test_collect_planned_changes_file_traverses_above_project_root__error(
+def test_collect_all_planned_changes_file_traverses_above_project_root__error(
     tmp_path: Path,
 ):
     traversal_file_glob = f"../{sd.SOME_FILE_GLOB}"
@@ -422,6 +539,706 @@ def test_collect_planned_changes_file_traverses_above_project_root__error(
     file_config = sd.some_file(file_glob=traversal_file_glob)
 
     with pytest.raises(PathTraversalError):
-        files.collect_planned_changes(
-            project_root, file_config, sd.some_text_formatter()
+        files.collect_all_planned_changes(
+            project_root,
+            [file_config],
+            formatter=sd.some_text_formatter(),
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+def test_collect_all_planned_changes__multiple_definitions__planned_change_for_each(
+    tmp_path: Path,
+):
+    original_text = f"--{sd.SOME_VERSION}--\n"
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(original_text)
+    other_original_text = f"++{sd.SOME_VERSION}++"
+    some_other_file = tmp_path / SOME_DIRECTORY_NAME / SOME_OTHER_FILE_NAME
+    some_other_file.parent.mkdir()
+    some_other_file.write_text(other_original_text)
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME), sd.some_file(f"**/{SOME_OTHER_FILE_NAME}")],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert changes == [
+        PlannedChange.from_text(
+            file=some_file,
+            project_root=tmp_path,
+            old_content=original_text,
+            new_content=f"--{sd.SOME_OTHER_VERSION}--\n",
+        ),
+        PlannedChange.from_text(
+            file=some_other_file,
+            project_root=tmp_path,
+            old_content=other_original_text,
+            new_content=f"++{sd.SOME_OTHER_VERSION}++",
+        ),
+    ]
+
+
+def test_collect_all_planned_changes__definition_without_files__error(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"--{sd.SOME_VERSION}--")
+
+    with pytest.raises(FileGlobError):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file(SOME_FILE_NAME), sd.some_file("non-existent.txt")],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+def test_collect_all_planned_changes__definitions_match_same_file__single_change_with_both(
+    tmp_path: Path,
+):
+    original_text = f"--{sd.SOME_VERSION}--\nversion: {sd.SOME_VERSION}\n"
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(original_text)
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(
+                SOME_FILE_NAME,
+                search_format_pattern=f"--{{{keys.VERSION}}}--",
+                replace_format_pattern=f"--{{{keys.NEW_VERSION}}}--",
+            ),
+            sd.some_file(
+                "*.txt",
+                search_format_pattern=f"version: {{{keys.VERSION}}}",
+                replace_format_pattern=f"version: {{{keys.NEW_VERSION}}}",
+            ),
+        ],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert changes == [
+        PlannedChange.from_text(
+            file=some_file,
+            project_root=tmp_path,
+            old_content=original_text,
+            new_content=f"--{sd.SOME_OTHER_VERSION}--\nversion: {sd.SOME_OTHER_VERSION}\n",
+        ),
+    ]
+
+
+def test_collect_all_planned_changes__symlink_to_matched_file__single_change(
+    tmp_path: Path,
+):
+    original_text = f"--{sd.SOME_VERSION}--"
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(original_text)
+    (tmp_path / SOME_OTHER_FILE_NAME).symlink_to(some_file)
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME), sd.some_file(SOME_OTHER_FILE_NAME)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert changes == [
+        PlannedChange.from_text(
+            file=some_file,
+            project_root=tmp_path,
+            old_content=original_text,
+            new_content=f"--{sd.SOME_OTHER_VERSION}--",
+        ),
+    ]
+
+
+def test_collect_all_planned_changes__later_definition_not_found_in_same_file__error(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"--{sd.SOME_VERSION}--")
+
+    with pytest.raises(SearchTextNotFound):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [
+                sd.some_file(SOME_FILE_NAME),
+                sd.some_file(
+                    "*.txt", search_format_pattern=f"version: {{{keys.VERSION}}}"
+                ),
+            ],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+def test_collect_all_planned_changes__definitions_with_today_match_same_file__searched_once(
+    tmp_path: Path, mocker, freezer: FrozenDateTimeFactory
+):
+    freezer.move_to(sd.SOME_DATE)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(
+        f"--{sd.SOME_VERSION}--\nreleased: {sd.SOME_OLDER_DATE.isoformat()}\n"
+    )
+    find_all = mocker.spy(search.MultiPatternSearch, "find_all")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(SOME_FILE_NAME),
+            sd.some_file(
+                "*.txt",
+                search_format_pattern=f"released: {{{keys.TODAY}}}",
+                replace_format_pattern=f"released: {{{keys.TODAY}}}",
+            ),
+        ],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"--{sd.SOME_OTHER_VERSION}--\nreleased: {sd.SOME_DATE.isoformat()}\n"
+    ]
+    find_all.assert_called_once()
+
+
+def test_collect_all_planned_changes__replacement_contains_later_search_text__not_replaced_again(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text("a b")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(
+                SOME_FILE_NAME, search_format_pattern="a", replace_format_pattern="b"
+            ),
+            sd.some_file(
+                "*.txt", search_format_pattern="b", replace_format_pattern="c"
+            ),
+        ],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == ["b c"]
+
+
+def test_collect_all_planned_changes__many_files__patterns_formatted_once(
+    tmp_path: Path, mocker
+):
+    for index in range(3):
+        (tmp_path / f"{index}.txt").write_text(f"{sd.SOME_OLDER_DATE.isoformat()}")
+    text_format = mocker.spy(TextFormatter, "format")
+    create_matching_pattern = mocker.spy(format_pattern, "create_matching_pattern")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(
+                "*.txt",
+                search_format_pattern=f"{{{keys.TODAY}}}",
+                replace_format_pattern=f"{{{keys.TODAY}}}",
+            )
+        ],
+        formatter=sd.some_text_formatter(today=sd.SOME_DATE),
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [sd.SOME_DATE.isoformat()] * 3
+    assert text_format.call_count == 2
+    create_matching_pattern.assert_called_once()
+
+
+def test_collect_all_planned_changes__not_utf8__error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"--{sd.SOME_VERSION}--\xff".encode("latin-1"))
+
+    with pytest.raises(FileEncodingError):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file(SOME_FILE_NAME)],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+def test_collect_all_planned_changes__max_replacements__only_first_occurrences_replaced(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION}-{sd.SOME_VERSION}-{sd.SOME_VERSION}")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME, max_replacements=2)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"{sd.SOME_OTHER_VERSION}-{sd.SOME_OTHER_VERSION}-{sd.SOME_VERSION}"
+    ]
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1024 * 1024])
+def test_collect_all_planned_changes__max_replacements_reached__rest_of_file_encoding_not_checked(
+    tmp_path: Path, mocker, mmap_threshold: int
+):
+    mocker.patch.object(run_cache, "MMAP_THRESHOLD", mmap_threshold)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(
+        f"{sd.SOME_VERSION}\n{sd.SOME_VERSION}\n".encode() + b"\n" * 3 + b"\xff\n"
+    )
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME, max_replacements=1)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_data for change in changes] == [
+        f"{sd.SOME_OTHER_VERSION}\n{sd.SOME_VERSION}\n".encode() + b"\n" * 3 + b"\xff\n"
+    ]
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1024 * 1024])
+def test_collect_all_planned_changes__max_replacements_not_reached__not_utf8_error(
+    tmp_path: Path, mocker, mmap_threshold: int
+):
+    mocker.patch.object(run_cache, "MMAP_THRESHOLD", mmap_threshold)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"{sd.SOME_VERSION}\n".encode() + b"\xff\n")
+
+    with pytest.raises(FileEncodingError):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file(SOME_FILE_NAME, max_replacements=2)],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+def test_collect_all_planned_changes__max_replacements_reached__overlapping_text_of_other_definition_replaced(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION} {sd.SOME_VERSION}-x")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(SOME_FILE_NAME, max_replacements=1),
+            sd.some_file(
+                SOME_FILE_NAME,
+                search_format_pattern=f"{{{keys.VERSION}}}-x",
+                replace_format_pattern=f"{{{keys.NEW_VERSION}}}-y",
+            ),
+        ],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"{sd.SOME_OTHER_VERSION} {sd.SOME_OTHER_VERSION}-y"
+    ]
+
+
+def test_collect_all_planned_changes__min_replacements_overlapping_other_definition__occurrences_counted(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION}-{sd.SOME_VERSION}")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(SOME_FILE_NAME),
+            sd.some_file(SOME_FILE_NAME, min_replacements=2),
+        ],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"{sd.SOME_OTHER_VERSION}-{sd.SOME_OTHER_VERSION}"
+    ]
+
+
+def test_collect_all_planned_changes__fewer_than_min_replacements_overlapping_other_definition__error(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION}-{sd.SOME_VERSION}")
+
+    with pytest.raises(TooFewMatchesError, match="found 2 time"):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [
+                sd.some_file(SOME_FILE_NAME),
+                sd.some_file(SOME_FILE_NAME, min_replacements=3),
+            ],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+@pytest.mark.parametrize("streaming_threshold", [0, DEFAULT_STREAMING_THRESHOLD])
+def test_collect_all_planned_changes__fewer_than_min_replacements__error(
+    tmp_path: Path, streaming_threshold: int
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION}-{sd.SOME_VERSION}")
+
+    with pytest.raises(TooFewMatchesError, match="found 2 time"):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file(SOME_FILE_NAME, min_replacements=3)],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+            streaming_threshold=streaming_threshold,
+        )
+
+
+@pytest.mark.parametrize(
+    "region",
+    [
+        Region(start_line=2, end_line=2),
+        Region(start_anchor="[package]", end_anchor="[dependencies]"),
+        Region(section="package"),
+    ],
+)
+@pytest.mark.parametrize("streaming_threshold", [0, DEFAULT_STREAMING_THRESHOLD])
+def test_collect_all_planned_changes__region__only_region_replaced(
+    tmp_path: Path, region: Region, streaming_threshold: int
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(
+        f"[package]\nversion={sd.SOME_VERSION}\n[dependencies]\nfoo={sd.SOME_VERSION}\n"
+    )
+    run_cache = RunCache()
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file(SOME_FILE_NAME, region=region)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=run_cache,
+        streaming_threshold=streaming_threshold,
+    )
+    for change in changes:
+        files.perform_change(change)
+
+    assert some_file.read_text() == (
+        f"[package]\nversion={sd.SOME_OTHER_VERSION}\n"
+        f"[dependencies]\nfoo={sd.SOME_VERSION}\n"
+    )
+
+
+def test_collect_all_planned_changes__region_and_entire_file_definitions__both_replaced(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION}\n{sd.SOME_VERSION} foo\n")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [
+            sd.some_file(
+                SOME_FILE_NAME,
+                search_format_pattern="foo",
+                replace_format_pattern="bar",
+            ),
+            sd.some_file(SOME_FILE_NAME, region=Region(start_line=2)),
+        ],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"{sd.SOME_VERSION}\n{sd.SOME_OTHER_VERSION} bar\n"
+    ]
+
+
+@pytest.mark.parametrize("streaming_threshold", [0, DEFAULT_STREAMING_THRESHOLD])
+def test_collect_all_planned_changes__region_not_found__error(
+    tmp_path: Path, streaming_threshold: int
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"[package]\nversion={sd.SOME_VERSION}\n")
+
+    with pytest.raises(RegionNotFoundError):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file(SOME_FILE_NAME, region=Region(section="tool"))],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+            streaming_threshold=streaming_threshold,
+        )
+
+
+def _collect_streamed_changes(project_root: Path, config: File) -> list[FileChange]:
+    return files.collect_all_planned_changes(
+        project_root,
+        [config],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+        streaming_threshold=0,
+    )
+
+
+def test_collect_all_planned_changes__above_streaming_threshold__streamed_change(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"a\r\n--{sd.SOME_VERSION}--\r\nb\r\n".encode())
+
+    changes = _collect_streamed_changes(tmp_path, sd.some_file(SOME_FILE_NAME))
+
+    assert changes == [
+        StreamedChange(
+            some_file,
+            project_root=tmp_path,
+            spans=[(5, 5 + len(str(sd.SOME_VERSION)))],
+            replace_data=str(sd.SOME_OTHER_VERSION).encode(),
+        )
+    ]
+    assert changes[0].change_diff == (
+        f"--- {SOME_FILE_NAME}\n"
+        f"+++ {SOME_FILE_NAME}\n"
+        "@@ -1,3 +1,3 @@\n"
+        " a\r\n"
+        f"---{sd.SOME_VERSION}--\r\n"
+        f"+--{sd.SOME_OTHER_VERSION}--\r\n"
+        " b\r\n"
+    )
+
+
+def test_collect_all_planned_changes__above_streaming_threshold_max_replacements__first_spans(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"{sd.SOME_VERSION}-{sd.SOME_VERSION}-{sd.SOME_VERSION}")
+    version_length = len(str(sd.SOME_VERSION))
+
+    changes = _collect_streamed_changes(
+        tmp_path, sd.some_file(SOME_FILE_NAME, max_replacements=1)
+    )
+
+    assert [type(change) for change in changes] == [StreamedChange]
+    assert cast(StreamedChange, changes[0]).spans == [(0, version_length)]
+
+
+def test_collect_all_planned_changes__above_streaming_threshold_includes_today__planned_change(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"--{sd.SOME_VERSION} {sd.SOME_OLDER_DATE.isoformat()}--")
+
+    changes = _collect_streamed_changes(
+        tmp_path,
+        sd.some_file(
+            SOME_FILE_NAME,
+            search_format_pattern=f"{{{keys.CURRENT_VERSION}}} {{{keys.TODAY}}}",
+        ),
+    )
+
+    assert [type(change) for change in changes] == [PlannedChange]
+
+
+def test_collect_all_planned_changes__above_streaming_threshold_version_not_found__error(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text("--no version--")
+
+    with pytest.raises(SearchTextNotFound):
+        _collect_streamed_changes(tmp_path, sd.some_file(SOME_FILE_NAME))
+
+
+def test_collect_all_planned_changes__above_streaming_threshold_not_utf8__error(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"--{sd.SOME_VERSION}--\xff".encode("latin-1"))
+
+    with pytest.raises(FileEncodingError):
+        _collect_streamed_changes(tmp_path, sd.some_file(SOME_FILE_NAME))
+
+
+def test_perform_change__streamed_change__file_updated_mode_kept(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"a\n--{sd.SOME_VERSION}--\nb\r\n".encode())
+    some_file.chmod(0o754)
+    changes = _collect_streamed_changes(tmp_path, sd.some_file(SOME_FILE_NAME))
+
+    files.perform_change(changes[0])
+
+    assert some_file.read_bytes() == f"a\n--{sd.SOME_OTHER_VERSION}--\nb\r\n".encode()
+    assert some_file.stat().st_mode & 0o777 == 0o754
+    assert [path.name for path in tmp_path.iterdir()] == [SOME_FILE_NAME]
+
+
+def test_perform_change__streamed_file_written_after_planning__error(
+    tmp_path: Path,
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"a\n--{sd.SOME_VERSION}--\n".encode())
+    changes = _collect_streamed_changes(tmp_path, sd.some_file(SOME_FILE_NAME))
+    some_file.write_bytes(f"ab\n--{sd.SOME_VERSION}--\n".encode())
+
+    with pytest.raises(FileChangedError):
+        files.perform_change(changes[0])
+
+    assert some_file.read_bytes() == f"ab\n--{sd.SOME_VERSION}--\n".encode()
+    assert [path.name for path in tmp_path.iterdir()] == [SOME_FILE_NAME]
+
+
+def test_perform_change__streamed_change_invalid_file__error(tmp_path: Path):
+    with pytest.raises(ValueError):
+        files.perform_change(
+            StreamedChange(
+                tmp_path / SOME_FILE_NAME,
+                project_root=tmp_path,
+                spans=[],
+                replace_data=b"",
+            )
+        )
+
+
+def test_collect_all_planned_changes__text_only_binary_file__skipped(tmp_path: Path):
+    (tmp_path / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00")
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_text(f"--{sd.SOME_VERSION}--")
+    skipped_files: list[Path] = []
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file("*", text_only=True)],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+        skipped_files=skipped_files,
+    )
+
+    assert [change.file for change in changes] == [some_file]
+    assert skipped_files == [tmp_path / "image.png"]
+
+
+def test_collect_all_planned_changes__binary_file_not_text_only__error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(f"--{sd.SOME_VERSION}--\xff".encode("latin-1"))
+
+    with pytest.raises(FileEncodingError):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file("*.txt", text_only=True), sd.some_file(SOME_FILE_NAME)],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+        )
+
+
+@pytest.mark.parametrize(
+    ["jobs", "job_backend"],
+    [(1, JobBackend.Thread), (4, JobBackend.Thread), (4, JobBackend.Process)],
+)
+def test_collect_all_planned_changes__jobs__same_order(
+    tmp_path: Path, jobs: int, job_backend: JobBackend
+):
+    for index in range(20):
+        (tmp_path / f"{index:02}.txt").write_text(f"{index} {sd.SOME_VERSION}")
+
+    changes = files.collect_all_planned_changes(
+        tmp_path,
+        [sd.some_file("*.txt")],
+        formatter=TEXT_FORMATTER,
+        discovery_settings=sd.some_discovery(),
+        run_cache=RunCache(),
+        jobs=jobs,
+        job_backend=job_backend,
+    )
+
+    assert [change.new_content for change in changes] == [
+        f"{index} {sd.SOME_OTHER_VERSION}" for index in range(20)
+    ]
+
+
+def test_collect_all_planned_changes__process_backend__same_as_sequential(
+    tmp_path: Path,
+):
+    (tmp_path / "large.txt").write_text(f"{sd.SOME_VERSION}\nfoo\n" * 10)
+    (tmp_path / "small.txt").write_text(f"foo\r\n{sd.SOME_VERSION}\r\nbar\r\n")
+    (tmp_path / "binary.txt").write_bytes(b"\x00" + str(sd.SOME_VERSION).encode())
+    configs = [
+        sd.some_file("*.txt", text_only=True),
+        sd.some_file("small.txt", search_format_pattern="foo"),
+    ]
+
+    def collect(jobs: int, job_backend: JobBackend) -> list[FileChange]:
+        return files.collect_all_planned_changes(
+            tmp_path,
+            configs,
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+            streaming_threshold=100,
+            jobs=jobs,
+            job_backend=job_backend,
+        )
+
+    changes = collect(jobs=2, job_backend=JobBackend.Process)
+    expected_changes = collect(jobs=1, job_backend=JobBackend.Thread)
+
+    assert [type(change) for change in changes] == [StreamedChange, PlannedChange]
+    assert [(change.file, change.change_diff) for change in changes] == [
+        (change.file, change.change_diff) for change in expected_changes
+    ]
+    assert changes[1].new_data == expected_changes[1].new_data
+
+
+@pytest.mark.parametrize("job_backend", list(JobBackend))
+def test_collect_all_planned_changes__jobs_multiple_errors__first_file_error(
+    tmp_path: Path, job_backend: JobBackend
+):
+    for index in range(20):
+        (tmp_path / f"{index:02}.txt").write_text(
+            "no version" if index in (5, 12) else str(sd.SOME_VERSION)
+        )
+
+    with pytest.raises(SearchTextNotFound, match="05.txt"):
+        files.collect_all_planned_changes(
+            tmp_path,
+            [sd.some_file("*.txt")],
+            formatter=TEXT_FORMATTER,
+            discovery_settings=sd.some_discovery(),
+            run_cache=RunCache(),
+            jobs=4,
+            job_backend=job_backend,
         )
@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it import parallel
+from hyper_bump_it._hyper_bump_it.config import JobBackend
+
+
+def _square(item: int) -> int:
+    # defined at the module level, so it can be used by other processes
+    if item < 0:
+        raise ValueError(item)
+    return item * item
+
+
+@pytest.mark.parametrize("backend", list(JobBackend))
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_map_in_order__results_in_item_order(jobs: int, backend: JobBackend):
+    items = list(range(20))
+
+    assert parallel.map_in_order(_square, items, jobs, backend) == [
+        item * item for item in items
+    ]
+
+
+@pytest.mark.parametrize("backend", list(JobBackend))
+def test_map_in_order__multiple_items_fail__first_item_error(backend: JobBackend):
+    items = [1, 2, -3, 4, -5, 6]
+
+    with pytest.raises(ValueError, match="-3"):
+        parallel.map_in_order(_square, items, 2, backend)
+
+
+def test_map_in_order__item_fails__later_items_not_started():
+    called = []
+
+    def function(item: int) -> int:
+        called.append(item)
+        if item == 0:
+            raise ValueError()
+        time.sleep(0.001)
+        return item
+
+    with pytest.raises(ValueError):
+        parallel.map_in_order(function, list(range(1000)), jobs=2)
+
+    assert len(called) < 100
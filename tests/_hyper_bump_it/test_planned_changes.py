@@ -0,0 +1,220 @@
+import codecs
+import pickle
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it import streaming
+from hyper_bump_it._hyper_bump_it.diff import Replacement
+from hyper_bump_it._hyper_bump_it.error import FileChangedError
+from hyper_bump_it._hyper_bump_it.planned_changes import (
+    ContentProfile,
+    PlannedChange,
+    is_utf8,
+    looks_binary,
+)
+
+SOME_FILE_NAME = "foo.txt"
+
+
+@pytest.mark.parametrize(
+    ["data", "expected_bom", "expected_is_utf8"],
+    [
+        (b"abc", False, True),
+        ("été".encode(), False, True),
+        (codecs.BOM_UTF8 + b"abc", True, True),
+        ("été".encode("latin-1"), False, False),
+        (b"\x00\xff\xfe", False, False),
+    ],
+)
+def test_detect__encoding__expected_profile(
+    data: bytes, expected_bom: bool, expected_is_utf8: bool
+):
+    profile = ContentProfile.detect(data)
+
+    assert profile.bom == expected_bom
+    assert profile.is_utf8 == expected_is_utf8
+
+
+@pytest.mark.parametrize(
+    ["data", "end", "expected_result"],
+    [
+        (b"abcdef", None, True),
+        # characters that cross the boundary between chunks
+        ("ab€€€".encode(), None, True),
+        ("ab€".encode() + b"def", None, True),
+        ("ab€".encode()[:-1] + b"def", None, False),
+        ("ab€".encode()[:-1], None, False),
+        # only the content before the end is checked
+        (b"abc\xffdef", 3, True),
+        (b"abc\xffdef", 4, False),
+        ("ab€d".encode(), 4, True),
+        (b"abc", 10, True),
+    ],
+)
+def test_is_utf8__expected_result(
+    mocker, data: bytes, end: Optional[int], expected_result: bool
+):
+    mocker.patch.object(streaming, "CHUNK_SIZE", 3)
+
+    assert is_utf8(data, end) == expected_result
+
+
+@pytest.mark.parametrize(
+    ["sample", "complete", "expected_result"],
+    [
+        (b"", True, False),
+        (b"abc\n", True, False),
+        ("été".encode(), True, False),
+        (b"abc\x00def", True, True),
+        ("été".encode("latin-1"), True, True),
+        (b"\x89PNG\r\n\x1a\n", False, True),
+        ("ab€".encode()[:-1], False, False),
+        ("ab€".encode()[:-1], True, True),
+    ],
+)
+def test_looks_binary__expected_result(
+    sample: bytes, complete: bool, expected_result: bool
+):
+    assert looks_binary(sample, complete) == expected_result
+
+
+@pytest.mark.parametrize(
+    ["old_data", "new_data", "expected_replacements"],
+    [
+        (b"abc", b"abc", []),
+        (b"a1.2.3c", b"a1.3.0c", [(3, 3, b"3.0")]),
+        (b"abc", b"", [(0, 3, b"")]),
+        (b"", b"abc", [(0, 0, b"abc")]),
+        (b"aaa", b"aaaa", [(3, 0, b"a")]),
+    ],
+)
+def test_from_data__single_replacement_between_common_prefix_and_suffix(
+    tmp_path: Path,
+    old_data: bytes,
+    new_data: bytes,
+    expected_replacements: list[Replacement],
+):
+    change = PlannedChange.from_data(
+        tmp_path / SOME_FILE_NAME, tmp_path, old_data, new_data
+    )
+
+    assert change.replacements == expected_replacements
+    assert change.new_data == new_data
+
+
+def test_new_data__contents_not_kept__file_read_and_replaced(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"a-1.2.3-b-1.2.3\n")
+
+    change = PlannedChange(
+        some_file,
+        tmp_path,
+        old_data=some_file.read_bytes(),
+        replacements=[(2, 5, b"4.5.6"), (10, 5, b"4")],
+    )
+
+    assert change.new_data == b"a-4.5.6-b-4\n"
+    assert change.change_diff == (
+        f"--- {SOME_FILE_NAME}\n"
+        f"+++ {SOME_FILE_NAME}\n"
+        "@@ -1 +1 @@\n"
+        "-a-1.2.3-b-1.2.3\n"
+        "+a-4.5.6-b-4\n"
+    )
+
+
+def test_new_data__file_modified_after_planning__error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"1.2.3")
+    change = PlannedChange(
+        some_file,
+        tmp_path,
+        old_data=some_file.read_bytes(),
+        replacements=[(0, 5, b"4.5.6")],
+    )
+
+    some_file.write_bytes(b"1.2.4")
+
+    with pytest.raises(FileChangedError):
+        _ = change.new_data
+
+
+@pytest.mark.parametrize(
+    ["new_contents", "expected_new_data"],
+    [
+        (b"1.2.3-1.2.3-1.2.3\n", b"4.5.6-1.2.3-1.2.3\n"),
+        (b"1.2.3-changed\n", b"4.5.6-changed\n"),
+    ],
+)
+def test_new_data__modified_after_planned_size__replaced(
+    tmp_path: Path, new_contents: bytes, expected_new_data: bytes
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"1.2.3-1.2.3-1.2.3\n")
+    change = PlannedChange(
+        some_file,
+        tmp_path,
+        old_data=some_file.read_bytes(),
+        replacements=[(0, 5, b"4.5.6")],
+        planned_size=5,
+    )
+
+    some_file.write_bytes(new_contents)
+
+    assert change.new_data == expected_new_data
+
+
+def test_new_data__modified_within_planned_size__error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"1.2.3-1.2.3")
+    change = PlannedChange(
+        some_file,
+        tmp_path,
+        old_data=some_file.read_bytes(),
+        replacements=[(0, 5, b"4.5.6")],
+        planned_size=5,
+    )
+
+    some_file.write_bytes(b"1.2.4-1.2.3")
+
+    with pytest.raises(FileChangedError):
+        _ = change.new_data
+
+
+def test_eq__same_result_different_replacements__equal(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"1.2.3 1.2.3")
+
+    change = PlannedChange(
+        some_file,
+        tmp_path,
+        old_data=some_file.read_bytes(),
+        replacements=[(0, 5, b"4.5.6"), (6, 5, b"4.5.6")],
+    )
+
+    assert change == PlannedChange.from_data(
+        some_file, tmp_path, b"1.2.3 1.2.3", b"4.5.6 4.5.6"
+    )
+    assert change != PlannedChange.from_data(
+        some_file, tmp_path, b"1.2.3 1.2.3", b"4.5.6 1.2.3"
+    )
+
+
+def test_planned_change__pickled__contents_not_included(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    old_data = b"x" * 10_000 + b"1.2.3"
+    some_file.write_bytes(old_data)
+    change = PlannedChange(
+        some_file,
+        tmp_path,
+        old_data=old_data,
+        replacements=[(10_000, 5, b"4.5.6")],
+    )
+
+    data = pickle.dumps(change)
+
+    assert not hasattr(change, "__dict__")
+    assert len(data) < 1000
+    assert pickle.loads(data) == change
@@ -0,0 +1,140 @@
+import mmap
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it.config import Region
+from hyper_bump_it._hyper_bump_it.region import Bounds, find_region
+
+SOME_DATA = b"line 1\nline 2\r\nline 3\nline 4"
+SOME_TOML = b"""\
+version = "1.2.3"
+
+[package]
+version = "1.2.3"
+
+[package.metadata]  # comment
+version = "1.2.3"
+
+[[bin]]
+name = "foo"
+"""
+
+
+def _region_text(data: bytes, bounds: Optional[Bounds]) -> Optional[bytes]:
+    if bounds is None:
+        return None
+    start, end = bounds
+    return data[start:end]
+
+
+@pytest.mark.parametrize(
+    ["region", "expected_text"],
+    [
+        (Region(start_line=1, end_line=1), b"line 1\n"),
+        (Region(start_line=2, end_line=3), b"line 2\r\nline 3\n"),
+        (Region(start_line=3), b"line 3\nline 4"),
+        (Region(end_line=2), b"line 1\nline 2\r\n"),
+        (Region(start_line=4, end_line=10), b"line 4"),
+        (Region(start_line=5), None),
+    ],
+)
+def test_find_region__lines__expected_text(
+    region: Region, expected_text: Optional[bytes]
+):
+    assert _region_text(SOME_DATA, find_region(SOME_DATA, region)) == expected_text
+
+
+@pytest.mark.parametrize(
+    ["region", "expected_text"],
+    [
+        (Region(start_anchor="line 2", end_anchor="line 4"), b"\r\nline 3\n"),
+        (Region(start_anchor="line 3"), b"\nline 4"),
+        (Region(end_anchor="\n"), b"line 1"),
+        # the end anchor is only searched for after the start anchor
+        (Region(start_anchor="2", end_anchor="line 1"), None),
+        (Region(start_anchor="line 5"), None),
+    ],
+)
+def test_find_region__anchors__expected_text(
+    region: Region, expected_text: Optional[bytes]
+):
+    assert _region_text(SOME_DATA, find_region(SOME_DATA, region)) == expected_text
+
+
+@pytest.mark.parametrize(
+    ["section", "expected_text"],
+    [
+        ("package", b'\nversion = "1.2.3"\n\n'),
+        ("package.metadata", b'\nversion = "1.2.3"\n\n'),
+        ("bin", b'\nname = "foo"\n'),
+        ("missing", None),
+    ],
+)
+def test_find_region__section__expected_text(
+    section: str, expected_text: Optional[bytes]
+):
+    assert (
+        _region_text(SOME_TOML, find_region(SOME_TOML, Region(section=section)))
+        == expected_text
+    )
+
+
+@pytest.mark.parametrize(
+    "array_lines",
+    [
+        b"  [1, 2],\n  [3, 4]\n",
+        b'  ["a"],\n  [\n    "b",\n  ],\n',
+        b"  [1]  # [\n",
+        b'  ["]", "["],\n  ["b"]\n',
+    ],
+)
+def test_find_region__section_with_multi_line_array__array_part_of_section(
+    array_lines: bytes,
+):
+    section_text = b"\nmatrix = [\n" + array_lines + b']\nversion = "1.2.3"\n\n'
+    data = b"[package]" + section_text + b'[other]\nversion = "1.2.3"\n'
+
+    bounds = find_region(data, Region(section="package"))
+
+    assert _region_text(data, bounds) == section_text
+
+
+@pytest.mark.parametrize(
+    ["section", "header"],
+    [
+        ("tool.hyper-bump-it", b"[tool.hyper-bump-it]"),
+        ('tool."hyper, bump"', b'[tool."hyper, bump"]'),
+        ("tool:pytest", b"[ tool:pytest ]"),
+        ("mypy-tests.*", b"[mypy-tests.*]"),
+    ],
+)
+def test_find_region__section_names__found(section: str, header: bytes):
+    data = header + b'\nversion = "1.2.3"\n'
+
+    bounds = find_region(data, Region(section=section))
+
+    assert _region_text(data, bounds) == b'\nversion = "1.2.3"\n'
+
+
+def test_find_region__ini_section_with_crlf__expected_text():
+    data = b"[first]\r\nfoo = 1\r\n[second] ; comment\r\nbar = 2\r\n"
+
+    bounds = find_region(data, Region(section="second"))
+
+    assert _region_text(data, bounds) == b"\nbar = 2\r\n"
+
+
+def test_find_region__memory_map__same_as_bytes(tmp_path: Path):
+    some_file = tmp_path / "Cargo.toml"
+    some_file.write_bytes(SOME_TOML)
+    region = Region(section="package")
+
+    with (
+        some_file.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        result = find_region(data, region)
+
+    assert result == find_region(SOME_TOML, region)
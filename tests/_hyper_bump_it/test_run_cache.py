@@ -0,0 +1,226 @@
+import codecs
+from pathlib import Path
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it import discovery
+from hyper_bump_it._hyper_bump_it import run_cache as run_cache_module
+from hyper_bump_it._hyper_bump_it.run_cache import RunCache
+from tests._hyper_bump_it import sample_data as sd
+
+SOME_FILE_NAME = "foo.txt"
+SOME_OTHER_FILE_NAME = "bar.md"
+SOME_TEXT = "foo\r\nbar\rbaz\n"
+
+
+def test_find_files__same_glob__discovered_once(tmp_path: Path, mocker):
+    (tmp_path / SOME_FILE_NAME).touch()
+    find_files = mocker.spy(discovery, "find_files")
+    run_cache = RunCache()
+
+    first_result = run_cache.find_files(tmp_path, ["*.txt"], sd.some_discovery())
+    result = run_cache.find_files(tmp_path, ["*.txt"], sd.some_discovery())
+
+    assert result == first_result == {"*.txt": [tmp_path / SOME_FILE_NAME]}
+    find_files.assert_called_once()
+
+
+def test_find_files__some_globs_discovered__only_missing_globs_discovered(
+    tmp_path: Path, mocker
+):
+    (tmp_path / SOME_FILE_NAME).touch()
+    (tmp_path / SOME_OTHER_FILE_NAME).touch()
+    run_cache = RunCache()
+    run_cache.find_files(tmp_path, ["*.txt"], sd.some_discovery())
+    find_files = mocker.spy(discovery, "find_files")
+
+    result = run_cache.find_files(tmp_path, ["*.txt", "*.md"], sd.some_discovery())
+
+    assert result == {
+        "*.txt": [tmp_path / SOME_FILE_NAME],
+        "*.md": [tmp_path / SOME_OTHER_FILE_NAME],
+    }
+    find_files.assert_called_once_with(tmp_path, ["*.md"], sd.some_discovery())
+
+
+def test_find_files__different_settings__discovered_again(tmp_path: Path, mocker):
+    find_files = mocker.spy(discovery, "find_files")
+    run_cache = RunCache()
+
+    run_cache.find_files(tmp_path, ["*.txt"], sd.some_discovery())
+    run_cache.find_files(tmp_path, ["*.txt"], sd.some_discovery(workers=2))
+
+    assert find_files.call_count == 2
+
+
+def test_find_files__result_modified__cache_unchanged(tmp_path: Path):
+    (tmp_path / SOME_FILE_NAME).touch()
+    run_cache = RunCache()
+
+    run_cache.find_files(tmp_path, ["*.txt"])["*.txt"].clear()
+
+    assert run_cache.find_files(tmp_path, ["*.txt"]) == {
+        "*.txt": [tmp_path / SOME_FILE_NAME]
+    }
+
+
+def test_read_bytes__same_file__read_once(tmp_path: Path, mocker):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+    read_bytes = mocker.spy(Path, "read_bytes")
+    run_cache = RunCache()
+
+    run_cache.read_bytes(some_file)
+    run_cache.read_text(tmp_path / "." / SOME_FILE_NAME)
+    run_cache.read_text(some_file, universal_newlines=True)
+
+    assert run_cache.read_bytes(some_file) == SOME_TEXT.encode()
+    read_bytes.assert_called_once()
+
+
+def test_read_text__default__line_endings_unchanged(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+
+    assert RunCache().read_text(some_file) == SOME_TEXT
+
+
+def test_read_text__universal_newlines__same_as_text_mode(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+
+    assert RunCache().read_text(
+        some_file, universal_newlines=True
+    ) == some_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "relative_path",
+    [
+        SOME_FILE_NAME,
+        f"linked-directory/{SOME_FILE_NAME}",
+        "linked-file",
+        "directory/../linked-file",
+        "non-existent/file.txt",
+    ],
+)
+def test_resolve__same_as_path_resolve(tmp_path: Path, relative_path: str):
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / SOME_FILE_NAME).touch()
+    (tmp_path / "linked-directory").symlink_to(directory)
+    (tmp_path / "linked-file").symlink_to(directory / SOME_FILE_NAME)
+    path = tmp_path / relative_path
+
+    assert RunCache().resolve(path) == path.resolve()
+
+
+def test_resolve__files_in_same_directory__directory_resolved_once(
+    tmp_path: Path, mocker
+):
+    resolve = mocker.spy(Path, "resolve")
+    run_cache = RunCache()
+
+    for index in range(10):
+        run_cache.resolve(tmp_path / f"{index}.txt")
+
+    resolve.assert_called_once()
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1024 * 1024])
+@pytest.mark.parametrize(
+    ["text", "expected_result"], [("bar", True), ("bar\rbaz", True), ("qux", False)]
+)
+def test_contains__expected_result(
+    tmp_path: Path, mocker, mmap_threshold: int, text: str, expected_result: bool
+):
+    mocker.patch.object(run_cache_module, "MMAP_THRESHOLD", mmap_threshold)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+
+    assert RunCache().contains(some_file, text) == expected_result
+
+
+def test_contains__large_file__contents_not_kept(tmp_path: Path, mocker):
+    mocker.patch.object(run_cache_module, "MMAP_THRESHOLD", 0)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+    run_cache = RunCache()
+    run_cache.contains(some_file, "bar")
+    read_bytes = mocker.spy(Path, "read_bytes")
+
+    run_cache.read_bytes(some_file)
+
+    read_bytes.assert_called_once()
+
+
+def test_contains__small_file__contents_kept(tmp_path: Path, mocker):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+    run_cache = RunCache()
+    run_cache.contains(some_file, "bar")
+    read_bytes = mocker.spy(Path, "read_bytes")
+
+    run_cache.read_bytes(some_file)
+
+    read_bytes.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ["data", "expected_bom", "expected_is_utf8"],
+    [
+        (SOME_TEXT.encode(), False, True),
+        (codecs.BOM_UTF8 + SOME_TEXT.encode(), True, True),
+        (b"abc\xffdef", False, False),
+    ],
+)
+def test_profile__large_file__expected_profile_and_contents_not_kept(
+    tmp_path: Path, mocker, data: bytes, expected_bom: bool, expected_is_utf8: bool
+):
+    mocker.patch.object(run_cache_module, "MMAP_THRESHOLD", 0)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(data)
+    run_cache = RunCache()
+    profile = run_cache.profile(some_file)
+    read_bytes = mocker.spy(Path, "read_bytes")
+
+    run_cache.read_bytes(some_file)
+
+    assert profile.bom == expected_bom
+    assert profile.is_utf8 == expected_is_utf8
+    read_bytes.assert_called_once()
+
+
+def test_release_contents__file_read_again(tmp_path: Path, mocker):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(SOME_TEXT.encode())
+    run_cache = RunCache()
+    run_cache.read_text(some_file)
+    read_bytes = mocker.spy(Path, "read_bytes")
+
+    run_cache.release_contents()
+
+    assert run_cache.read_text(some_file) == SOME_TEXT
+    read_bytes.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ["data", "expected_result"],
+    [
+        (SOME_TEXT.encode(), False),
+        (b"abc\x00def", True),
+        # only the start of the file is inspected
+        (b"abcd\x00", False),
+        # a character that is cut off by the end of the sample is not invalid
+        ("abc€".encode(), False),
+        ("a€".encode()[:-1], True),
+    ],
+)
+def test_is_binary__expected_result(
+    tmp_path: Path, mocker, data: bytes, expected_result: bool
+):
+    mocker.patch.object(run_cache_module, "SNIFF_SIZE", 4)
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(data)
+
+    assert RunCache().is_binary(some_file) == expected_result
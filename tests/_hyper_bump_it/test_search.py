@@ -0,0 +1,127 @@
+import re
+from collections.abc import Iterator
+from typing import Optional
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it.format_pattern import create_matching_pattern
+from hyper_bump_it._hyper_bump_it.search import Match, MultiPatternSearch
+
+SOME_TODAY_PATTERN = re.compile(
+    create_matching_pattern("released {today}").pattern.encode()
+)
+
+
+def _literal(text: bytes) -> re.Pattern[bytes]:
+    return re.compile(re.escape(text))
+
+
+def test_find_all__multiple_patterns__ordered_by_position():
+    search = MultiPatternSearch([_literal(b"b"), _literal(b"a"), _literal(b"c.")])
+
+    result = search.find_all(b"a-b-c.-axc")
+
+    assert result == [Match(0, 1, 1), Match(2, 3, 0), Match(4, 6, 2), Match(7, 8, 1)]
+
+
+@pytest.mark.parametrize(
+    ["patterns", "expected_result"],
+    [
+        ([b"ab", b"abc"], [Match(0, 2, 0)]),
+        ([b"abc", b"ab"], [Match(0, 3, 0)]),
+        ([b"bc", b"abc"], [Match(0, 3, 1)]),
+        ([b"ab", b"ab"], [Match(0, 2, 0)]),
+    ],
+)
+def test_find_all__overlapping_patterns__earliest_then_first_pattern(
+    patterns: list[bytes], expected_result: list[Match]
+):
+    search = MultiPatternSearch([_literal(pattern) for pattern in patterns])
+
+    assert search.find_all(b"abc") == expected_result
+
+
+def test_find_all__patterns_with_same_group_names__each_matched():
+    search = MultiPatternSearch(
+        [SOME_TODAY_PATTERN, _literal(b"1.2.3"), SOME_TODAY_PATTERN]
+    )
+
+    result = search.find_all(b"1.2.3 released 2022-01-02")
+
+    assert result == [Match(0, 5, 1), Match(6, 25, 0)]
+
+
+def test_find_all__pattern_with_groups__index_of_pattern():
+    search = MultiPatternSearch([re.compile(rb"(a)(b(c))"), _literal(b"d")])
+
+    assert search.find_all(b"abcd") == [Match(0, 3, 0), Match(3, 4, 1)]
+
+
+def test_find_all__literal_with_regex_characters__matched_literally():
+    search = MultiPatternSearch([_literal(b"(?P<x>.)"), _literal(b"[a]")])
+
+    assert search.find_all(b"a(?P<x>.)[a]") == [Match(1, 9, 0), Match(9, 12, 1)]
+
+
+def test_find_all__no_match__empty():
+    assert MultiPatternSearch([_literal(b"a")]).find_all(b"bcd") == []
+
+
+@pytest.mark.parametrize(
+    ["max_counts", "expected_result"],
+    [
+        (
+            [None, None],
+            [Match(0, 1, 0), Match(1, 2, 1), Match(2, 3, 0), Match(4, 5, 0)],
+        ),
+        ([1, None], [Match(0, 1, 0), Match(1, 2, 1)]),
+        ([2, 1], [Match(0, 1, 0), Match(1, 2, 1), Match(2, 3, 0)]),
+        ([None, 1], [Match(0, 1, 0), Match(1, 2, 1), Match(2, 3, 0), Match(4, 5, 0)]),
+    ],
+)
+def test_find_all__max_counts__limited_occurrences(
+    max_counts: list[Optional[int]], expected_result: list[Match]
+):
+    search = MultiPatternSearch([_literal(b"a"), _literal(b"b")])
+
+    assert search.find_all(b"aba-a", max_counts) == expected_result
+
+
+def test_find_all__max_counts_reached__scan_stopped(mocker):
+    search = MultiPatternSearch([_literal(b"a"), _literal(b"b")])
+    pattern_for = search._pattern_for
+    found: list[re.Match[bytes]] = []
+
+    def counted_pattern_for(indexes):
+        pattern, pattern_indexes = pattern_for(indexes)
+
+        def finditer(data: bytes, pos: int = 0) -> Iterator[re.Match[bytes]]:
+            for match in pattern.finditer(data, pos):
+                assert len(found) < 2, "scan continued after every maximum was reached"
+                found.append(match)
+                yield match
+
+        return mocker.Mock(finditer=finditer), pattern_indexes
+
+    mocker.patch.object(search, "_pattern_for", counted_pattern_for)
+
+    assert search.find_all(b"ab" * 10, [1, 1]) == [Match(0, 1, 0), Match(1, 2, 1)]
+
+
+@pytest.mark.parametrize(
+    ["patterns", "max_counts", "expected_result"],
+    [
+        ([b"ab", b"bc"], [1, None], [Match(0, 2, 0), Match(4, 6, 1)]),
+        ([b"ab", b"bc"], [2, None], [Match(0, 2, 0), Match(3, 5, 0)]),
+        ([b"bc", b"ab"], [None, 1], [Match(0, 2, 1), Match(4, 6, 0)]),
+        ([b"ab", b"ab", b"b"], [1, 1, None], [Match(0, 2, 0), Match(3, 5, 1)]),
+    ],
+)
+def test_find_all__max_count_reached__overlapping_occurrences_of_others_found(
+    patterns: list[bytes],
+    max_counts: list[Optional[int]],
+    expected_result: list[Match],
+):
+    search = MultiPatternSearch([_literal(pattern) for pattern in patterns])
+
+    assert search.find_all(b"ab-abc", max_counts) == expected_result
@@ -0,0 +1,194 @@
+import difflib
+import io
+from pathlib import Path
+
+import pytest
+
+from hyper_bump_it._hyper_bump_it import streaming
+
+SOME_FILE_NAME = "foo.txt"
+SOME_SEARCH_DATA = b"1.2.3"
+SOME_REPLACE_DATA = b"4.5.6"
+
+
+def _lines(count: int, version_lines: set[int]) -> bytes:
+    return b"".join(
+        b"version = 1.2.3\n" if index in version_lines else b"line %d\n" % index
+        for index in range(count)
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 7, 1024])
+def test_scan__occurrences_across_chunks__all_found(tmp_path: Path, chunk_size: int):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"a1.2.3b1.2.31.2.3\r\nc1.2.")
+
+    result = streaming.scan(some_file, SOME_SEARCH_DATA, chunk_size)
+
+    assert result == [(1, 6), (7, 12), (12, 17)]
+
+
+def test_scan__not_found__no_spans(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"abc")
+
+    assert streaming.scan(some_file, SOME_SEARCH_DATA) == []
+
+
+def test_scan__multi_byte_character_across_chunks__no_error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes("é€1.2.3".encode())
+
+    result = streaming.scan(some_file, SOME_SEARCH_DATA, chunk_size=1)
+
+    assert result == [(5, 10)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_scan__bounds__only_bounds_searched(tmp_path: Path, chunk_size: int):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"\xff1.2.3\n1.2.3-1.2.3-1.2.3\xff")
+
+    result = streaming.scan(some_file, SOME_SEARCH_DATA, chunk_size, bounds=(6, 21))
+
+    assert result == [(7, 12), (13, 18)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8])
+def test_scan__max_count__rest_of_file_not_scanned(tmp_path: Path, chunk_size: int):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"a1.2.3\nb1.2.3c1.2.3\xff")
+
+    result = streaming.scan(some_file, SOME_SEARCH_DATA, chunk_size, max_count=2)
+
+    assert result == [(1, 6), (8, 13)]
+
+
+def test_scan__not_utf8__error(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(b"1.2.3\xff")
+
+    with pytest.raises(UnicodeDecodeError):
+        streaming.scan(some_file, SOME_SEARCH_DATA)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_replace_spans__replacement_at_each_span(chunk_size: int):
+    source = io.BytesIO(b"a1.2.3b1.2.3c")
+    sink = io.BytesIO()
+
+    streaming.replace_spans(
+        source, sink, [(1, 6), (7, 12)], b"10.0.0", chunk_size=chunk_size
+    )
+
+    assert sink.getvalue() == b"a10.0.0b10.0.0c"
+
+
+@pytest.mark.parametrize(
+    ["data", "replace_data"],
+    [
+        (_lines(20, {0}), SOME_REPLACE_DATA),
+        (_lines(20, {19}), SOME_REPLACE_DATA),
+        (_lines(40, {5, 11}), SOME_REPLACE_DATA),
+        (_lines(40, {5, 12, 13}), SOME_REPLACE_DATA),
+        (_lines(40, {5, 20}), b"4.5\n.6"),
+        (_lines(40, {5, 20}), b""),
+        (_lines(10, {3}).replace(b"1.2.3\n", b"1.2.3"), SOME_REPLACE_DATA),
+        (b"1.2.3", b"a\nb\n"),
+        (b"a\r\n1.2.3\r\nb\r\n", SOME_REPLACE_DATA),
+    ],
+)
+def test_unified_diff__same_as_difflib(
+    tmp_path: Path, data: bytes, replace_data: bytes
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(data)
+    spans = streaming.scan(some_file, SOME_SEARCH_DATA)
+    new_data = data.replace(SOME_SEARCH_DATA, replace_data)
+
+    result = streaming.unified_diff(some_file, SOME_FILE_NAME, spans, replace_data)
+
+    assert result == "".join(
+        difflib.unified_diff(
+            data.decode().splitlines(keepends=True),
+            new_data.decode().splitlines(keepends=True),
+            fromfile=SOME_FILE_NAME,
+            tofile=SOME_FILE_NAME,
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ["data", "search_data", "replace_data"],
+    [
+        # the span crosses the line boundary
+        (b"a\nb\nv 1.2\n3 c\nd\ne\n", b"1.2\n3", b"4"),
+        (b"a\nb\nv 1.2\n3 c\nd\ne\n", b"1.2\n3", b"4\n5"),
+        # the line break is replaced, so the new line continues with the next line
+        (b"a\nb\nv 1.2.3\nc\nd\ne\n", b"3\n", b"4"),
+        (b"a\nv 1.2.3\nv 1.2.3\nb\n", b"3\n", b"4"),
+        (b"a\nb\nv 1.2.3\nc\nd\ne\n", b"3\n", b"4\n"),
+        (b"a\nb\nc\nd\n", b"b\n", b""),
+        # the last line does not have a line break
+        (b"a\nb\nv 1.2.3\nc", b"3\n", b"4"),
+        (b"a\nb\nv 1.2.3", b"1.2.3", b"4\n"),
+        (b"a\nb\nc\nd\nv 1.2.3", b"1.2.3", b"4"),
+        (b"a\nv 1.2.3\nb\nc\nd", b"1.2.3", b"4"),
+        # lines that are the same after the replacement are only context
+        (b"a\n1\nb\n1\n", b"1", b"1"),
+        (_lines(40, {5, 20}), SOME_SEARCH_DATA, SOME_SEARCH_DATA),
+        (b"a\nb\nx v\n1.2\n3 c\nd\n", b"v\n1.2\n3", b"v\n1.2\n4"),
+        (b"a\nb 1\n2 c\nd\n", b"1\n2", b"3\n2"),
+        (
+            b"a\nb 1\n2\n2\n2\n2\n2\n2\n2\n2 c\nd\n",
+            b"1\n2\n2\n2\n2\n2\n2\n2\n2",
+            b"3\n2\n2\n2\n2\n2\n2\n2\n2",
+        ),
+        (b"a\nb 1\n2 c\nd 1\n2 e\n", b"1\n2", b"1\n3"),
+    ],
+)
+def test_unified_diff__line_break_in_span__same_as_difflib(
+    tmp_path: Path, data: bytes, search_data: bytes, replace_data: bytes
+):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(data)
+    spans = streaming.scan(some_file, search_data)
+    new_data = data.replace(search_data, replace_data)
+
+    result = streaming.unified_diff(some_file, SOME_FILE_NAME, spans, replace_data)
+
+    assert result == "".join(
+        difflib.unified_diff(
+            data.decode().splitlines(keepends=True),
+            new_data.decode().splitlines(keepends=True),
+            fromfile=SOME_FILE_NAME,
+            tofile=SOME_FILE_NAME,
+        )
+    )
+
+
+def test_unified_diff__last_hunk_complete__rest_of_file_not_read(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    data = _lines(20, {2})
+    some_file.write_bytes(data + b"\xff")
+    spans = streaming.scan(some_file, SOME_SEARCH_DATA, chunk_size=16, max_count=1)
+
+    result = streaming.unified_diff(some_file, SOME_FILE_NAME, spans, SOME_REPLACE_DATA)
+
+    assert result == "".join(
+        difflib.unified_diff(
+            data.decode().splitlines(keepends=True),
+            data.replace(SOME_SEARCH_DATA, SOME_REPLACE_DATA)
+            .decode()
+            .splitlines(keepends=True),
+            fromfile=SOME_FILE_NAME,
+            tofile=SOME_FILE_NAME,
+        )
+    )
+
+
+def test_unified_diff__no_spans__empty(tmp_path: Path):
+    some_file = tmp_path / SOME_FILE_NAME
+    some_file.write_bytes(_lines(5, set()))
+
+    assert streaming.unified_diff(some_file, SOME_FILE_NAME, [], b"") == ""
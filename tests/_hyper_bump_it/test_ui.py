@@ -2,6 +2,8 @@ from enum import Enum
 from io import StringIO
 
 import pytest
+from rich.console import Console
+from rich.text import Text
 
 from hyper_bump_it._hyper_bump_it import ui
 from tests._hyper_bump_it import sample_data as sd
@@ -155,3 +157,137 @@ def test_list_options__text_require_escape__values_escaped(capture_rich: StringI
         f"{Options.Foo.value} - {sd.SOME_ESCAPE_REQUIRED_TEXT}\n"
         f"{Options.Bar.value} - {sd.SOME_ESCAPE_REQUIRED_TEXT} (default)\n\n"
     )
+
+
+def test_display_diff__default__displayed_without_lexing(
+    capture_rich: StringIO, mocker
+):
+    syntax = mocker.patch.object(ui, "Syntax")
+
+    ui.display_diff(sd.SOME_DIFF_KEYSTONE)
+
+    assert capture_rich.getvalue() == f"{sd.SOME_DIFF_KEYSTONE}\n"
+    syntax.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ["line", "expected_style"],
+    [
+        ("--- foo.txt", "emphasis"),
+        ("+++ foo.txt", "emphasis"),
+        ("@@ -1 +1 @@", "patch.hunk"),
+        ("-old", "patch.old"),
+        ("+new", "patch.new"),
+    ],
+)
+def test_display_diff__default__line_styled_by_prefix(
+    line: str, expected_style: str, mocker
+):
+    captured_text = StringIO()
+    console = Console(
+        file=captured_text,
+        theme=ui._DISPLAY_THEME,
+        highlight=False,
+        force_terminal=True,
+        color_system="standard",
+    )
+    mocker.patch.object(ui, "_CONSOLE", console)
+
+    ui.display_diff(f" context\n{line}\n")
+
+    with console.capture() as capture:
+        console.print(line, style=expected_style, end="")
+    assert capture.get() in captured_text.getvalue()
+
+
+@pytest.mark.parametrize(
+    ["line", "expected_style"],
+    [
+        ("----1.2.3--", "patch.old"),
+        ("+++4.5.6++", "patch.new"),
+    ],
+)
+def test_display_diff__default__hunk_line_like_header_styled_by_prefix(
+    line: str, expected_style: str, mocker
+):
+    captured_text = StringIO()
+    console = Console(
+        file=captured_text,
+        theme=ui._DISPLAY_THEME,
+        highlight=False,
+        force_terminal=True,
+        color_system="standard",
+    )
+    mocker.patch.object(ui, "_CONSOLE", console)
+
+    ui.display_diff(f"--- foo.txt\n+++ foo.txt\n@@ -1 +1 @@\n{line}\n")
+
+    with console.capture() as capture:
+        console.print(line, style=expected_style, end="")
+    assert capture.get() in captured_text.getvalue()
+
+
+def test_display_diff__highlight__syntax_highlighted(capture_rich: StringIO, mocker):
+    syntax = mocker.spy(ui, "Syntax")
+
+    ui.display_diff(sd.SOME_DIFF_KEYSTONE, highlight=True)
+
+    assert capture_rich.getvalue() == f"{sd.SOME_DIFF_KEYSTONE}\n"
+    syntax.assert_called_once()
+
+
+def test_plain_output__enabled__markup_and_styles_not_displayed(
+    capture_rich: StringIO,
+):
+    with ui.plain_output(enabled=True):
+        ui.display("[bold]Execution Plan[/]:")
+        ui.display(Text("foo.txt", style="file.path"))
+        ui.blank_line()
+        ui.rule(Text("foo.txt", style="file.path"))
+        ui.display_diff(sd.SOME_DIFF_KEYSTONE, highlight=True)
+
+    assert capture_rich.getvalue() == (
+        "Execution Plan:\nfoo.txt\n\n=== foo.txt ===\n" f"{sd.SOME_DIFF_KEYSTONE}\n"
+    )
+
+
+def test_plain_output__long_line__not_wrapped(mocker):
+    captured_text = StringIO()
+    mocker.patch.object(ui, "_CONSOLE", Console(file=captured_text, width=10))
+    long_line = "x" * 100
+
+    with ui.plain_output(enabled=True):
+        ui.display(Text(long_line))
+
+    assert captured_text.getvalue() == f"{long_line}\n"
+
+
+def test_plain_output__context_exited__original_output_restored(
+    capture_rich: StringIO,
+):
+    with ui.plain_output(enabled=True):
+        pass
+
+    ui.rule(Text("foo.txt"))
+
+    assert "─── foo.txt ───" in capture_rich.getvalue()
+
+
+@pytest.mark.parametrize(
+    ["force_terminal", "expected_plain"],
+    [(False, True), (True, False)],
+)
+def test_plain_output__not_given__plain_when_not_terminal(
+    force_terminal: bool, expected_plain: bool, mocker
+):
+    captured_text = StringIO()
+    mocker.patch.object(
+        ui,
+        "_CONSOLE",
+        Console(file=captured_text, width=40, force_terminal=force_terminal),
+    )
+
+    with ui.plain_output():
+        ui.rule(Text("foo.txt"))
+
+    assert ("=== foo.txt ===" in captured_text.getvalue()) == expected_plain
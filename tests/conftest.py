@@ -1,4 +1,5 @@
 from io import StringIO
+from pathlib import Path
 from typing import Final, Literal
 
 import pytest
@@ -7,6 +8,7 @@ from rich.console import Console
 from typer import rich_utils as typer_rich_utils
 
 from hyper_bump_it._hyper_bump_it import ui
+from hyper_bump_it._hyper_bump_it.discovery import cache
 
 # rich's line wrapping makes test cases that check output text tricky. By making the width very large, wrapping can be
 # avoided. rich does check for a COLUMNS environment variable, but pytest also utilizes that variable, so using that
@@ -32,6 +34,14 @@ def wide_terminal(mocker) -> None:
     mocker.patch.object(typer_rich_utils, "FORCE_TERMINAL", False)
 
 
+@pytest.fixture(autouse=True)
+def user_cache_dir(mocker, tmp_path_factory) -> Path:
+    # Avoid storing discovery results in the cache directory of the user running the tests.
+    cache_dir = tmp_path_factory.mktemp("user_cache")
+    mocker.patch.object(cache, "user_cache_dir", return_value=cache_dir)
+    return cache_dir
+
+
 class ForceInput:
     NO_INPUT: Final[Literal[""]] = ""
 